@@ -15,6 +15,8 @@ Commands:
         If time mode is set to anything other than 'Fixed', base station coordinates are ignored
         NTRIP server expects RTCM3.3 messages on serial port and transmits them
             over TCP/IP to an NTRIP Caster specified in configuration file.
+        RTCM frames are CRC-checked by rtcm_proxy, which expects 'crcmod' package
+            with its C extension to be installed (see setup.sh)
     • stop
         Interrupts background NTRIP server process and exits
     • state
@@ -23,10 +25,10 @@ Commands:
 """
 import errno
 import sys
-from os import mkfifo, pipe2, O_NONBLOCK
+from os import mkfifo
 from enum import Enum, Flag
 from functools import reduce
-from itertools import chain, repeat
+from hashlib import sha1
 from collections import defaultdict as dd
 from operator import or_ as bitwise_or
 from typing import Tuple, Dict, Iterable
@@ -34,7 +36,7 @@ from typing import Tuple, Dict, Iterable
 import toml
 from pathlib import Path
 from subprocess import run, Popen, DEVNULL, STDOUT
-from time import strftime
+from time import perf_counter, strftime
 
 
 # TODO: migrate to logging and make use of config['tracelevel']
@@ -48,7 +50,9 @@ PROJECT = Path('/home/pi/app')
 CONFIG_FILE = PROJECT/'config.toml'
 STR2STR = PROJECT/'str2str-demo5'
 STR2STR_LOG = PROJECT/'logs'/f'{STR2STR.stem}.log'
-UBXTOOL = PROJECT/'ubxtool.py'
+UBX_TIMEOUT = 1.0  # seconds to wait for receiver ACK
+# Hash of receiver configuration applied last - on tmpfs, as RAM level is lost on power cycle along with it
+UBX_SPEC_HASH = Path('/run/user/bs/ubx_spec.sha1')
 RTCM_PROXY = PROJECT/'rtcm_proxy.py'
 RTCM_PROXY_LOG = PROJECT/'logs'/f'{RTCM_PROXY.stem}.log'
 PID_FILE = Path('/run/user/bs/ntrips.pid')
@@ -56,7 +60,7 @@ SERVER_PID_FILE = Path('/run/user/bs/django.pid')
 
 ACCUMULATIVE_LOGS = True
 
-str2str_process = None
+server_process = None
 
 help_message = f"""
 Minimal viable base station v{__version__}
@@ -95,6 +99,10 @@ class MLevel(FlagEnum):
     ALL   = 0b111
 
 
+# VALGET layer numbers of memory levels
+VALGET_LAYERS = {MLevel.RAM: 0, MLevel.BBR: 1, MLevel.FLASH: 2}
+
+
 def die(returncode=0):
     print(f"Exiting script ({returncode})")
     sys.exit(returncode)
@@ -113,42 +121,43 @@ def start_server(serial_config: dict, server_config: dict, caster_config: dict,
     out_spec = ':{password}@{domain}:{port}/{mountpoint}:{str}'.format(**caster_config)
     inject = server_config['inject']
 
-    if inject:
+    if ACCUMULATIVE_LOGS:
+        timestamp = '_' + strftime('%d-%m-%Y_%H-%M-%S')
+    else:
+        timestamp = ''
+
+    msgfilter = server_config.get('filter', {})
+
+    if inject or msgfilter:
         if isinstance(inject, int):
             inject = (str(inject),)
         else:
-            inject = tuple(str(msgid) for msgid in server_config['inject'])
-
-        pipe_output, pipe_input = pipe2(O_NONBLOCK)
-        verbose = ('-t', str(verbose)) if verbose is not False else ()
-        str2str = f'{STR2STR}', '-out', f'ntrips://{out_spec}', *verbose
-        str2str_input = pipe_output
-        rtcm_proxy = 'python', f'{RTCM_PROXY}', '-in', f'serial://{in_spec}', '-a', f'{server_config["anchor"]}', \
-                     '-m', *inject, '-i', f'{server_config["interval"]}', '-l', str(RTCM_PROXY_LOG)
-
-        print("Starting RTCM proxy...")
-        print(f"Command: {' '.join(rtcm_proxy)}")
-
-        Popen(rtcm_proxy, encoding='utf-8', stdout=pipe_input)
+            inject = tuple(str(msgid) for msgid in inject)
+        inject = ('-m', *inject) if inject else ()
+        msgfilter = ('-f', *(f'{msg}:{interval}' for msg, interval in msgfilter.items())) if msgfilter else ()
+        budget = ('-b', str(server_config['budget'])) if server_config.get('budget') else ()
+
+        # RTCM proxy pushes data to NTRIP caster itself - no need to pipe it through str2str
+        server = 'python', f'{RTCM_PROXY}', '-in', f'serial://{in_spec}', '-out', f'ntrips://{out_spec}', \
+                 '-a', f'{server_config["anchor"]}', *inject, '-i', f'{server_config["interval"]}', \
+                 *budget, *msgfilter, '-c', str(CONFIG_FILE), '-l', str(RTCM_PROXY_LOG)
+        log_file = RTCM_PROXY_LOG.with_name(RTCM_PROXY_LOG.stem + '_ntrips' + timestamp + RTCM_PROXY_LOG.suffix)
+        print("Starting NTRIP server (RTCM proxy)...")
 
     else:
-        str2str = f'{STR2STR}', '-in', f'serial://{in_spec}', '-out', f'ntrips://{out_spec}'
-        str2str_input = DEVNULL
+        verbose = ('-t', str(verbose)) if verbose is not False else ()
+        server = f'{STR2STR}', '-in', f'serial://{in_spec}', '-out', f'ntrips://{out_spec}', *verbose
+        log_file = STR2STR_LOG.with_name(STR2STR_LOG.stem + timestamp + STR2STR_LOG.suffix)
+        print("Starting NTRIP server...")
 
-    print("Starting NTRIP server...")
-    print(f"Command: {' '.join(str2str)}")
+    print(f"Command: {' '.join(server)}")
 
-    global str2str_process
+    global server_process
     PID_FILE.touch()
 
-    if ACCUMULATIVE_LOGS:
-        log_file = STR2STR_LOG.with_name(STR2STR_LOG.stem + '_' + strftime('%d-%m-%Y_%H-%M-%S') + STR2STR_LOG.suffix)
-    else:
-        log_file = STR2STR_LOG
-
-    str2str_process = Popen(str2str, encoding='utf-8', stdin=str2str_input,
-                            stdout=log_file.open('w'), stderr=STDOUT)
-    PID_FILE.write_text(str(str2str_process.pid))
+    server_process = Popen(server, encoding='utf-8', stdin=DEVNULL,
+                           stdout=log_file.open('w'), stderr=STDOUT)
+    PID_FILE.write_text(str(server_process.pid))
 
     print("NTRIP server process spawned")
 
@@ -174,19 +183,18 @@ def stop_server(pid_file, name) -> int:
 
 
 def cleanup_server():
-    global str2str_process
-    if str2str_process and str2str_process.poll() is None:
-        print("Terminating 'str2str' process...")
-        str2str_process.terminate()
-        # Wait str2str to terminate - 3s should be by far enough
-        str2str_process.wait(3)
-        if str2str_process.poll() is None:
-            str2str_process.kill()
+    if server_process and server_process.poll() is None:
+        print("Terminating NTRIP server process...")
+        server_process.terminate()
+        # Wait server to terminate - 3s should be by far enough
+        server_process.wait(3)
+        if server_process.poll() is None:
+            server_process.kill()
     try:
         PID_FILE.unlink()
     except Exception:
         pass
-    return str2str_process.returncode if str2str_process else 0
+    return server_process.returncode if server_process else 0
 
 
 def wgs84_to_ublox(value: float, valtype: str) -> Tuple[int, int]:
@@ -202,26 +210,59 @@ def wgs84_to_ublox(value: float, valtype: str) -> Tuple[int, int]:
     return coord, coord_hp
 
 
-def ubx_valset(spec: Dict[str, int], *, baudrate: int, memlevel: int) -> int:
-    valset = [
-        'python', f'{UBXTOOL}',
-        '-f', '/dev/serial0', '-s', str(baudrate),
-        '-w', '0.5', '-l', str(memlevel)
-    ]
-    spec_pairs = (f'{key},{int(value)}' for key, value in spec.items())
-    valset.extend(chain(*zip(repeat('-z'), spec_pairs)))
-
-    print("Command: " + ' '.join(valset))
+def ubx_reconcile(spec: Dict[str, int], *, port: str, baudrate: int, memlevel: int, force: bool = False) -> int:
+    """
+    Bring receiver configuration items to 'spec' values on every memory level of 'memlevel' mask:
+        read current values with VALGET (64 items per poll and level) and VALSET only items that differ,
+        all of them at once (in one transaction if there are more than 64)
+    Hash of the last spec applied is cached in UBX_SPEC_HASH file, so unchanged spec skips serial I/O
+        entirely - unless 'force' is set (receiver could have been reconfigured by other means)
+    The file is on tmpfs, so the first start after a reboot always compares against the receiver
+    Level that rejects VALGET (NAK) or misses some items is treated as differing from 'spec' entirely
+    """
+    spec = {key: int(value) for key, value in spec.items()}
+    digest = sha1(repr((sorted(spec.items()), memlevel)).encode()).hexdigest()
+    if not force and UBX_SPEC_HASH.exists() and UBX_SPEC_HASH.read_text().strip() == digest:
+        print("Receiver configuration is up to date (same as applied last time)")
+        return 0
+
+    # Imported here, so that only receiver configuration requires GPSD modules (ubxtool dependency)
+    try:
+        import ubxtool
+    except SystemExit as error:
+        return error.code
 
-    ubxtool_process = run(valset, text=True, capture_output=True)
-    # Proxying stdout as stdout handle inheritance induces race condition and output misalignment
-    print('\n' + ubxtool_process.stdout.strip('\n') + '\n')
-    print(f"ubxtool: exitcode {ubxtool_process.returncode}", end='\n')
+    try:
+        with ubxtool.ubx_session(port, baudrate, timeout=UBX_TIMEOUT) as session:
+            start = perf_counter()
+            diff = {}
+            for level, layer in VALGET_LAYERS.items():
+                if not memlevel & level.value:
+                    continue
+                # None on NAK (e.g. BBR or Flash of a receiver that lacks them) - then just set all items
+                current = session.valget(spec, layer=layer) or {}
+                diff.update((key, value) for key, value in spec.items() if current.get(key) != value)
+
+            if diff:
+                print(f"Items differing on {port} (memory levels mask {memlevel}):",
+                      *(f"    {key} = {value}" for key, value in diff.items()), sep='\n')
+                if not session.valset(diff.items(), layer=memlevel):
+                    return 1
+            elapsed = perf_counter() - start
+    except SystemExit as error:
+        # ubxtool exits when the port can not be opened
+        return error.code
 
-    return ubxtool_process.returncode
+    try:
+        UBX_SPEC_HASH.write_text(digest)
+    except OSError as e:
+        # Only costs a VALGET comparison on the next start
+        print(f"Failed to cache receiver configuration hash: {e}")
+    print(f"ubxtool: {len(diff)} of {len(spec)} items set in {elapsed * 1000:.0f} ms")
+    return 0
 
 
-def config_ublox(params: dict, serial_params: dict) -> int:
+def config_ublox(params: dict, serial_params: dict, force: bool = False) -> int:
     print("Configuring uBlox receiver...")
 
     tmode = params['mode']
@@ -275,7 +316,8 @@ def config_ublox(params: dict, serial_params: dict) -> int:
         raise ValueError("Invalid memory levels specification in config.toml")
 
     print(f"Save config to memory levels: {', '.join(level.flags)}")
-    return ubx_valset(spec, baudrate=serial_params['baudrate'], memlevel=level.value)
+    return ubx_reconcile(spec, port=f"/dev/{serial_params['port']}", baudrate=serial_params['baudrate'],
+                         memlevel=level.value, force=force)
 
 
 if __name__ == '__main__':
@@ -333,7 +375,7 @@ if __name__ == '__main__':
                 stop_server(PID_FILE, 'NTRIP server')
 
             if '-c' in sys.argv:
-                exitcode = config_ublox(config['BASE'], config['SERIAL'])
+                exitcode = config_ublox(config['BASE'], config['SERIAL'], force=True)
                 if exitcode != 0:
                     print("Receiver configuration was not completed, restart failed")
                     die(exitcode)
@@ -346,8 +388,9 @@ if __name__ == '__main__':
 
         elif command == 'state':
             if PID_FILE.exists():
-                if run(f'ps -C {STR2STR.name}', shell=True, stdout=DEVNULL, stderr=DEVNULL).returncode != 0:
-                    print("'str2str' process has terminated unexpectedly")
+                pid = PID_FILE.read_text().strip()
+                if run(f'ps -p {pid}', shell=True, stdout=DEVNULL, stderr=DEVNULL).returncode != 0:
+                    print("NTRIP server process has terminated unexpectedly")
                     PID_FILE.unlink()
                     state = "killed"
                 else:
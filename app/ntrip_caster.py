@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+"""
+Local NTRIP caster
+
+Serves RTCM stream to rovers within base station LAN directly,
+    without round trip through a remote caster.
+Runs asyncio event loop in a background thread and is fed by rtcm_proxy frame loop
+    through write() / flush() / close() file-like interface, so it can be used as its output stream.
+Every rover has its own bounded send queue - the same data object is shared between all queues,
+    no per-client copies are made. Rovers that do not keep up (queue overflows) are disconnected,
+    so slow clients never block serial reader or other rovers.
+Both NTRIP v1 (ICY) and NTRIP v2 (chunked HTTP) rovers are supported.
+TcpServer is the same broadcaster serving raw stream to plain TCP clients.
+"""
+
+import asyncio
+import re
+import sys
+from base64 import b64encode
+from threading import Thread
+from typing import Optional, Set
+
+
+class Rover:
+    """Connected rover client"""
+
+    __slots__ = 'writer', 'queue', 'version', 'peer', 'task'
+
+    def __init__(self, writer: asyncio.StreamWriter, version: int, queue_size: int):
+        self.writer = writer
+        self.version = version
+        self.queue = asyncio.Queue(queue_size)
+        self.peer = '{}:{}'.format(*writer.get_extra_info('peername')[:2])
+        self.task = asyncio.current_task()
+
+    def drop(self):
+        self.writer.transport.abort()
+        self.task.cancel()
+
+
+class NtripCaster:
+    """
+    Single-mountpoint NTRIP caster
+
+    If 'password' is specified, rovers are required to provide basic authorization credentials.
+    'queue_size' is the number of pending data blocks (epochs) per rover before it is dropped.
+    """
+
+    AGENT = 'NTRIP RTCMProxy/1.0'
+    REQUEST_TIMEOUT = 10
+
+    spec_regex = re.compile(r'(?:(?P<user>[^:@]*):(?P<password>[^@]*)@)?(?P<host>[^:/]*)(?::(?P<port>\d+))?'
+                            r'/(?P<mountpoint>[^:/]+)')
+
+    def __init__(self, host: str = '', port: int = 2101, mountpoint: str = 'BASE',
+                 user: str = '', password: str = '', queue_size: int = 16):
+        self.address = host or None, port
+        self.mountpoint = mountpoint
+        self.credentials = b64encode(f'{user}:{password}'.encode()).decode() if password else None
+        self.queue_size = queue_size
+        self.rovers: Set[Rover] = set()
+        self.clients: Set[asyncio.Task] = set()  # connection handlers, including handshakes in progress
+        self.dropped = 0  # number of rovers disconnected for not keeping up
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.thread: Optional[Thread] = None
+
+    @classmethod
+    def from_spec(cls, spec: str, **kwargs):
+        """Create from '[user:password@][host][:port]/mountpoint' spec"""
+        match = cls.spec_regex.fullmatch(spec)
+        if not match:
+            raise ValueError(f"invalid NTRIP caster spec '{spec}'")
+        config = match.groupdict(default='')
+        config['port'] = int(config['port'] or 2101)
+        return cls(**config, **kwargs)
+
+    @property
+    def stats(self) -> str:
+        return f"{len(self.rovers)} rovers connected, {self.dropped} dropped"
+
+    def sourcetable(self) -> bytes:
+        auth = 'B' if self.credentials else 'N'
+        table = (f'STR;{self.mountpoint};{self.mountpoint};RTCM 3.3;;2;GPS+GLO+GAL+BDS;;;0.00;0.00;0;0;'
+                 f'{self.AGENT};none;{auth};N;0;\r\nENDSOURCETABLE\r\n').encode()
+        header = (f'SOURCETABLE 200 OK\r\nServer: {self.AGENT}\r\nContent-Type: text/plain\r\n'
+                  f'Content-Length: {len(table)}\r\n\r\n').encode()
+        return header + table
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._handle, *self.address)
+
+    async def _handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[int]:
+        """Process rover request, return NTRIP version to stream data with or None to reject rover"""
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.REQUEST_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+            return None
+
+        lines = request.decode(errors='replace').split('\r\n')
+        method, path, *_ = lines[0].split(' ') + ['', '']
+        headers = dict(line.split(': ', maxsplit=1) for line in lines[1:] if ': ' in line)
+        version = 2 if headers.get('Ntrip-Version', '').startswith('Ntrip/2') else 1
+
+        if method != 'GET' or path.lstrip('/') != self.mountpoint:
+            writer.write(self.sourcetable())
+            return None
+
+        if self.credentials and headers.get('Authorization') != f'Basic {self.credentials}':
+            writer.write(b'HTTP/1.1 401 Unauthorized\r\n\r\n' if version == 2 else b'ERROR - Bad Password\r\n')
+            return None
+
+        if version == 2:
+            writer.write(f'HTTP/1.1 200 OK\r\nNtrip-Version: Ntrip/2.0\r\nServer: {self.AGENT}\r\n'
+                         f'Content-Type: gnss/data\r\nTransfer-Encoding: chunked\r\n\r\n'.encode())
+        else:
+            writer.write(b'ICY 200 OK\r\n\r\n')
+        return version
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.clients.add(task)
+        try:
+            version = await self._handshake(reader, writer)
+            if version is None:
+                return
+
+            rover = Rover(writer, version, self.queue_size)
+            self.rovers.add(rover)
+            try:
+                while True:
+                    writer.write(await rover.queue.get())
+                    await writer.drain()
+            finally:
+                self.rovers.discard(rover)
+        except (OSError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients.discard(task)
+            writer.close()
+
+    def broadcast(self, data: bytes):
+        """Enqueue data for every rover, disconnect rovers whose queue is full (must be called within loop)"""
+        chunk = None
+        for rover in tuple(self.rovers):
+            if rover.version == 2:
+                if chunk is None:
+                    chunk = b'%X\r\n%b\r\n' % (len(data), data)
+                item = chunk
+            else:
+                item = data
+            try:
+                rover.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                print(f"{self.__class__.__name__}: client {rover.peer} is too slow - disconnecting", file=sys.stderr, flush=True)
+                self.rovers.discard(rover)
+                self.dropped += 1
+                rover.drop()
+
+    async def stop(self):
+        if self.server:
+            # Stop accepting new connections
+            self.server.close()
+        # Connections are dropped first: since Python 3.12 wait_closed() waits for all of them to close
+        clients = tuple(self.clients)
+        for rover in tuple(self.rovers):
+            rover.drop()
+        for task in clients:
+            task.cancel()
+        await asyncio.gather(*clients, return_exceptions=True)
+        if self.server:
+            await self.server.wait_closed()
+
+    # File-like interface for use in synchronous code (runs event loop in a background thread)
+
+    def run_in_thread(self):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.start())
+        self.thread = Thread(target=loop.run_forever, name='NTRIP caster', daemon=True)
+        self.thread.start()
+        return self
+
+    def write(self, data) -> int:
+        # Makes a copy only if data is mutable - rover queues share this bytes object
+        self.loop.call_soon_threadsafe(self.broadcast, bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+        self.loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TcpServer(NtripCaster):
+    """Raw TCP server - streams data to every connected client right away, with no NTRIP handshake"""
+
+    spec_regex = re.compile(r'(?P<host>[^:/]*):(?P<port>\d+)')
+
+    def __init__(self, host: str = '', port: int = 2101, queue_size: int = 16):
+        super().__init__(host, port, mountpoint='', queue_size=queue_size)
+
+    @classmethod
+    def from_spec(cls, spec: str, **kwargs):
+        """Create from '[host]:port' spec"""
+        match = cls.spec_regex.fullmatch(spec)
+        if not match:
+            raise ValueError(f"invalid TCP server spec '{spec}'")
+        return cls(match['host'], int(match['port']), **kwargs)
+
+    async def _handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[int]:
+        return 1
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""
+Local NTRIP caster benchmark
+
+Starts NtripCaster in this process and connects N stand-in rovers from a separate process,
+    then pushes synthetic RTCM epochs as fast as caster accepts them
+    and measures CPU time the caster process spends per epoch.
+Result is projected to the number of rovers one core can feed at 1 Hz.
+
+Stand-in rover alone could be used against any caster (local or remote) for manual testing:
+    ntrip_caster_bench.py rover HOST PORT MOUNTPOINT [-n COUNT] [-2]
+"""
+
+import asyncio
+import sys
+from argparse import ArgumentParser
+from base64 import b64encode
+from multiprocessing import Process, Event
+from random import Random
+from time import perf_counter, process_time, sleep
+
+from ntrip_caster import NtripCaster
+from rtcm_proxy_bench import make_frame, random_bytes
+
+
+async def rover(host: str, port: int, mountpoint: str, *, version: int = 1, credentials: str = '',
+                verbose: bool = False) -> int:
+    """Stand-in rover: request mountpoint and consume the stream until it is closed, return bytes received"""
+    reader, writer = await asyncio.open_connection(host, port)
+    headers = [f'GET /{mountpoint} HTTP/1.{version - 1}', f'Host: {host}', 'User-Agent: NTRIP TestRover/1.0']
+    if version == 2:
+        headers.append('Ntrip-Version: Ntrip/2.0')
+    if credentials:
+        headers.append(f'Authorization: Basic {b64encode(credentials.encode()).decode()}')
+    writer.write('\r\n'.join((*headers, '', '')).encode())
+
+    response = await reader.readuntil(b'\r\n')
+    if verbose:
+        print(f"Rover: {response.decode().strip()}")
+    received = 0
+    while True:
+        data = await reader.read(64 * 1024)
+        if not data:
+            break
+        received += len(data)
+        if verbose:
+            print(f"Rover: received {len(data)} bytes ({received} total)")
+    writer.close()
+    return received
+
+
+def run_rovers(port: int, mountpoint: str, count: int, ready: Event):
+    async def main():
+        tasks = [asyncio.ensure_future(rover('127.0.0.1', port, mountpoint, version=1 + i % 2))
+                 for i in range(count)]
+        await asyncio.sleep(0.5 + count / 500)
+        ready.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    asyncio.run(main())
+
+
+def make_epoch(rand: Random) -> bytes:
+    frames = [make_frame(1005, random_bytes(rand, 17))]
+    for msm in (1074, 1084, 1094, 1124):
+        frames.append(make_frame(msm, random_bytes(rand, rand.randint(80, 250))))
+    return b''.join(frames)
+
+
+def measure(count: int, epochs: int, port: int = 12101, mountpoint: str = 'BENCH') -> float:
+    caster = NtripCaster('127.0.0.1', port, mountpoint, queue_size=epochs + 1).run_in_thread()
+    ready = Event()
+    rovers = Process(target=run_rovers, args=(port, mountpoint, count, ready))
+    rovers.start()
+    ready.wait()
+
+    rand = Random(0)
+    data = [make_epoch(rand) for _ in range(100)]
+
+    start_cpu, start = process_time(), perf_counter()
+    for i in range(epochs):
+        caster.write(data[i % len(data)])
+    # Callbacks are run in FIFO order, so all broadcasts are done once this one completes
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), caster.loop).result()
+    # Wait for all queues to drain
+    while any(not rover.queue.empty() for rover in tuple(caster.rovers)):
+        sleep(0.01)
+    cpu, elapsed = process_time() - start_cpu, perf_counter() - start
+
+    connected = len(caster.rovers)
+    caster.close()
+    rovers.join()
+
+    per_epoch = cpu / epochs
+    print(f"{count:>5} rovers ({connected} connected): {epochs} epochs in {elapsed:.3f} s, "
+          f"{per_epoch * 1e3:.3f} ms CPU per epoch, "
+          f"~{count / per_epoch:.0f} rovers per core at 1 Hz" if connected else "no rovers connected")
+    return per_epoch
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['rover']:
+        parser = ArgumentParser(description='Stand-in NTRIP rover')
+        parser.add_argument('mode')
+        parser.add_argument('host')
+        parser.add_argument('port', type=int)
+        parser.add_argument('mountpoint')
+        parser.add_argument('-n', '--count', type=int, default=1, help="number of concurrent rovers")
+        parser.add_argument('-2', '--v2', action='store_const', const=2, default=1, dest='version',
+                            help="use NTRIP v2")
+        parser.add_argument('-u', '--user', default='', metavar='USER:PASSWORD', help="credentials")
+        args = parser.parse_args()
+
+        async def main():
+            return await asyncio.gather(*(rover(args.host, args.port, args.mountpoint, version=args.version,
+                                                credentials=args.user, verbose=args.count == 1)
+                                          for _ in range(args.count)))
+        print(f"Received: {asyncio.run(main())} bytes")
+        sys.exit(0)
+
+    parser = ArgumentParser(description='Local NTRIP caster benchmark')
+    parser.add_argument('-c', '--clients', type=int, nargs='+', default=[1, 10, 50, 100, 200],
+                        help="numbers of concurrent rovers to measure (default: %(default)s)")
+    parser.add_argument('-e', '--epochs', type=int, default=500,
+                        help="epochs to push on each run (default: %(default)s)")
+    args = parser.parse_args()
+
+    for count in args.clients:
+        measure(count, args.epochs)
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+"""
+Indexed RTCM3 capture archive
+
+Writer stores RTCM stream in rotating capture segments ('<prefix>_YYYYmmdd_HHMMSS.rtcm3')
+    with a sidecar index file ('.idx') next to each of them.
+Index is a flat array of fixed-size records, one per at least INDEX_INTERVAL frames:
+    • capture time (UNIX time, float64) - host wall-clock time when the span was written,
+        not GNSS epoch time of its frames (so it is off by serial and proxy latency)
+    • offset of the first frame of the span within segment (uint64)
+    • bitmap of message types present in the span (uint64, see TYPES)
+Reader memory-maps index and segment files, binary-searches the index for the start
+    of requested time window and streams frames from there, skipping spans that contain
+    none of the requested message types - without scanning captures from the start.
+Segment with empty index (writer died before the first span was indexed) is scanned linearly.
+
+Usage (replay time window to stdout):
+    rtcm_archive.py ARCHIVE_DIR -from 2021-03-01T10:00:00 -to 2021-03-01T10:05:00 [-m 1005 1074] > out.rtcm3
+"""
+
+import mmap
+import struct
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from time import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from rtcm3 import CRC_LEN, HEADER_LEN, PREAMB
+
+# Message types tracked in index bitmap, all others share the last bit
+TYPES = (
+    1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013,
+    1019, 1020, 1029, 1033, 1042, 1044, 1045, 1046, 1230,
+    1071, 1072, 1073, 1074, 1075, 1076, 1077,
+    1081, 1082, 1083, 1084, 1085, 1086, 1087,
+    1091, 1092, 1093, 1094, 1095, 1096, 1097,
+    1111, 1112, 1113, 1114, 1115, 1116, 1117,
+    1121, 1122, 1123, 1124, 1125, 1126, 1127,
+)
+OTHER = 63
+TYPE_BITS = {msg: 1 << i for i, msg in enumerate(TYPES)}
+
+RECORD = struct.Struct('<dQQ')
+TIME_FORMAT = '%Y%m%d_%H%M%S'
+
+
+def type_mask(msgs: Iterable[int]) -> int:
+    """Index bitmap matching any of specified message types"""
+    mask = 0
+    for msg in msgs:
+        mask |= TYPE_BITS.get(msg, 1 << OTHER)
+    return mask
+
+
+def segment_time(path: Path) -> float:
+    """Segment opening time from its file name"""
+    return datetime.strptime('_'.join(path.stem.rsplit('_', 2)[-2:]), TIME_FORMAT).timestamp()
+
+
+def iter_frames(data, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+    """Walk consecutive frames in captured data, yield (offset, size, message number)"""
+    end = len(data) if end is None else end
+    pos = start
+    while pos + HEADER_LEN < end:
+        size = HEADER_LEN + ((data[pos+1] & 0x03) << 8 | data[pos+2]) + CRC_LEN
+        if data[pos] != PREAMB[0] or pos + size > end:
+            return  # truncated tail of a segment that was not closed properly
+        msg = data[pos+3] << 4 | data[pos+4] >> 4 if size >= HEADER_LEN + 2 + CRC_LEN else 0
+        yield pos, size, msg
+        pos += size
+
+
+class CaptureWriter:
+    """
+    Archive output stream for rtcm_proxy
+
+    Expects whole frames in every write() (as EpochWriter provides).
+    Segment is rotated when it exceeds SEGMENT_SIZE bytes or SEGMENT_TIME seconds.
+    """
+
+    SEGMENT_SIZE = 64 * 1024 * 1024
+    SEGMENT_TIME = 3600
+    INDEX_INTERVAL = 16  # frames
+
+    def __init__(self, directory: Path, prefix: str = 'rtcm'):
+        if not directory.is_dir():
+            raise ValueError(f"archive directory {directory} does not exist")
+        self.directory = directory
+        self.prefix = prefix
+        self.data = self.index = None
+        self.opened = 0.0
+        self.span_start = self.span_time = None
+        self.span_frames = self.span_types = 0
+
+    def _rotate(self, now: float):
+        self.close()
+        name = f'{self.prefix}_{datetime.fromtimestamp(now).strftime(TIME_FORMAT)}'
+        self.data = (self.directory / f'{name}.rtcm3').open('ab')
+        self.index = (self.directory / f'{name}.idx').open('ab')
+        self.opened = now
+
+    def _commit_span(self):
+        if self.span_start is not None:
+            self.index.write(RECORD.pack(self.span_time, self.span_start, self.span_types))
+        self.span_start = None
+        self.span_frames = self.span_types = 0
+
+    def write(self, data) -> int:
+        now = time()
+        if self.data is None or self.data.tell() >= self.SEGMENT_SIZE or now - self.opened >= self.SEGMENT_TIME:
+            self._rotate(now)
+        if self.span_start is None:
+            self.span_start, self.span_time = self.data.tell(), now
+        for _, _, msg in iter_frames(data):
+            self.span_types |= TYPE_BITS.get(msg, 1 << OTHER)
+            self.span_frames += 1
+        self.data.write(data)
+        if self.span_frames >= self.INDEX_INTERVAL:
+            self._commit_span()
+        return len(data)
+
+    def flush(self):
+        if self.data is not None:
+            self.data.flush()
+            self.index.flush()
+
+    def close(self):
+        if self.data is None:
+            return
+        self._commit_span()
+        self.data.close()
+        self.index.close()
+        self.data = self.index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Segment:
+    """Memory-mapped capture segment with its index"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index = self._map(path.with_suffix('.idx'))
+        self.data = self._map(path)
+        self.count = len(self.index) // RECORD.size if self.index else 0
+
+    @staticmethod
+    def _map(path: Path) -> Optional[mmap.mmap]:
+        with path.open('rb') as file:
+            if path.stat().st_size == 0:
+                return None
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def record(self, i: int) -> Tuple[float, int, int]:
+        return RECORD.unpack_from(self.index, i * RECORD.size)
+
+    @property
+    def start_time(self) -> float:
+        return self.record(0)[0] if self.count else segment_time(self.path)
+
+    @property
+    def end_time(self) -> float:
+        return self.record(self.count - 1)[0] if self.count else self.start_time
+
+    def find(self, timestamp: float) -> int:
+        """Index of the last record starting not later than timestamp (binary search)"""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid)[0] <= timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return max(lo - 1, 0)
+
+    def spans(self, start: float) -> Iterator[Tuple[float, int, int, int]]:
+        """
+        Yield (capture time, offset, end offset, types bitmap) of index spans
+            starting from the one containing 'start'
+        Segment with empty index is a single span of any types captured at segment opening time
+        """
+        if not self.count:
+            yield segment_time(self.path), 0, len(self.data), ~0
+            return
+        for i in range(self.find(start), self.count):
+            span_time, offset, span_types = self.record(i)
+            limit = self.record(i + 1)[1] if i + 1 < self.count else len(self.data)
+            yield span_time, offset, limit, span_types
+
+    def frames(self, start: float, end: float, mask: int = 0) -> Iterator[memoryview]:
+        """
+        Yield frames captured within [start, end] time window, of types matching 'mask' (0 - any)
+        Frames are views into mapped segment, valid only until the next iteration
+        Time resolution is one index span - frames of the span containing 'start' are included
+        """
+        if self.data is None:
+            return
+        types = {msg for msg, bit in TYPE_BITS.items() if mask & bit}
+        other = mask >> OTHER & 1
+        with memoryview(self.data) as view:
+            for span_time, offset, limit, span_types in self.spans(start):
+                if span_time > end:
+                    break
+                if mask and not span_types & mask:
+                    continue
+                for pos, size, msg in iter_frames(self.data, offset, limit):
+                    if not mask or msg in types or other and msg not in TYPE_BITS:
+                        frame = view[pos:pos+size]
+                        try:
+                            yield frame
+                        finally:
+                            # Also when consumer stops iterating early
+                            frame.release()
+
+    def close(self):
+        """
+        Unmap segment files
+        Mapping that still has views exported (e.g. a copy of frame made by consumer via its own memoryview)
+            is left to be unmapped by garbage collector when the last of them goes away
+        """
+        for mapping in (self.index, self.data):
+            if mapping is not None:
+                try:
+                    mapping.close()
+                except BufferError:
+                    pass
+        self.index = self.data = None
+
+
+class CaptureReader:
+    """
+    Time-window access to archive directory written by CaptureWriter
+    Time window is in host wall-clock time of capture (see index format above), not GNSS time
+    """
+
+    def __init__(self, directory: Path, prefix: str = 'rtcm'):
+        self.paths: List[Path] = sorted(directory.glob(f'{prefix}_*.rtcm3'))
+
+    def frames(self, start: float, end: float, msgs: Iterable[int] = ()) -> Iterator[memoryview]:
+        mask = type_mask(msgs)
+        for i, path in enumerate(self.paths):
+            # Segments are named by their opening time, so the next one bounds this one from above
+            if i + 1 < len(self.paths) and segment_time(self.paths[i+1]) < start:
+                continue
+            segment = Segment(path)
+            try:
+                if segment.start_time > end:
+                    break
+                yield from segment.frames(start, end, mask)
+            finally:
+                segment.close()
+
+
+def parse_time(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Replay time window from indexed RTCM3 capture archive to stdout')
+    parser.add_argument('directory', type=Path, help="archive directory")
+    parser.add_argument('-from', dest='start', type=parse_time, default=0.0, metavar='ISOTIME',
+                        help="window start in local wall-clock time of capture host (not GNSS time), "
+                             "e.g. 2021-03-01T10:00:00 (default: beginning of archive)")
+    parser.add_argument('-to', dest='end', type=parse_time, default=float('inf'), metavar='ISOTIME',
+                        help="window end in the same time (default: end of archive)")
+    parser.add_argument('-m', '--messages', nargs='+', type=int, default=[], dest='msgs', metavar='MSG',
+                        help="replay only specified message types")
+    parser.add_argument('-p', '--prefix', default='rtcm', help="segment file name prefix (default: %(default)s)")
+    args = parser.parse_args()
+
+    output = sys.stdout.buffer
+    for frame in CaptureReader(args.directory, args.prefix).frames(args.start, args.end, args.msgs):
+        output.write(frame)
+    output.flush()
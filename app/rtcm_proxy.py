@@ -1,70 +1,623 @@
 #!/usr/bin/env python3
+import re
+import socket
 import sys
 from argparse import ArgumentParser
-from itertools import count
+from base64 import b64encode
+from contextlib import ExitStack
 from pathlib import Path
+from queue import Queue, Full
+from select import select
+from signal import signal, SIGUSR1
+from threading import Event, Thread
+from time import monotonic
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from serial import Serial
 
+from ntrip_caster import NtripCaster, TcpServer
+from rtcm_archive import CaptureWriter
+from rtcm3 import PREAMB, HEADER_LEN, CRC_LEN, MAX_FRAME_LEN, ENCODERS, CRC_ACCELERATED, StationMessages, \
+    crc24q, getbits, msgid
 
-crc24table = (
-    0x000000, 0x864CFB, 0x8AD50D, 0x0C99F6, 0x93E6E1, 0x15AA1A, 0x1933EC, 0x9F7F17,
-    0xA18139, 0x27CDC2, 0x2B5434, 0xAD18CF, 0x3267D8, 0xB42B23, 0xB8B2D5, 0x3EFE2E,
-    0xC54E89, 0x430272, 0x4F9B84, 0xC9D77F, 0x56A868, 0xD0E493, 0xDC7D65, 0x5A319E,
-    0x64CFB0, 0xE2834B, 0xEE1ABD, 0x685646, 0xF72951, 0x7165AA, 0x7DFC5C, 0xFBB0A7,
-    0x0CD1E9, 0x8A9D12, 0x8604E4, 0x00481F, 0x9F3708, 0x197BF3, 0x15E205, 0x93AEFE,
-    0xAD50D0, 0x2B1C2B, 0x2785DD, 0xA1C926, 0x3EB631, 0xB8FACA, 0xB4633C, 0x322FC7,
-    0xC99F60, 0x4FD39B, 0x434A6D, 0xC50696, 0x5A7981, 0xDC357A, 0xD0AC8C, 0x56E077,
-    0x681E59, 0xEE52A2, 0xE2CB54, 0x6487AF, 0xFBF8B8, 0x7DB443, 0x712DB5, 0xF7614E,
-    0x19A3D2, 0x9FEF29, 0x9376DF, 0x153A24, 0x8A4533, 0x0C09C8, 0x00903E, 0x86DCC5,
-    0xB822EB, 0x3E6E10, 0x32F7E6, 0xB4BB1D, 0x2BC40A, 0xAD88F1, 0xA11107, 0x275DFC,
-    0xDCED5B, 0x5AA1A0, 0x563856, 0xD074AD, 0x4F0BBA, 0xC94741, 0xC5DEB7, 0x43924C,
-    0x7D6C62, 0xFB2099, 0xF7B96F, 0x71F594, 0xEE8A83, 0x68C678, 0x645F8E, 0xE21375,
-    0x15723B, 0x933EC0, 0x9FA736, 0x19EBCD, 0x8694DA, 0x00D821, 0x0C41D7, 0x8A0D2C,
-    0xB4F302, 0x32BFF9, 0x3E260F, 0xB86AF4, 0x2715E3, 0xA15918, 0xADC0EE, 0x2B8C15,
-    0xD03CB2, 0x567049, 0x5AE9BF, 0xDCA544, 0x43DA53, 0xC596A8, 0xC90F5E, 0x4F43A5,
-    0x71BD8B, 0xF7F170, 0xFB6886, 0x7D247D, 0xE25B6A, 0x641791, 0x688E67, 0xEEC29C,
-    0x3347A4, 0xB50B5F, 0xB992A9, 0x3FDE52, 0xA0A145, 0x26EDBE, 0x2A7448, 0xAC38B3,
-    0x92C69D, 0x148A66, 0x181390, 0x9E5F6B, 0x01207C, 0x876C87, 0x8BF571, 0x0DB98A,
-    0xF6092D, 0x7045D6, 0x7CDC20, 0xFA90DB, 0x65EFCC, 0xE3A337, 0xEF3AC1, 0x69763A,
-    0x578814, 0xD1C4EF, 0xDD5D19, 0x5B11E2, 0xC46EF5, 0x42220E, 0x4EBBF8, 0xC8F703,
-    0x3F964D, 0xB9DAB6, 0xB54340, 0x330FBB, 0xAC70AC, 0x2A3C57, 0x26A5A1, 0xA0E95A,
-    0x9E1774, 0x185B8F, 0x14C279, 0x928E82, 0x0DF195, 0x8BBD6E, 0x872498, 0x016863,
-    0xFAD8C4, 0x7C943F, 0x700DC9, 0xF64132, 0x693E25, 0xEF72DE, 0xE3EB28, 0x65A7D3,
-    0x5B59FD, 0xDD1506, 0xD18CF0, 0x57C00B, 0xC8BF1C, 0x4EF3E7, 0x426A11, 0xC426EA,
-    0x2AE476, 0xACA88D, 0xA0317B, 0x267D80, 0xB90297, 0x3F4E6C, 0x33D79A, 0xB59B61,
-    0x8B654F, 0x0D29B4, 0x01B042, 0x87FCB9, 0x1883AE, 0x9ECF55, 0x9256A3, 0x141A58,
-    0xEFAAFF, 0x69E604, 0x657FF2, 0xE33309, 0x7C4C1E, 0xFA00E5, 0xF69913, 0x70D5E8,
-    0x4E2BC6, 0xC8673D, 0xC4FECB, 0x42B230, 0xDDCD27, 0x5B81DC, 0x57182A, 0xD154D1,
-    0x26359F, 0xA07964, 0xACE092, 0x2AAC69, 0xB5D37E, 0x339F85, 0x3F0673, 0xB94A88,
-    0x87B4A6, 0x01F85D, 0x0D61AB, 0x8B2D50, 0x145247, 0x921EBC, 0x9E874A, 0x18CBB1,
-    0xE37B16, 0x6537ED, 0x69AE1B, 0xEFE2E0, 0x709DF7, 0xF6D10C, 0xFA48FA, 0x7C0401,
-    0x42FA2F, 0xC4B6D4, 0xC82F22, 0x4E63D9, 0xD11CCE, 0x575035, 0x5BC9C3, 0xDD8538,
-)
-
-
-def crc24(data: bytes) -> bytes:
-    crc = 0
-    for byte in data:
-        crc = crc24table[(crc >> 16 ^ byte) & 0xFF] ^ (crc << 8)
-    return (crc & 0xFFFFFF).to_bytes(3, 'big')
-
-
-PREAMB = b'\xD3'
-
-RTCM = {
-    '1006': None,  # generated dynamically
-    '1008_empty': b'\xD3\x00\x06\x3F\x00\x00\x00\x00\x00\x99\x25\xCA',
-    '1008': b'\xD3\x00\x14\x3F\x00\x00\x0EGPPNULLANTENNA\x00\x00\x72\xD4\xE7',
-    '1033': b'\xD3\x00\x24\x40\x90\x00\x0EGPPNULLANTENNA\x00\x00\x0DUBLOX ZED-F9P\x00\x00\x7D\x50\xA0',
-}
-
-
-def genRTCM1006(rtcm1005data: bytes) -> bytes:
-    first_3_bytes = ((int.from_bytes(rtcm1005data[:2], 'big') & 0x000F) | (1006 << 4)).to_bytes(2, 'big')
-    new_len = (len(rtcm1005data) + 2).to_bytes(2, 'big')
-    new_data = PREAMB + new_len + first_3_bytes + rtcm1005data[2:] + b'\x00\x00'
-    return new_data + crc24(new_data)
+
+BUFSIZE = 64 * 1024
+
+
+def epoch_end(frame) -> bool:
+    """
+    Check if frame is the last observation message of an epoch
+    Multiple message bit (synchronous GNSS flag for legacy messages) is cleared in the last one
+    """
+    msg = msgid(frame)
+    if 1071 <= msg <= 1137 or 1001 <= msg <= 1004:
+        # msgid(12) + station id(12) + epoch time(30) -> bit 54
+        position = 54
+    elif 1009 <= msg <= 1012:
+        # msgid(12) + station id(12) + GLONASS epoch time(27) -> bit 51
+        position = 51
+    else:
+        return False
+    index, shift = divmod(position, 8)
+    if len(frame) <= HEADER_LEN + index + CRC_LEN:
+        return False
+    return not frame[HEADER_LEN + index] & (0x80 >> shift)
+
+
+class EpochTracker:
+    """
+    GNSS epoch tracker for observation messages (MSM and legacy)
+
+    Epoch normally ends with the observation message that has multiple message bit cleared.
+    If that message is lost (e.g. dropped due to CRC error), new epoch is detected by epoch time
+        change in a message of the system (MSM group) that has already been seen in the current epoch.
+    """
+
+    def __init__(self):
+        self.epoch: Dict[int, int] = {}  # system -> epoch time within current epoch
+        self.active = False  # observation messages are present in the stream
+
+    @staticmethod
+    def epoch_time(msg: int, frame) -> Optional[Tuple[int, int]]:
+        """Return (system, epoch time) for observation message, None for other messages"""
+        if 1071 <= msg <= 1137:
+            return msg // 10, getbits(frame[HEADER_LEN:HEADER_LEN+7], 24, 30)
+        if 1001 <= msg <= 1004:
+            return 1000, getbits(frame[HEADER_LEN:HEADER_LEN+7], 24, 30)
+        if 1009 <= msg <= 1012:
+            return 1009, getbits(frame[HEADER_LEN:HEADER_LEN+7], 24, 27)
+        return None
+
+    def starts_epoch(self, msg: int, frame) -> bool:
+        """Check if frame starts new epoch while the previous one has not been closed"""
+        epoch = self.epoch_time(msg, frame)
+        if epoch is None:
+            return False
+        self.active = True
+        system, time = epoch
+        started = self.epoch.get(system, time) != time
+        if started:
+            self.epoch.clear()
+        self.epoch[system] = time
+        return started
+
+    def ends_epoch(self, frame) -> bool:
+        """Check if frame is the last observation message of an epoch"""
+        if epoch_end(frame):
+            self.epoch.clear()
+            return True
+        return False
+
+
+class InjectionScheduler:
+    """
+    Injected messages scheduler
+
+    Station messages are scheduled on every N-th occurrence of anchor message
+        and emitted at the next epoch boundary, so that they never break into MSM sequence of an epoch.
+    If 'budget' is set, injected frames are emitted only as long as total epoch size
+        stays within 'budget' bytes - the rest is carried over to the following epochs.
+    """
+
+    def __init__(self, messages: StationMessages, interval: int = 1, budget: int = 0):
+        self.messages = messages
+        self.interval = interval
+        self.budget = budget
+        self.anchors = 0
+        self.queue: List[bytes] = []
+        self.injected = 0  # number of injected frames
+        self.deferred = 0  # number of epochs when injection was (partially) deferred due to budget
+        self.reload_error = None  # last config reload error, reported only once
+
+    def on_anchor(self):
+        if self.anchors % self.interval == 0:
+            try:
+                self.messages.reload()
+            except (OSError, ValueError) as e:
+                # Config is missing or half-written - keep injecting previous messages, retry on the next anchor
+                if str(e) != self.reload_error:
+                    print(f"RTCM proxy: station config reload failed, previous messages are kept: {e}",
+                          file=sys.stderr, flush=True)
+                    self.reload_error = str(e)
+            else:
+                self.reload_error = None
+            # Fresh station messages supersede the ones still waiting for budget
+            self.queue = list(self.messages.frames)
+        self.anchors += 1
+
+    def inject(self, writer: 'EpochWriter'):
+        """Emit scheduled frames into current epoch (call at epoch boundary)"""
+        if not self.queue:
+            return
+        space = self.budget - len(writer.pending) if self.budget else MAX_FRAME_LEN * len(self.queue)
+        while self.queue and len(self.queue[0]) <= space:
+            frame = self.queue.pop(0)
+            writer.push(frame)
+            space -= len(frame)
+            self.injected += 1
+        if self.queue:
+            self.deferred += 1
+
+    @property
+    def stats(self) -> str:
+        return f"{self.injected} frames injected, {self.deferred} epochs over budget"
+
+
+class MessageFilter:
+    """
+    Per-message-type filter and decimation table
+
+    Maps RTCM message ID to the minimal interval (seconds) between forwarded messages of that type,
+        interval of 0 means message type is dropped completely. Messages not in the table pass through.
+    Interval check tolerates arrival jitter up to JITTER seconds, so 1 Hz message
+        with 10 s interval is forwarded exactly every 10th epoch.
+    Bytes saved by filtering are accounted per message type.
+    """
+
+    JITTER = 0.25
+
+    def __init__(self, intervals: Dict[int, float]):
+        self.intervals = intervals
+        self.next_time: Dict[int, float] = {}
+        self.saved: Dict[int, int] = dict.fromkeys(intervals, 0)
+
+    @classmethod
+    def from_spec(cls, specs: Iterable[str]):
+        """Create from 'MSG:INTERVAL' items, where INTERVAL is time in seconds or 'drop'"""
+        intervals = {}
+        for spec in specs:
+            try:
+                msg, interval = spec.split(':')
+                intervals[int(msg)] = 0 if interval == 'drop' else float(interval)
+            except ValueError:
+                raise ValueError(f"invalid filter spec '{spec}' - expected MSG:INTERVAL or MSG:drop")
+            if intervals[int(msg)] < 0:
+                raise ValueError(f"invalid filter spec '{spec}' - interval should not be negative")
+        return cls(intervals)
+
+    def accept(self, msg: int, size: int, now: float) -> bool:
+        interval = self.intervals.get(msg)
+        if interval is None:
+            return True
+        if interval and now >= self.next_time.get(msg, 0):
+            self.next_time[msg] = now + interval - self.JITTER
+            return True
+        self.saved[msg] += size
+        return False
+
+    @property
+    def stats(self) -> str:
+        saved = ', '.join(f'{msg}: {size}' for msg, size in sorted(self.saved.items()))
+        return f"bytes saved by filter: {sum(self.saved.values())} ({saved})"
+
+
+class EpochWriter:
+    """
+    Coalescing output stage
+
+    Frames are accumulated in a single reusable buffer and sent to all output streams
+        with one write() + flush() per epoch instead of one per frame.
+    Output is flushed when the last observation message of an epoch is pushed
+        (see epoch_end()) or when pending data exceeds 'limit' bytes,
+        so streams without observation messages are still forwarded.
+    Frames that follow the last observation message (e.g. 1230, ephemerides) are flushed
+        when input goes idle (see FrameScanner 'on_idle'), so they are not held until the next epoch.
+    Pending data is copied once per flush into an immutable block shared by all outputs,
+        so outputs are free to retain it (e.g. in their send queues).
+    """
+
+    def __init__(self, *outputs, limit: int = BUFSIZE // 4):
+        self.outputs = outputs
+        self.pending = bytearray()
+        self.limit = limit
+        self.writes = 0
+
+    def push(self, frame):
+        self.pending += frame
+        if len(self.pending) >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        data = bytes(self.pending)
+        for output in self.outputs:
+            output.write(data)
+            output.flush()
+        self.pending.clear()
+        self.writes += 1
+
+
+class FrameScanner:
+    """
+    Buffered RTCM3 framer
+
+    Reads input stream in large chunks into a reusable preallocated buffer,
+        locates preambles with bytearray.find() and yields complete frames
+        (preamble + length + payload + CRC) as memoryviews into that buffer.
+    Yielded frame is valid only until the next iteration - copy it if it needs to be retained.
+    Iteration stops when input stream is exhausted.
+
+    If 'validate' is set, frames with invalid CRC-24Q are dropped and scanning
+        resumes from the byte right after the rejected preamble.
+    If 'on_idle' is set, it is called whenever no input arrives for IDLE_TIMEOUT seconds
+        (sources that could not be polled with select() never go idle).
+    Statistics counters:
+        • frames - number of valid frames yielded
+        • bad_frames - number of frame candidates rejected due to CRC mismatch
+        • dropped - number of input bytes discarded as not belonging to any valid frame
+    """
+
+    IDLE_TIMEOUT = 0.05  # input pause that ends transmission of an epoch, seconds
+
+    def __init__(self, source, bufsize: int = BUFSIZE, *, validate: bool = True,
+                 on_idle: Optional[Callable[[], None]] = None):
+        if bufsize < 2 * MAX_FRAME_LEN:
+            raise ValueError(f"Buffer size should be at least {2 * MAX_FRAME_LEN} bytes")
+        self.source = source
+        self.buffer = bytearray(bufsize)
+        self.view = memoryview(self.buffer)
+        self.head = 0  # start of unparsed data
+        self.tail = 0  # end of valid data
+        self.readinto = self._get_reader(source)
+        self.on_idle = on_idle
+        self.wait = self._get_waiter(source) if on_idle else None
+        self.validate = validate
+        self.frames = 0
+        self.bad_frames = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _get_reader(source) -> Callable[[memoryview], int]:
+        if hasattr(source, 'in_waiting'):
+            # pyserial: Serial.readinto() waits for the whole buffer to fill up,
+            #     so read everything that has already arrived (or block for at least 1 byte)
+            def readinto(dest: memoryview) -> int:
+                data = source.read(min(source.in_waiting or 1, len(dest)))
+                dest[:len(data)] = data
+                return len(data)
+            return readinto
+        # Buffered streams (stdin, pipes) should not block until the whole buffer is filled
+        return getattr(source, 'readinto1', None) or source.readinto
+
+    @staticmethod
+    def _get_waiter(source) -> Optional[Callable[[float], bool]]:
+        """Return function that waits up to given time for input, False if none arrived (None if not pollable)"""
+        try:
+            fd = source.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        # Large reads of buffered streams go directly to the file, so select() on it tells the truth
+        return lambda timeout: bool(select((fd,), (), (), timeout)[0])
+
+    def fill(self) -> int:
+        """Move unparsed data to buffer start and read as much as available after it"""
+        if self.head:
+            size = self.tail - self.head
+            if size:
+                self.buffer[:size] = self.buffer[self.head:self.tail]
+            self.head, self.tail = 0, size
+        if self.wait is not None and not self.wait(self.IDLE_TIMEOUT):
+            self.on_idle()
+        received = self.readinto(self.view[self.tail:]) or 0
+        self.tail += received
+        return received
+
+    @property
+    def stats(self) -> str:
+        return f"{self.frames} frames, {self.bad_frames} bad frames, {self.dropped} bytes dropped"
+
+    def __iter__(self) -> Iterator[memoryview]:
+        buffer = self.buffer
+        view = self.view
+        validate = self.validate
+        eof = False
+        while True:
+            start = buffer.find(PREAMB, self.head, self.tail)
+            if start < 0:
+                # No preamble in buffered data - discard it all
+                self.dropped += self.tail - self.head
+                self.head = self.tail
+                if eof or not self.fill():
+                    return
+                continue
+            self.dropped += start - self.head
+            self.head = start
+
+            if self.tail - start < HEADER_LEN:
+                if not eof and self.fill():
+                    continue
+                # Input is exhausted with incomplete frame candidate - it could be a false preamble,
+                #     so the rest of the data is still scanned for real frames
+                eof = True
+                self.dropped += 1
+                self.head += 1  # fill() has moved the candidate to buffer start
+                continue
+
+            if buffer[start+1] & 0xFC:
+                # Reserved bits are not zero - false preamble
+                self.dropped += 1
+                self.head = start + 1
+                continue
+
+            end = start + HEADER_LEN + ((buffer[start+1] & 0x03) << 8 | buffer[start+2]) + CRC_LEN
+            if self.tail < end:
+                if not eof and self.fill():
+                    continue
+                eof = True
+                self.dropped += 1
+                self.head += 1  # fill() has moved the candidate to buffer start
+                continue
+
+            frame = view[start:end]
+            if validate and crc24q(frame):
+                # CRC over the whole frame including its CRC field yields zero for valid frame
+                frame.release()
+                self.bad_frames += 1
+                self.dropped += 1
+                self.head = start + 1
+                continue
+
+            self.head = end
+            self.frames += 1
+            yield frame
+            frame.release()
+
+
+class NtripServer:
+    """
+    NTRIP server output stream
+
+    Pushes data to NTRIP caster mountpoint: NTRIP v1 (SOURCE request) if no username is specified,
+        NTRIP v2 (chunked HTTP POST with basic authorization) otherwise.
+    Connection is (re)established by a background thread with exponential backoff,
+        so writer is never blocked by caster unavailability - data written while
+        connection is down is dropped, as it is useless for rovers anyway.
+    Implements write() / flush() / close() of a binary file object.
+    """
+
+    NAME = 'NTRIP server'
+    AGENT = 'NTRIP RTCMProxy/1.0'
+    CONNECT_TIMEOUT = 10
+    SEND_TIMEOUT = 2
+    BACKOFF = 1, 60  # initial and maximal reconnect delay, seconds
+
+    spec_regex = re.compile(r'(?:(?P<user>[^:@]*):)?(?P<password>[^@]*)@(?P<host>[^:/]+)(?::(?P<port>\d+))?'
+                            r'/(?P<mountpoint>[^:]+)(?::(?P<sourcetable>.*))?')
+
+    def __init__(self, host: str, port: int, mountpoint: str, password: str, user: str = '', sourcetable: str = ''):
+        self.address = host, port
+        self.mountpoint = mountpoint
+        self.password = password
+        self.user = user
+        self.sourcetable = sourcetable
+        self.sock = None
+        self.lost = Event()
+        self.closed = Event()
+        self.thread = Thread(target=self._run, name=self.NAME, daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def from_spec(cls, spec: str):
+        """Create from '[[user]:password@]host[:port]/mountpoint[:str]' spec (str2str 'ntrips://' format)"""
+        match = cls.spec_regex.fullmatch(spec)
+        if not match:
+            raise ValueError(f"invalid NTRIP server spec '{spec}'")
+        config = match.groupdict(default='')
+        config['port'] = int(config['port'] or 2101)
+        return cls(**config)
+
+    @property
+    def version(self) -> int:
+        return 2 if self.user else 1
+
+    @property
+    def target(self) -> str:
+        return f'{self.address[0]}/{self.mountpoint}'
+
+    def _request(self) -> bytes:
+        if self.version == 1:
+            lines = (f'SOURCE {self.password} /{self.mountpoint}',
+                     f'Source-Agent: {self.AGENT}',
+                     f'STR: {self.sourcetable}')
+        else:
+            credentials = b64encode(f'{self.user}:{self.password}'.encode()).decode()
+            lines = (f'POST /{self.mountpoint} HTTP/1.1',
+                     f'Host: {self.address[0]}:{self.address[1]}',
+                     'Ntrip-Version: Ntrip/2.0',
+                     f'Authorization: Basic {credentials}',
+                     f'User-Agent: {self.AGENT}',
+                     f'Ntrip-STR: {self.sourcetable}',
+                     'Connection: close',
+                     'Transfer-Encoding: chunked')
+        return '\r\n'.join((*lines, '', '')).encode()
+
+    def _handshake(self, sock: socket.socket):
+        sock.sendall(self._request())
+        response = sock.recv(1024).split(b'\r\n', maxsplit=1)[0].decode(errors='replace')
+        if response not in ('ICY 200 OK', 'HTTP/1.1 200 OK', 'HTTP/1.0 200 OK'):
+            raise ConnectionError(f"caster rejected connection: '{response}'")
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection(self.address, timeout=self.CONNECT_TIMEOUT)
+        try:
+            self._handshake(sock)
+            sock.settimeout(self.SEND_TIMEOUT)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _run(self):
+        delay = self.BACKOFF[0]
+        while not self.closed.is_set():
+            try:
+                self.sock = self._connect()
+            except (OSError, ConnectionError) as e:
+                print(f"{self.NAME}: {self.target}: {e}", file=sys.stderr, flush=True)
+                self.closed.wait(delay)
+                delay = min(delay * 2, self.BACKOFF[1])
+                continue
+            print(f"{self.NAME}: connected to {self.target}", file=sys.stderr, flush=True)
+            delay = self.BACKOFF[0]
+            self.lost.clear()
+            self.lost.wait()
+
+    def _disconnect(self):
+        sock, self.sock = self.sock, None
+        if sock:
+            sock.close()
+        self.lost.set()
+
+    def write(self, data) -> int:
+        sock = self.sock
+        if sock is None:
+            return 0
+        try:
+            if self.version == 2:
+                # Chunk header, data and trailer in one segment, not three small sends
+                sock.sendall(b'%X\r\n%b\r\n' % (len(data), data))
+            else:
+                sock.sendall(data)
+        except OSError as e:
+            print(f"{self.NAME}: {self.target}: connection lost: {e}", file=sys.stderr, flush=True)
+            self._disconnect()
+            return 0
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed.set()
+        self._disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TcpClient(NtripServer):
+    """Raw TCP client output stream - same as NtripServer, but with no NTRIP handshake"""
+
+    NAME = 'TCP client'
+
+    spec_regex = re.compile(r'(?P<host>[^:/]+):(?P<port>\d+)')
+
+    def __init__(self, host: str, port: int):
+        super().__init__(host, port, mountpoint='', password='')
+
+    @classmethod
+    def from_spec(cls, spec: str):
+        """Create from 'host:port' spec"""
+        match = cls.spec_regex.fullmatch(spec)
+        if not match:
+            raise ValueError(f"invalid TCP client spec '{spec}'")
+        return cls(match['host'], int(match['port']))
+
+    @property
+    def target(self) -> str:
+        return '{}:{}'.format(*self.address)
+
+    def _handshake(self, sock: socket.socket):
+        pass
+
+
+class BackgroundOutput:
+    """
+    Output stream decoupled from frame loop by a writer thread
+
+    Data blocks are passed to writer thread through a bounded queue without copying,
+        so they should not be modified after write(). If the queue is full (stream is stalled),
+        new blocks are dropped, so a slow output does not stall the frame loop and other outputs.
+    Output is abandoned on the first write error.
+    """
+
+    CLOSE_TIMEOUT = 5
+
+    def __init__(self, stream, name: str, queue_size: int = 64):
+        self.stream = stream
+        self.name = name
+        self.queue = Queue(queue_size)
+        self.dropped = 0  # number of dropped data blocks
+        self.broken = False
+        self.thread = Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        write, flush = self.stream.write, self.stream.flush
+        while True:
+            data = self.queue.get()
+            if data is None:
+                return
+            try:
+                write(data)
+                flush()
+            except (OSError, ValueError) as e:
+                print(f"RTCM proxy: output {self.name} failed: {e}", file=sys.stderr, flush=True)
+                self.broken = True
+                return
+
+    @property
+    def stats(self) -> str:
+        return f"{self.dropped} blocks dropped" + (", failed" if self.broken else "")
+
+    def write(self, data) -> int:
+        if self.broken:
+            return 0
+        try:
+            self.queue.put_nowait(data)
+        except Full:
+            self.dropped += 1
+            return 0
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if not self.broken:
+            try:
+                self.queue.put(None, timeout=self.CLOSE_TIMEOUT)
+            except Full:
+                pass
+            self.thread.join(self.CLOSE_TIMEOUT)
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_output(spec: Optional[str]):
+    """Create output stream from '-out' argument spec (stdout if spec is None)"""
+    if spec is None:
+        return BackgroundOutput(sys.stdout.buffer, '<stdout>')
+    try:
+        stream_type, filepath = spec.split('://', maxsplit=1)
+    except ValueError:
+        raise ValueError(f"invalid format: '{spec}'")
+    if stream_type == 'file':
+        file = Path(filepath).absolute()
+        if not file.exists():
+            raise ValueError(f"file {file} does not exist")
+        return BackgroundOutput(file.open('wb'), spec)
+    elif stream_type == 'ntrips':
+        return BackgroundOutput(NtripServer.from_spec(filepath), spec)
+    elif stream_type == 'tcpcli':
+        return BackgroundOutput(TcpClient.from_spec(filepath), spec)
+    elif stream_type == 'caster':
+        return NtripCaster.from_spec(filepath).run_in_thread()
+    elif stream_type == 'tcpsvr':
+        return TcpServer.from_spec(filepath).run_in_thread()
+    elif stream_type == 'archive':
+        return BackgroundOutput(CaptureWriter(Path(filepath).expanduser()), spec)
+    else:
+        raise ValueError(f"unsupported output format: {stream_type}")
 
 
 parser = ArgumentParser(description='RTCM3 stream proxy')
@@ -76,117 +629,169 @@ parser.add_argument('-in', '--input-stream',
                          "serial://port:baudrate:bytesize:parity:stopbits, "
                          "file://filepath")
 
-parser.add_argument('-out', '--output-stream',
-                    dest='output', metavar='OUTPUT_STREAM',
-                    help="output RTCM stream (default: <stdout>). "
-                         "Supported stream format: file://filepath")
+parser.add_argument('-out', '--output-stream', action='append',
+                    dest='outputs', metavar='OUTPUT_STREAM',
+                    help="output RTCM stream (default: <stdout>), could be specified multiple times. "
+                         "Supported stream formats: file://filepath, "
+                         "ntrips://[[user]:password@]host[:port]/mountpoint[:str] "
+                         "(NTRIP v2 is used if user is specified, v1 otherwise), "
+                         "caster://[user:password@][host][:port]/mountpoint (local NTRIP caster), "
+                         "tcpsvr://[host]:port, tcpcli://host:port, "
+                         "archive://dirpath (rotating capture segments with time index, see rtcm_archive.py)")
 
 parser.add_argument('-a', '--anchor', required=True, dest='anchor', type=int,
                     help="RTCM message ID that would be searched in input stream "
                          "and serve as a trigger for injecting specified RTCM messages")
 
-parser.add_argument('-m', '--messages', nargs='+', default=[], dest='msgs', metavar='MSG',
-                    help="RTCM message IDs to inject after 'anchor' message")
+parser.add_argument('-m', '--messages', nargs='+', default=[], dest='msgs', metavar='MSG', type=int,
+                    help="RTCM message IDs to inject after 'anchor' message. "
+                         f"Supported messages: {', '.join(map(str, ENCODERS))}")
+
+parser.add_argument('-c', '--config', dest='config', type=Path,
+                    help="config.toml to take station parameters for injected messages from. "
+                         "Messages are re-encoded automatically when the file is modified")
 
 parser.add_argument('-i', '--interval', default=1, dest='interval', type=int,
                     help="interval for injected messages relative to anchor. "
-                         "Specified messages will be injected after every N-th "
+                         "Specified messages will be injected at the end of epoch of every N-th "
                          "anchor message occurrence (default: %(default)s)")
 
+parser.add_argument('-b', '--budget', default=0, dest='budget', type=int, metavar='BYTES',
+                    help="per-epoch output size limit for injected messages: "
+                         "injected frames that do not fit are carried over to the following epochs "
+                         "(default: no limit)")
+
 parser.add_argument('-l', '--log-file', dest='log', type=Path,
                     help="file path for error output")
 
+parser.add_argument('-f', '--filter', nargs='+', default=[], dest='filter', metavar='MSG:INTERVAL',
+                    help="forward RTCM message MSG not more often than every INTERVAL seconds "
+                         "(MSG:drop to remove message type from output stream completely)")
 
-try:
-    args = parser.parse_args()
+parser.add_argument('--no-crc', action='store_false', dest='validate',
+                    help="forward input frames without CRC-24Q validation")
 
-    argument = 'argument -in/--input-stream'
-    if args.input is None:
-        source = sys.stdin.buffer
-    else:
-        try:
-            stream_type, raw_config = args.input.split('://', maxsplit=1)
-        except ValueError:
-            parser.error(f"{argument}: invalid format: '{args.input}'")
-        if stream_type == 'serial':
-            serial_options = 'port', 'baudrate', 'bytesize', 'parity', 'stopbits'
-            serial_params = (int(par) if par.isdecimal() else par for par in raw_config.split(':'))
-            config = dict(zip(serial_options, serial_params))
-            if not config['port'].startswith('/dev/'):
-                config['port'] = f'/dev/{config["port"]}'
+
+if __name__ == '__main__':
+    try:
+        args = parser.parse_args()
+
+        argument = 'argument -in/--input-stream'
+        if args.input is None:
+            source = sys.stdin.buffer
+        else:
             try:
-                source = Serial(**config)
-            except ValueError as e:
-                parser.error(f"{argument}: invalid serial options format: {e.args[0] or stream_type(e)}")
-        elif stream_type == 'file':  # not tested
+                stream_type, raw_config = args.input.split('://', maxsplit=1)
+            except ValueError:
+                parser.error(f"{argument}: invalid format: '{args.input}'")
+            if stream_type == 'serial':
+                serial_options = 'port', 'baudrate', 'bytesize', 'parity', 'stopbits'
+                serial_params = (int(par) if par.isdecimal() else par for par in raw_config.split(':'))
+                config = dict(zip(serial_options, serial_params))
+                if not config['port'].startswith('/dev/'):
+                    config['port'] = f'/dev/{config["port"]}'
+                try:
+                    source = Serial(**config)
+                except ValueError as e:
+                    parser.error(f"{argument}: invalid serial options format: {e.args[0] or stream_type(e)}")
+            elif stream_type == 'file':  # not tested
+                try:
+                    source = open(raw_config, 'rb')
+                except FileNotFoundError as e:
+                    parser.error(f"{argument}: {e}")
+            else:
+                parser.error(f"{argument}: unsupported input format: {stream_type}")
+
+        argument = 'argument -out/--output-stream'
+        outputs = ExitStack()
+        streams = []
+        names = []
+        for spec in args.outputs or [None]:
             try:
-                source = open(raw_config, 'rb')
-            except FileNotFoundError as e:
+                streams.append(outputs.enter_context(open_output(spec)))
+                names.append(spec or '<stdout>')
+            except (ValueError, OSError) as e:
                 parser.error(f"{argument}: {e}")
-        else:
-            parser.error(f"{argument}: unsupported input format: {stream_type}")
 
-    argument = 'argument -out/--output-stream'
-    if args.output is None:
-        output = sys.stdout.buffer
-    else:
+        argument = 'argument -m/--messages'
         try:
-            stream_type, filepath = args.output.split('://', maxsplit=1)
-        except ValueError:
-            parser.error(f"{argument}: invalid format: '{args.output}'")
-        if stream_type == 'file':
-            file = Path(filepath).absolute()
-            if not file.exists():
-                parser.error(f"{argument}: file {file} does not exist")
-            output = file.open('wb')
+            messages = StationMessages(args.msgs, args.config)
+        except (ValueError, OSError) as e:
+            parser.error(f"{argument}: {e}")
+
+        argument = 'argument -f/--filter'
+        try:
+            msgfilter = MessageFilter.from_spec(args.filter) if args.filter else None
+        except ValueError as e:
+            parser.error(f"{argument}: {e}")
+
+        argument = 'argument -l/--log-file'
+        logfile = args.log.expanduser().resolve()
+        if not logfile.parent.is_dir():
+            parser.error(f"{argument}: invalid path: '{args.log}'")
+
+        # Clear logfile from previous output if its size is not zero
+        if logfile.stat().st_size != 0:
+            logfile.write_text('')
+
+        writer = EpochWriter(*streams)
+        send = writer.push
+        anchor = args.anchor
+        scheduler = InjectionScheduler(messages, args.interval, args.budget)
+        tracker = EpochTracker()
+
+        # Input pause means the epoch is over - frames past its last observation message are sent right away
+        scanner = FrameScanner(source, validate=args.validate, on_idle=writer.flush)
+        if args.validate and not CRC_ACCELERATED:
+            print("RTCM proxy: 'crcmod' C extension is not installed - CRC-24Q is checked in pure Python "
+                  "(install python3-crcmod, or disable validation with --no-crc)", file=sys.stderr, flush=True)
+
+        def report(*_):
+            stats = f"{scanner.stats}, {scheduler.stats}"
+            if msgfilter is not None:
+                stats += f", {msgfilter.stats}"
+            # Dropped blocks / rovers are the only sign of a stalled output
+            stats += ''.join(f", {name}: {stream.stats}" for name, stream in zip(names, streams))
+            print(f"RTCM proxy: {stats}", file=sys.stderr, flush=True)
+
+        # 'kill -USR1 <pid>' reports scanner counters to tell noisy serial line from a healthy one
+        signal(SIGUSR1, report)
+
+        with source, outputs:
+            for frame in scanner:
+                msg = msgid(frame)
+                if tracker.starts_epoch(msg, frame):
+                    # Last message of previous epoch was lost
+                    scheduler.inject(writer)
+                    writer.flush()
+
+                if msgfilter is None or msgfilter.accept(msg, len(frame), monotonic()):
+                    send(frame)
+
+                if msg == 1005 or msg == 1006:
+                    # Station position for injected 1005/1006 is taken from the stream unless configured
+                    messages.update_arp(frame[HEADER_LEN:-CRC_LEN])
+
+                if msg == anchor:
+                    scheduler.on_anchor()
+                    if not tracker.active:
+                        # No observation messages to track epochs by - inject right after anchor
+                        scheduler.inject(writer)
+
+                if tracker.ends_epoch(frame):
+                    scheduler.inject(writer)
+                    writer.flush()
+
+            writer.flush()
+
+        print(f"RTCM proxy: input stream closed, {writer.writes} writes", file=sys.stderr)
+        report()
+
+    except Exception as e:
+        from traceback import print_exc
+        if locals().get('logfile'):
+            with logfile.open('w') as file:
+                print_exc(file=file)
         else:
-            parser.error(f"{argument}: unsupported input format: {stream_type}")
-
-    argument = 'argument -m/--messages'
-    if any(msg not in RTCM for msg in args.msgs):
-        parser.error(f"{argument}: encountered unsupported RTCM message id: {e}")
-
-    argument = 'argument -l/--log-file'
-    logfile = args.log.expanduser().resolve()
-    if not logfile.parent.is_dir():
-        parser.error(f"{argument}: invalid path: '{args.log}'")
-
-    # Clear logfile from previous output if its size is not zero
-    if logfile.stat().st_size != 0:
-        logfile.write_text('')
-
-    msgs = args.msgs
-    send = output.write
-    flush = output.flush
-    anchor = args.anchor
-    interval = args.interval
-
-    with source, output:
-        for i in count():
-            while source.read(len(PREAMB)) != PREAMB: pass
-            datalen = source.read(2)
-            data = source.read(int.from_bytes(datalen, 'big', signed=False))
-            crc = source.read(3)
-
-            msgid = int.from_bytes(data[:2], 'big') >> 4
-
-            send(PREAMB + datalen + data + crc)
-            flush()
-
-            if msgid == anchor and i % interval == 0:
-                # Reimplement this in a more graceful way...
-                if not RTCM['1006'] and anchor == 1005:
-                    RTCM['1006'] = genRTCM1006(data)
-
-                for msg in msgs:
-                    send(RTCM[msg])
-                    flush()
-
-except Exception as e:
-    from traceback import print_exc
-    if locals().get('logfile'):
-        with logfile.open('w') as file:
-            print_exc(file=file)
-    else:
-        print_exc()
-    exit(1)
+            print_exc()
+        exit(1)
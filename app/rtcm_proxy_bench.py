@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+RTCM proxy throughput benchmark
+
+Compares legacy per-byte frame reading loop of rtcm_proxy.py
+    against buffered FrameScanner (with and without CRC validation) on a recorded RTCM3 file.
+Input file is opened unbuffered, so every read() is a syscall - just like with serial port.
+If no recording is at hand, generate a synthetic one with '-g SIZE_MB'.
+"""
+
+import os
+from argparse import ArgumentParser
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Iterator
+
+from rtcm3 import PREAMB, CRC_LEN, CRC_ACCELERATED, frame
+from rtcm_proxy import FrameScanner
+
+
+def legacy_frames(source) -> Iterator[bytes]:
+    """Frame reading loop as it was implemented in rtcm_proxy.py originally"""
+    while True:
+        # Original loop spins forever on EOF, so bail out explicitly here
+        byte = source.read(len(PREAMB))
+        while byte != PREAMB:
+            if not byte:
+                return
+            byte = source.read(len(PREAMB))
+        datalen = source.read(2)
+        data = source.read(int.from_bytes(datalen, 'big', signed=False))
+        crc = source.read(3)
+        if len(crc) != CRC_LEN:
+            return
+        yield PREAMB + datalen + data + crc
+
+
+def scanner_frames(source) -> Iterator[memoryview]:
+    return iter(FrameScanner(source, validate=False))
+
+
+def checked_frames(source) -> Iterator[memoryview]:
+    scanner = FrameScanner(source)
+    yield from scanner
+    print(f"{'':>10}{scanner.stats}")
+
+
+def random_bytes(rand: Random, size: int) -> bytes:
+    """Same bytes as Random.randbytes() (Python 3.9+) would give"""
+    return rand.getrandbits(size * 8).to_bytes(size, 'little')
+
+
+def make_frame(msgid: int, payload: bytes) -> bytes:
+    return frame((msgid << 4).to_bytes(2, 'big') + payload)
+
+
+def generate(file: Path, size: int, seed: int = 0, noise: float = 0):
+    """
+    Write synthetic 1 Hz RTCM3 stream: 1005 + MSM4 of 4 constellations + 1230 every epoch
+    With 'noise' > 0, that fraction of frames gets a random byte flipped to emulate noisy UART
+    """
+    rand = Random(seed)
+    with file.open('wb') as out:
+        while out.tell() < size:
+            frames = [make_frame(1005, random_bytes(rand, 17))]
+            for msm in (1074, 1084, 1094, 1124):
+                payload = bytearray(random_bytes(rand, rand.randint(80, 250)))
+                # Multiple message bit (bit 54 of message) is cleared only in the last MSM of epoch
+                payload[4] = payload[4] | 0x02 if msm != 1124 else payload[4] & ~0x02
+                frames.append(make_frame(msm, payload))
+            frames.append(make_frame(1230, random_bytes(rand, 4)))
+            for data in frames:
+                if rand.random() < noise:
+                    data = bytearray(data)
+                    data[rand.randrange(len(data))] ^= 1 << rand.randrange(8)
+                out.write(data)
+
+
+def measure(name: str, frames, file: Path) -> float:
+    with open(file, 'rb', buffering=0) as source:
+        count = size = 0
+        start = perf_counter()
+        for data in frames(source):
+            count += 1
+            size += len(data)
+        elapsed = perf_counter() - start
+    print(f"{name:>8}: {count} frames, {size} bytes in {elapsed:.3f} s "
+          f"({size / elapsed / 1e6:.2f} MB/s, {count / elapsed:.0f} frames/s)")
+    return elapsed
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='RTCM proxy framing benchmark')
+    parser.add_argument('file', type=Path, help="recorded RTCM3 stream file")
+    parser.add_argument('-g', '--generate', type=float, metavar='SIZE_MB',
+                        help="generate synthetic RTCM3 file of specified size first")
+    parser.add_argument('-n', '--noise', type=float, default=0,
+                        help="fraction of corrupted frames in generated file (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.file, int(args.generate * 1e6), noise=args.noise)
+        print(f"Generated {args.file} ({os.path.getsize(args.file)} bytes)")
+
+    print(f"CRC-24Q: {'crcmod C extension' if CRC_ACCELERATED else 'pure Python (crcmod C extension is not installed)'}")
+    legacy = measure('legacy', legacy_frames, args.file)
+    scanner = measure('scanner', scanner_frames, args.file)
+    checked = measure('crc', checked_frames, args.file)
+    print(f"Speedup: x{legacy / scanner:.1f} (x{legacy / checked:.1f} with CRC validation)")
@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
 
-from itertools import takewhile, dropwhile, islice
-from math import ceil
+from itertools import takewhile, dropwhile
 from pathlib import Path
-from subprocess import run
-from sys import argv
-from typing import Tuple, List, Collection
+from argparse import ArgumentParser
+from hashlib import sha1
+from time import perf_counter
+from typing import Tuple, List
 
 import toml
 
+import ubxtool
+
 
 PROJECT = Path('/home/pi/app')
 CONFIG_FILE = PROJECT / 'config.toml'
 PID_FILE_NAME = 'ntrips.pid'
+LAYERS = 0b111  # VALSET memory layers mask: RAM | BBR | Flash
+CACHE_DIR = PROJECT / 'ubx_profiles'  # compiled profiles
+CACHE_FORMAT = 1  # bump when compiled profile layout changes
 
 
 def get_sections_itertools(file: Path) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
@@ -48,63 +53,114 @@ def get_sections(file: Path) -> Tuple[List[tuple], List[tuple]]:
     return del_items, set_items
 
 
-def chunks(data: Collection, volume: int, optimize=True) -> tuple:
-    if optimize:
-        volume = ceil(len(data) / ceil(len(data) / volume))
-    iterator = iter(data)
-    chunk = tuple(islice(iterator, volume))
-    while chunk:
-        yield chunk
-        chunk = tuple(islice(iterator, volume))
+def compile_profile(file: Path, layers: int = LAYERS) -> bytes:
+    """
+    Compile u-center profile [set] section to ready-to-send UBX-CFG-VALSET frames (one transaction
+        if there are more than 64 items), keys, value types and checksums are resolved once here
+    """
+    del_items, set_items = get_sections(file)
+    if del_items:
+        raise ValueError("config items deletion is not supported")
+    ubx = ubxtool.gps_model
+    # u-center exports raw value bits in hex
+    values = [(key, ubx.cfg_raw_value(key, int(val, 16))) for key, val in set_items]
+    return b''.join(ubx.make_cfg_valset_frames(values, layers, ubxtool.ubx_session.valset_keys))
+
+
+def cache_path(file: Path, layers: int = LAYERS, cache_dir: Path = CACHE_DIR) -> Path:
+    """
+    Path of compiled profile in cache directory, whether it is there or not
+    Cache files are named by hash of profile contents and layers, so edited profile is compiled anew
+    """
+    digest = sha1(file.read_bytes() + f'{layers}:{CACHE_FORMAT}'.encode()).hexdigest()
+    return cache_dir / f'{file.stem}_{digest[:16]}.ubx'
 
 
-def prepend(prefix, iterable):
-    for item in iterable:
-        yield prefix
-        yield item
+def cached_profile(file: Path, layers: int = LAYERS, cache_dir: Path = CACHE_DIR) -> Path:
+    """
+    Path of compiled profile in cache directory, compiling it first if it is not there
+    The file is plain UBX, it could be streamed to receiver as is
+    Next to it, '.src' file keeps layers and path of the source profile, for prune_cache()
+    """
+    path = cache_path(file, layers, cache_dir)
+    if not path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix('.tmp')
+        temp.write_bytes(compile_profile(file, layers))
+        path.with_suffix('.src').write_text(f'{layers} {file}')
+        temp.replace(path)
+        prune_cache(cache_dir)
+    return path
+
+
+def prune_cache(cache_dir: Path = CACHE_DIR):
+    """
+    Remove compiled profiles whose source profile no longer exists or was edited since,
+        as well as ones without '.src' file (left by previous versions)
+    """
+    for path in cache_dir.glob('*.ubx'):
+        source = path.with_suffix('.src')
+        try:
+            layers, file = source.read_text().split(' ', 1)
+            if cache_path(Path(file), int(layers), cache_dir) == path:
+                continue
+        except (OSError, ValueError):
+            pass
+        for stale in (path, source):
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def split_frames(data: bytes) -> List[bytes]:
+    """Split concatenated UBX frames"""
+    frames = []
+    pos = 0
+    while pos < len(data):
+        end = pos + 8 + (data[pos+4] | data[pos+5] << 8)
+        frames.append(data[pos:end])
+        pos = end
+    return frames
 
 
 if __name__ == '__main__':
 
+    parser = ArgumentParser(description="Apply u-center configuration profile to receiver")
+    parser.add_argument('file', type=Path, help="u-center profile (.txt)")
+    parser.add_argument('-c', '--compile', action='store_true',
+                        help="only compile profile to cache and print path of the file "
+                             "(it could be streamed to receiver as is, e.g. 'cat FILE > /dev/serial0')")
+    args = parser.parse_args()
+
     config = toml.load(str(CONFIG_FILE))
     print(f"Loaded {CONFIG_FILE.name}")
 
     PID_FILE = Path(config['tmpfsdir']) / PID_FILE_NAME
-    if PID_FILE.exists():
+    if not args.compile and PID_FILE.exists():
         print("Error: NTRIP server is running. Stop it with 'mvbs stop' and run the script once again")
         exit(1)
 
-    if len(argv) < 2:
-        print("Error: uCenter config file path should be provided as an argument")
+    try:
+        profile = cached_profile(args.file.resolve())
+    except ValueError as error:
+        print(f"Error: {error}")
         exit(1)
-
-    UBX_CONFIG_FILE = Path(argv[1]).resolve().absolute()
-    VALSET = ['python', 'ubxtool.py', '-f', '/dev/serial0', '-s', '115200', '-w', '0.5']
-
-    to_del, to_set = get_sections(UBX_CONFIG_FILE)
-
-    if to_del:
-        print('Config items deletion is not supported')
+    if args.compile:
+        print(profile)
+        exit(0)
+
+    frames = split_frames(profile.read_bytes())
+    port = f"/dev/{config['SERIAL']['port']}"
+    print(f"Applying {profile.name} ({len(frames)} frames) to {port}")
+    with ubxtool.ubx_session(port, config['SERIAL']['baudrate']) as session:
+        start = perf_counter()
+        latency = session.send_pipelined(frames)
+        elapsed = perf_counter() - start
+
+    if latency is None:
+        print("Configuration is not acknowledged by receiver and is not applied")
         exit(1)
-
-    for i, items in enumerate(chunks(to_set, 64)):
-        print(f"Chunk #{i+1}, {len(items)} of {len(to_set)} items")
-
-        spec_pairs = []
-        for key, val in items:
-            spec_pairs.append(f"{key},{int(val, 16)}")
-
-        VALSET.extend(prepend('-z', spec_pairs))
-
-        print("Command: " + '\n-z'.join(' '.join(VALSET).split('-z')))
-
-        reply = ''
-        while reply.strip() not in ('y', 'n'):
-            reply = input('Send values [y/n]? ')
-        if reply == 'y':
-            ubxtool_process = run(VALSET)
-            print(f"ubxtool.py exitcode: {ubxtool_process.returncode}")
-        else:
-            print("Cancelled")
-            exit(0)
-        print()
+    for i, seconds in enumerate(latency):
+        print(f"Chunk #{i+1}: acknowledged in {seconds * 1000:.1f} ms")
+    print(f"{len(frames)} frames applied in {elapsed * 1000:.0f} ms")
@@ -33,17 +33,22 @@ usage: ubxtool [OPTIONS] [server[:port[:device]]]
 from __future__ import absolute_import, print_function, division
 
 import binascii      # for binascii.hexlify()
+import collections   # for deque()
+import contextlib    # for redirect_stdout()
 from functools import reduce  # pylint: disable=redefined-builtin
+from itertools import accumulate  # for checksum()
 import getopt        # for getopt.getopt(), to parse CLI options
+import importlib     # for import_module()
+import io            # for StringIO()
 import operator      # for or_
 import os            # for os.environ
 import re            # for regular expressions
+import select        # for select.select()
 import socket        # for socket.error
 import stat          # for stat.S_ISBLK()
 import string        # for string.printable
 import struct        # for pack()
 import sys
-import time
 
 PROG_NAME = 'ubxtool'
 
@@ -52,6 +57,10 @@ try:
 except ImportError:
     serial = None  # Defer complaining until we know we need it.
 
+# Optional, for ubx_record.columns() only.  Importing numpy takes longer
+# than all the rest of a VALSET, so load_numpy() imports it on first use.
+numpy = False  # not imported yet
+
 try:
     import gps
 except ImportError:
@@ -76,6 +85,8 @@ VERB_PROG = 5    # program trace
 
 # dictionary to hold all user options
 opts = {
+    # config snapshot or u-center files to compare, -C
+    'cmp_file': [],
     # command to send to GPS, -c
     'command': None,
     # default -x items, up to 64 per call
@@ -88,6 +99,8 @@ opts = {
     'help': None,
     # default input -f file
     'input_file_name': None,
+    # config snapshot file to save, -D
+    'snapshot_file': None,
     # default -g items, up to 64 per call
     'get_item': [],
     # default forced wait? -W
@@ -96,6 +109,8 @@ opts = {
     'input_speed': 9600,
     # default input wait time -w in seconds
     'input_wait': 2.0,
+    # worker processes to decode a plain input file with, -j
+    'jobs': 1,
     # optional mode to -p P
     'mode': None,
     # the name of an OAF file, extension .jpo
@@ -282,16 +297,20 @@ def unpack_u8(word, pos):
     return u[0]
 
 
+# id(descs): (descs, sorted items of descs), for flag_s()
+flag_s_items = {}
+
+
 def flag_s(flag, descs):
     """Decode flag using descs, return a string.  Ignores unknown bits."""
 
-    s = ''
-    for key, value in sorted(descs.items()):
-        if key == (key & flag):
-            s += value
-            s += ' '
+    # descs are constant tables, sort each only once
+    items = flag_s_items.get(id(descs))
+    if items is None or items[0] is not descs:
+        items = flag_s_items[id(descs)] = (descs, sorted(descs.items()))
 
-    return s.strip()
+    return ' '.join([value for key, value in items[1]
+                     if key == (key & flag)]).strip()
 
 
 def index_s(index, descs, nf="Unk"):
@@ -305,6 +324,199 @@ def index_s(index, descs, nf="Unk"):
     return s
 
 
+def load_numpy():
+    """Import numpy on first call.  Return it, or None if not installed"""
+
+    global numpy
+    if numpy is False:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
+class lazy_table(object):
+    """Class attribute loaded from a data module on first access
+
+The module is imported then, and the attribute is replaced by the value,
+so the descriptor is not involved in later accesses."""
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+
+    def __get__(self, obj, owner):
+        value = getattr(importlib.import_module(self.module), self.name)
+        setattr(owner, self.name, value)
+        return value
+
+
+class ubx_layout(object):
+    """Compiled payload layout of a UBX message, for ubx.decode()
+
+    fmt and fields describe the fixed part of the payload.  block_fmt and
+    block_fields describe the repeated block, if any.  Blocks follow the
+    fixed part, their number is the value of the fixed field named count,
+    or as many as fit in the payload when count is None.
+    """
+
+    # struct format chars to numpy dtype chars, little endian
+    dtype_chars = {'b': 'i1', 'B': 'u1', 'h': '<i2', 'H': '<u2',
+                   'l': '<i4', 'L': '<u4', 'q': '<i8', 'Q': '<u8',
+                   'f': '<f4', 'd': '<f8'}
+
+    def __init__(self, name, fmt, fields, block_fmt=None, block_fields=None,
+                 count=None):
+        self.name = name
+        typename = name.replace('UBX-', '').replace('-', '_')
+        self.head = struct.Struct(fmt)
+        self.fields = collections.namedtuple(typename, fields)
+        self.block = None
+        if block_fmt is not None:
+            self.block = struct.Struct(block_fmt)
+            self.block_fields = collections.namedtuple(typename + '_block',
+                                                       block_fields)
+        self.count = None
+        if count is not None:
+            self.count = self.fields._fields.index(count)
+        # built on first use, only if numpy is there
+        self.dtype = None
+
+    def unpack(self, payload):
+        """Return fields of the fixed part of payload"""
+
+        return self.fields._make(self.head.unpack_from(payload, 0))
+
+    def block_span(self, payload, fields):
+        """Return offset and number of the repeated blocks of payload"""
+
+        start = self.head.size
+        count = (len(payload) - start) // self.block.size
+        if self.count is not None:
+            count = max(min(count, fields[self.count]), 0)
+        return start, count
+
+    def blocks(self, payload, fields):
+        """Return tuple of repeated blocks of payload, as namedtuples"""
+
+        if self.block is None:
+            return ()
+        start, count = self.block_span(payload, fields)
+        end = start + count * self.block.size
+        return tuple(map(self.block_fields._make,
+                         self.block.iter_unpack(
+                             memoryview(payload)[start:end])))
+
+    def make_dtype(self):
+        """Return numpy structured dtype of the repeated block"""
+
+        names = []
+        formats = []
+        offsets = []
+        fields = iter(self.block_fields._fields)
+        offset = 0
+        for num, char in re.findall(r'(\d*)([a-zA-Z])',
+                                    self.block.format):
+            num = int(num) if num else 1
+            if 'x' == char:
+                # padding, no field
+                offset += num
+                continue
+            if 's' == char:
+                # raw bytes, void keeps trailing NULs
+                names.append(next(fields))
+                formats.append('V%d' % num)
+                offsets.append(offset)
+                offset += num
+                continue
+            for _ in range(num):
+                names.append(next(fields))
+                formats.append(self.dtype_chars[char])
+                offsets.append(offset)
+                offset += struct.calcsize('<' + char)
+        return numpy.dtype({'names': names, 'formats': formats,
+                            'offsets': offsets,
+                            'itemsize': self.block.size})
+
+    def columns(self, payload, fields):
+        """Return repeated blocks of payload as columns
+
+With numpy, a structured array viewing payload, no copies: column
+'cno' is arr['cno'].  Without numpy, a dict of field name to tuple of
+values, which is indexed the same way."""
+
+        start, count = self.block_span(payload, fields)
+        if load_numpy() is not None:
+            if self.dtype is None:
+                self.dtype = self.make_dtype()
+            return numpy.frombuffer(payload, self.dtype, count, start)
+
+        end = start + count * self.block.size
+        rows = self.block.iter_unpack(memoryview(payload)[start:end])
+        values = list(zip(*rows)) or [()] * len(self.block_fields._fields)
+        return dict(zip(self.block_fields._fields, values))
+
+
+class ubx_record(object):
+    """One decoded UBX message, as returned by ubx.decode()
+
+    Fields of the fixed part of the payload read as attributes, repeated
+    blocks are namedtuples in blocks, unpacked when first used.  Messages
+    without a layout, or too short for it, only have the raw payload.
+    str() formats the message the way ubxtool prints it, only when asked
+    for.
+    """
+
+    __slots__ = ('m_class', 'm_id', 'payload', 'layout', 'fields',
+                 '_blocks')
+
+    def __init__(self, m_class, m_id, payload, layout=None):
+        self.m_class = m_class
+        self.m_id = m_id
+        self.payload = payload
+        self.layout = layout
+        self.fields = None
+        self._blocks = ()
+        if layout is not None:
+            self.fields = layout.unpack(payload)
+            self._blocks = None
+
+    def __getattr__(self, name):
+        # only called for names that are not slots
+        if self.fields is None:
+            raise AttributeError(name)
+        return getattr(self.fields, name)
+
+    @property
+    def blocks(self):
+        """Tuple of repeated blocks, as namedtuples"""
+        if self._blocks is None:
+            self._blocks = self.layout.blocks(self.payload, self.fields)
+        return self._blocks
+
+    def columns(self):
+        """Repeated blocks as columns, see ubx_layout.columns()
+
+For example, per epoch pseudoranges of UBX-RXM-RAWX are
+rec.columns()['prMes'], a numpy array if numpy is installed."""
+        if self.layout is None or self.layout.block is None:
+            raise ValueError('%s has no repeated blocks' % self.name)
+        return self.layout.columns(self.payload, self.fields)
+
+    @property
+    def name(self):
+        """UBX-CLASS-ID name of the message"""
+        return gps_model.msg_name(self.m_class, self.m_id)
+
+    def __repr__(self):
+        return '<%s %r>' % (self.name, self.fields)
+
+    def __str__(self):
+        return gps_model.msg_text(self.m_class, self.m_id, self.payload)
+
+
 class ubx(object):
     """class to hold u-blox stuff"""
 
@@ -312,6 +524,10 @@ class ubx(object):
     last_statement_identifier = None
     # expected statement identifier.
     expect_statement_identifier = False
+    # if set, called with (m_class, m_id, m_payload) of every UBX message
+    # decode_ubx() gets, the message is not printed if it returns True.
+    # While set, frames failing the checksum are dropped, not decoded.
+    msg_hook = None
 
     def __init__(self):
         pass
@@ -361,1371 +577,32 @@ class ubx(object):
     # 4 - scale
     # 5 - Unit
     # 6 - Description
-    cfgs = (
-        # CFG-GEOFENCE-
-        ("CFG-GEOFENCE-CONFLVL", 0x20240011, "E1", 1, "",
-         "Required confidence level for state evaluation"),
-        ("CFG-GEOFENCE-USE_PIO", 0x10240012, "L", 1, "",
-         "Use PIO combined fence state output"),
-        ("CFG-GEOFENCE-PINPOL", 0x20240013, "E1", 1, "",
-         "PIO pin polarity"),
-        ("CFG-GEOFENCE-PIN", 0x20240014, "U1", 1, "",
-         "PIO pin number"),
-        ("CFG-GEOFENCE-USE_FENCE1", 0x10240020, "L", 1, "",
-         "Use first geofence"),
-        ("CFG-GEOFENCE-FENCE1_LAT", 0x40240021, "I4", 1e-7, "deg",
-         "Latitude of the first geofence circle center"),
-        ("CFG-GEOFENCE-FENCE1_LON", 0x40240022, "I4", 1e-7, "deg",
-         "Longitude of the first geofence circle center"),
-        ("CFG-GEOFENCE-FENCE1_RAD", 0x40240023, "U4", 0.01, "m",
-         "Radius of the first geofence circle"),
-        ("CFG-GEOFENCE-USE_FENCE2", 0x10240030, "L", 1, "",
-         "Use second geofence"),
-        ("CFG-GEOFENCE-FENCE2_LAT", 0x40240031, "I4", 1e-7, "deg",
-         "Latitude of the second geofence circle center"),
-        ("CFG-GEOFENCE-FENCE2_LON", 0x40240032, "I4", 1e-7, "deg",
-         "Longitude of the second geofence circle center"),
-        ("CFG-GEOFENCE-FENCE2_RAD", 0x40240033, "U4", 0.01, "m",
-         "Radius of the second geofence circle"),
-        ("CFG-GEOFENCE-USE_FENCE3", 0x10240040, "L", 1, "",
-         "Use third geofence"),
-        ("CFG-GEOFENCE-FENCE3_LAT", 0x40240041, "I4", 1e-7, "deg",
-         "Latitude of the third geofence circle center"),
-        ("CFG-GEOFENCE-FENCE3_LON", 0x40240042, "I4", 1e-7, "deg",
-         "Longitude of the third geofence circle center"),
-        ("CFG-GEOFENCE-FENCE3_RAD", 0x40240043, "U4", 0.01, "m",
-         "Radius of the third geofence circle"),
-        ("CFG-GEOFENCE-USE_FENCE4", 0x10240050, "L", 1, "",
-         "Use fourth geofence"),
-        ("CFG-GEOFENCE-FENCE4_LAT", 0x40240051, "I4", 1e-7, "deg",
-         "Latitude of the fourth geofence circle center"),
-        ("CFG-GEOFENCE-FENCE4_LON", 0x40240052, "I4", 1e-7, "deg",
-         "Longitude of the fourth geofence circle center"),
-        ("CFG-GEOFENCE-FENCE4_RAD", 0x40240053, "U4", 0.01, "m",
-         "Radius of the fourth geofence circle"),
-        # CFG-HW
-        ("CFG-HW-ANT_CFG_VOLTCTRL", 0x10a3002e, "L", 1, "",
-         "Active antenna voltage control flag"),
-        ("CFG-HW-ANT_CFG_SHORTDET", 0x10a3002f, "L", 1, "",
-         "Short antenna detection flag"),
-        ("CFG-HW-ANT_CFG_SHORTDET_POL", 0x10a30030, "L", 1, "",
-         "Short antenna detection polarity"),
-        ("CFG-HW-ANT_CFG_OPENDET", 0x10a30031, "L", 1, "",
-         "Open antenna detection flag"),
-        ("CFG-HW-ANT_CFG_OPENDET_POL", 0x10a30032, "L", 1, "",
-         "Open antenna detection polarity"),
-        ("CFG-HW-ANT_CFG_PWRDOWN", 0x10a30033, "L", 1, "",
-         "Power down antenna flag"),
-        ("CFG-HW-ANT_CFG_PWRDOWN_POL", 0x10a30034, "L", 1, "",
-         "Power down antenna logic polarity"),
-        ("CFG-HW-ANT_CFG_RECOVER", 0x10a30035, "L", 1, "",
-         "Automatic recovery from short state flag"),
-        ("CFG-HW-ANT_SUP_SWITCH_PIN", 0x20a30036, "U1", 1, "",
-         "ANT1 PIO number"),
-        ("CFG-HW-ANT_SUP_SHORT_PIN", 0x20a30037, "U1", 1, "",
-         "ANT0 PIO number"),
-        ("CFG-HW-ANT_SUP_OPEN_PIN", 0x20a30038, "U1", 1, "",
-         "ANT2 PIO number"),
-        # CFG-I2C
-        ("CFG-I2C-ADDRESS", 0x20510001, "U1", 1, "",
-         "I2C slave address of the receiver"),
-        ("CFG-I2C-EXTENDEDTIMEOUT", 0x10510002, "L", 1, "",
-         "Flag to disable timeouting the interface after 1.5 s"),
-        ("CFG-I2C-ENABLED", 0x10510003, "L", 1, "",
-         "Flag to indicate if the I2C interface should be enabled"),
-        # CFG-I2CINPROT
-        ("CFG-I2CINPROT-UBX", 0x10710001, "L", 1, "",
-         "Flag to indicate if UBX should be an input on I2C"),
-        ("CFG-I2CINPROT-NMEA", 0x10710002, "L", 1, "",
-         "Flag to indicate if NMEA should be an input on I2C"),
-        ("CFG-I2CINPROT-RTCM2X", 0x10710003, "L", 1, "",
-         "Flag to indicate if RTCM2X should be an input on I2C"),
-        ("CFG-I2CINPROT-RTCM3X", 0x10710004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be input on I2C"),
-        # CFG-I2COUTPROT
-        ("CFG-I2COUTPROT-UBX", 0x10720001, "L", 1, "",
-         "Flag to indicate if UBX should be an output on I2C"),
-        ("CFG-I2COUTPROT-NMEA", 0x10720002, "L", 1, "",
-         "Flag to indicate if NMEA should be an output on I2C"),
-        ("CFG-I2COUTPROT-RTCM3X", 0x10720004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an output on I2C"),
-        # CFG-INFMSG-
-        ("CFG-INFMSG-UBX_I2C", 0x20920001, "X1", 1, "",
-         "Information message enable flags for UBX protocol on I2C"),
-        ("CFG-INFMSG-UBX_UART1", 0x20920002, "X1", 1, "",
-         "Information message enable flags for UBX protocol on UART1"),
-        ("CFG-INFMSG-UBX_UART2", 0x20920003, "X1", 1, "",
-         "Information message enable flags for UBX protocol on UART2"),
-        ("CFG-INFMSG-UBX_USB", 0x20920004, "X1", 1, "",
-         "Information message enable flags for UBX protocol on USB"),
-        ("CFG-INFMSG-UBX_SPI", 0x20920005, "X1", 1, "",
-         "Information message enable flags for UBX protocol on SPI"),
-        ("CFG-INFMSG-NMEA_I2C", 0x20920006, "X1", 1, "",
-         "Information message enable flags for NMEA protocol on I2C"),
-        ("CFG-INFMSG-NMEA_UART1", 0x20920007, "X1", 1, "",
-         "Information message enable flags for NMEA protocol on UART1"),
-        ("CFG-INFMSG-NMEA_UART2", 0x20920008, "X1", 1, "",
-         "Information message enable flags for NMEA protocol on UART2"),
-        ("CFG-INFMSG-NMEA_USB", 0x20920009, "X1", 1, "",
-         "Information message enable flags for NMEA protocol on USB"),
-        ("CFG-INFMSG-NMEA_SPI", 0x2092000a, "X1", 1, "",
-         "Information message enable flags for NMEA protocol on SPI"),
-        # CFG-ITFM-
-        ("CFG-ITFM-BBTHRESHOLD", 0x20410001, "U1", 1, "",
-         "Broadband jamming detection threshold"),
-        ("CFG-ITFM-CWTHRESHOLD", 0x20410002, "U1", 1, "",
-         "CW jamming detection threshold"),
-        ("CFG-ITFM-ENABLE", 0x1041000d, "L", 1, "",
-         "Enable interference detection"),
-        ("CFG-ITFM-ANTSETTING", 0x20410010, "E1", 1, "",
-         "Antenna setting"),
-        ("CFG-ITFM-ENABLE_AUX", 0x10410013, "L", 1, "",
-         "Set to true to scan auxiliary bands"),
-        # CFG-LOGFILTER-
-        ("CFG-LOGFILTER-RECORD_ENA", 0x10de0002, "L", 1, "",
-         "Recording enabled"),
-        ("CFG-LOGFILTER-ONCE_PER_WAKE_UP_ENA", 0x10de0003, "L", 1, "",
-         "Once per wakeup"),
-        ("CFG-LOGFILTER-APPLY_ALL_FILTERS", 0x10de0004, "L", 1, "",
-         "Apply all filter settings"),
-        ("CFG-LOGFILTER-MIN_INTERVAL", 0x30de0005, "U2", 1, "s",
-         "Minimum time interval between logged positions"),
-        ("CFG-LOGFILTER-TIME_THRS", 0x30de0006, "U2", 1, "s",
-         "Time threshold"),
-        ("CFG-LOGFILTER-SPEED_THRS", 0x30de0007, "U2", 1, "m/s",
-         "Speed threshold"),
-        ("CFG-LOGFILTER-POSITION_THRS", 0x40de0008, "U4", 1, "m",
-         "Position threshold"),
-        # CFG-MOT-
-        ("CFG-MOT-GNSSSPEED_THRS", 0x20250038, "U1", 0.01, "m/s",
-         "GNSS speed threshold below which platform is considered "
-         "as stationary"),
-        ("CFG-MOT-GNSSDIST_THRS", 0x3025003b, "U2", 1, "",
-         "Distance above which GNSS-based stationary motion is exit"),
-        # CFG-MSGOUT-NMEA
-        ("CFG-MSGOUT-NMEA_ID_DTM_I2C", 0x209100a6, "U1", 1, "",
-         "Output rate of the NMEA-GX-DTM message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_DTM_SPI", 0x209100aa, "U1", 1, "",
-         "Output rate of the NMEA-GX-DTM message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_DTM_UART1", 0x209100a7, "U1", 1, "",
-         "Output rate of the NMEA-GX-DTM message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_DTM_UART2", 0x209100a8, "U1", 1, "",
-         "Output rate of the NMEA-GX-DTM message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_DTM_USB", 0x209100a9, "U1", 1, "",
-         "Output rate of the NMEA-GX-DTM message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GBS_I2C", 0x209100dd, "U1", 1, "",
-         "Output rate of the NMEA-GX-GBS message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GBS_SPI", 0x209100e1, "U1", 1, "",
-         "Output rate of the NMEA-GX-GBS message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GBS_UART1", 0x209100de, "U1", 1, "",
-         "Output rate of the NMEA-GX-GBS message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GBS_UART2", 0x209100df, "U1", 1, "",
-         "Output rate of the NMEA-GX-GBS message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GBS_USB", 0x209100e0, "U1", 1, "",
-         "Output rate of the NMEA-GX-GBS message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GGA_I2C", 0x209100ba, "U1", 1, "",
-         "Output rate of the NMEA-GX-GGA message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GGA_SPI", 0x209100be, "U1", 1, "",
-         "Output rate of the NMEA-GX-GGA message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GGA_UART1", 0x209100bb, "U1", 1, "",
-         "Output rate of the NMEA-GX-GGA message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GGA_UART2", 0x209100bc, "U1", 1, "",
-         "Output rate of the NMEA-GX-GGA message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GGA_USB", 0x209100bd, "U1", 1, "",
-         "Output rate of the NMEA-GX-GGA message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GLL_I2C", 0x209100c9, "U1", 1, "",
-         "Output rate of the NMEA-GX-GLL message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GLL_SPI", 0x209100cd, "U1", 1, "",
-         "Output rate of the NMEA-GX-GLL message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GLL_UART1", 0x209100ca, "U1", 1, "",
-         "Output rate of the NMEA-GX-GLL message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GLL_UART2", 0x209100cb, "U1", 1, "",
-         "Output rate of the NMEA-GX-GLL message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GLL_USB", 0x209100cc, "U1", 1, "",
-         "Output rate of the NMEA-GX-GLL message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GNS_I2C", 0x209100b5, "U1", 1, "",
-         "Output rate of the NMEA-GX-GNS message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GNS_SPI", 0x209100b9, "U1", 1, "",
-         "Output rate of the NMEA-GX-GNS message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GNS_UART1", 0x209100b6, "U1", 1, "",
-         "Output rate of the NMEA-GX-GNS message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GNS_UART2", 0x209100b7, "U1", 1, "",
-         "Output rate of the NMEA-GX-GNS message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GNS_USB", 0x209100b8, "U1", 1, "",
-         "Output rate of the NMEA-GX-GNS message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GRS_I2C", 0x209100ce, "U1", 1, "",
-         "Output rate of the NMEA-GX-GRS message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GRS_SPI", 0x209100d2, "U1", 1, "",
-         "Output rate of the NMEA-GX-GRS message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GRS_UART1", 0x209100cf, "U1", 1, "",
-         "Output rate of the NMEA-GX-GRS message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GRS_UART2", 0x209100d0, "U1", 1, "",
-         "Output rate of the NMEA-GX-GRS message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GRS_USB", 0x209100d1, "U1", 1, "",
-         "Output rate of the NMEA-GX-GRS message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GSA_I2C", 0x209100bf, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSA message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GSA_SPI", 0x209100c3, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSA message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GSA_UART1", 0x209100c0, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSA message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GSA_UART2", 0x209100c1, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSA message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GSA_USB", 0x209100c2, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSA message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GST_I2C", 0x209100d3, "U1", 1, "",
-         "Output rate of the NMEA-GX-GST message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GST_SPI", 0x209100d7, "U1", 1, "",
-         "Output rate of the NMEA-GX-GST message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GST_UART1", 0x209100d4, "U1", 1, "",
-         "Output rate of the NMEA-GX-GST message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GST_UART2", 0x209100d5, "U1", 1, "",
-         "Output rate of the NMEA-GX-GST message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_GST_USB", 0x209100d6, "U1", 1, "",
-         "Output rate of the NMEA-GX-GST message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_GSV_I2C", 0x209100c4, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSV message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_GSV_SPI", 0x209100c8, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSV message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_GSV_UART1", 0x209100c5, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSV message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_GSV_UART2", 0x209100c6, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSV message on port UART"),
-        ("CFG-MSGOUT-NMEA_ID_GSV_USB", 0x209100c7, "U1", 1, "",
-         "Output rate of the NMEA-GX-GSV message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_RMC_I2C", 0x209100ab, "U1", 1, "",
-         "Output rate of the NMEA-GX-RMC message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_RMC_SPI", 0x209100af, "U1", 1, "",
-         "Output rate of the NMEA-GX-RMC message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_RMC_UART1", 0x209100ac, "U1", 1, "",
-         "Output rate of the NMEA-GX-RMC message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_RMC_UART2", 0x209100ad, "U1", 1, "",
-         "Output rate of the NMEA-GX-RMC message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_RMC_USB", 0x209100ae, "U1", 1, "",
-         "Output rate of the NMEA-GX-RMC message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_VLW_I2C", 0x209100e7, "U1", 1, "",
-         "Output rate of the NMEA-GX-VLW message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_VLW_SPI", 0x209100eb, "U1", 1, "",
-         "Output rate of the NMEA-GX-VLW message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_VLW_UART1", 0x209100e8, "U1", 1, "",
-         "Output rate of the NMEA-GX-VLW message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_VLW_UART2", 0x209100e9, "U1", 1, "",
-         "Output rate of the NMEA-GX-VLW message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_VLW_USB", 0x209100ea, "U1", 1, "",
-         "Output rate of the NMEA-GX-VLW message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_VTG_I2C", 0x209100b0, "U1", 1, "",
-         "Output rate of the NMEA-GX-VTG message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_VTG_SPI", 0x209100b4, "U1", 1, "",
-         "Output rate of the NMEA-GX-VTG message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_VTG_UART1", 0x209100b1, "U1", 1, "",
-         "Output rate of the NMEA-GX-VTG message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_VTG_UART2", 0x209100b2, "U1", 1, "",
-         "Output rate of the NMEA-GX-VTG message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_VTG_USB", 0x209100b3, "U1", 1, "",
-         "Output rate of the NMEA-GX-VTG message on port USB"),
-        ("CFG-MSGOUT-NMEA_ID_ZDA_I2C", 0x209100d8, "U1", 1, "",
-         "Output rate of the NMEA-GX-ZDA message on port I2C"),
-        ("CFG-MSGOUT-NMEA_ID_ZDA_SPI", 0x209100dc, "U1", 1, "",
-         "Output rate of the NMEA-GX-ZDA message on port SPI"),
-        ("CFG-MSGOUT-NMEA_ID_ZDA_UART1", 0x209100d9, "U1", 1, "",
-         "Output rate of the NMEA-GX-ZDA message on port UART1"),
-        ("CFG-MSGOUT-NMEA_ID_ZDA_UART2", 0x209100da, "U1", 1, "",
-         "Output rate of the NMEA-GX-ZDA message on port UART2"),
-        ("CFG-MSGOUT-NMEA_ID_ZDA_USB", 0x209100db, "U1", 1, "",
-         "Output rate of the NMEA-GX-ZDA message on port USB"),
-        # CFG-MSGOUT-PUBX
-        ("CFG-MSGOUT-PUBX_ID_POLYP_I2C", 0x209100ec, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX00 message on port I2C"),
-        ("CFG-MSGOUT-PUBX_ID_POLYP_SPI", 0x209100f0, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX00 message on port SPI"),
-        ("CFG-MSGOUT-PUBX_ID_POLYP_UART1", 0x209100ed, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX00 message on port UART1"),
-        ("CFG-MSGOUT-PUBX_ID_POLYP_UART2", 0x209100ee, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX00 message on port UART2"),
-        ("CFG-MSGOUT-PUBX_ID_POLYP_USB", 0x209100ef, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX00 message on port USB"),
-        ("CFG-MSGOUT-PUBX_ID_POLYS_I2C", 0x209100f1, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX03 message on port I2C"),
-        ("CFG-MSGOUT-PUBX_ID_POLYS_SPI", 0x209100f5, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX03 message on port SPI"),
-        ("CFG-MSGOUT-PUBX_ID_POLYS_UART1", 0x209100f2, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX03 message on port UART1"),
-        ("CFG-MSGOUT-PUBX_ID_POLYS_UART2", 0x209100f3, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX03 message on port UART2"),
-        ("CFG-MSGOUT-PUBX_ID_POLYS_USB", 0x209100f4, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX03 message on port USB"),
-        ("CFG-MSGOUT-PUBX_ID_POLYT_I2C", 0x209100f6, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX04 message on port I2C"),
-        ("CFG-MSGOUT-PUBX_ID_POLYT_SPI", 0x209100fa, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX04 message on port SPI"),
-        ("CFG-MSGOUT-PUBX_ID_POLYT_UART1", 0x209100f7, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX04 message on port UART1"),
-        ("CFG-MSGOUT-PUBX_ID_POLYT_UART2", 0x209100f8, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX04 message on port UART2"),
-        ("CFG-MSGOUT-PUBX_ID_POLYT_USB", 0x209100f9, "U1", 1, "",
-         "Output rate of the NMEA-GX-PUBX04 message on port USB"),
-        # CFG-MSGOUT-RTCM_3X
-        ("CFG-MSGOUT-RTCM_3X_TYPE1005_I2C", 0x209102bd, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1005 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1005_SPI", 0x209102c1, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1005 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1005_UART1", 0x209102be, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1005 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1005_UART2", 0x209102bf, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1005 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1005_USB", 0x209102c0, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1005 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1074_I2C", 0x2091035e, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1074 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1074_SPI", 0x20910362, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1074 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1074_UART1", 0x2091035f, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1074 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1074_UART2", 0x20910360, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1074 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1074_USB", 0x20910361, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1074 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1077_I2C", 0x209102cc, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1077 message on port I2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1077_SPI", 0x209102d0, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1077 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1077_UART1", 0x209102cd, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1077 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1077_UART2", 0x209102ce, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1077 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1077_USB", 0x209102cf, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1077 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1087_I2C", 0x209102d1, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1087 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1084_SPI", 0x20910367, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1084 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1084_UART1", 0x20910364, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1084 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1084_UART2", 0x20910365, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1084 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1084_USB", 0x20910366, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1084 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1087_SPI", 0x209102d5, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1087 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1087_UART1", 0x209102d2, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1087 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1087_UART2", 0x209102d3, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1087 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1087_USB", 0x209102d4, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1087 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1094_I2C", 0x20910368, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1094 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1094_SPI", 0x2091036c, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1094 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1094_UART1", 0x20910369, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1094 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1094_UART2", 0x2091036a, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1094 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1094_USB", 0x2091036b, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1094 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1097_I2C", 0x20910318, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1097 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1097_SPI", 0x2091031c, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1097 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1097_UART1", 0x20910319, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1097 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1097_UART2", 0x2091031a, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1097 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1097_USB", 0x2091031b, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1097 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1124_I2C", 0x2091036d, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1124 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1124_SPI", 0x20910371, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1124 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1124_UART1", 0x2091036e, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1124 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1124_UART2", 0x2091036f, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1124 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1124_USB", 0x20910370, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1124 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1127_I2C", 0x209102d6, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1127 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1127_SPI", 0x209102da, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1127 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1127_UART1", 0x209102d7, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1127 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1127_UART2", 0x209102d8, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1127 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1127_USB", 0x209102d9, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1127 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1230_I2C", 0x20910303, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1230 message on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1230_SPI", 0x20910307, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1230 message on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1230_UART1", 0x20910304, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1230 message on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1230_UART2", 0x20910305, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1230 message on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE1230_USB", 0x20910306, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE1230 message on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_0_I2C", 0x209102fe, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 0 message "
-         "on port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_0_SPI", 0x20910302, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 0 message "
-         "on port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_0_UART1", 0x209102ff, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 0 message "
-         "on port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_0_UART2", 0x20910300, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 0 message "
-         "on port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_0_USB", 0x20910301, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 0 message "
-         "on port USB"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_1_I2C", 0x20910381, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 1 message on  "
-         "port I2C"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_1_SPI", 0x20910385, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 1 message on  "
-         "port SPI"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_1_UART1", 0x20910382, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 1 message on  "
-         "port UART1"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_1_UART2", 0x20910383, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 1 message on "
-         " port UART2"),
-        ("CFG-MSGOUT-RTCM_3X_TYPE4072_1_USB", 0x20910384, "U1", 1, "",
-         "Output rate of the RTCM-3X-TYPE4072, sub-type 1 message "
-         "on port USB"),
-        # CFG-MSGOUT-UBX_LOG
-        ("CFG-MSGOUT-UBX_LOG_INFO_I2C", 0x20910259, "U1", 1, "",
-         "Output rate of the UBX-LOG-INFO message on port I2C"),
-        ("CFG-MSGOUT-UBX_LOG_INFO_SPI", 0x2091025d, "U1", 1, "",
-         "Output rate of the UBX-LOG-INFO message on port SPI"),
-        ("CFG-MSGOUT-UBX_LOG_INFO_UART1", 0x2091025a, "U1", 1, "",
-         "Output rate of the UBX-LOG-INFO message on port UART1"),
-        ("CFG-MSGOUT-UBX_LOG_INFO_UART2", 0x2091025b, "U1", 1, "",
-         "Output rate of the UBX-LOG-INFO message on port UART2"),
-        ("CFG-MSGOUT-UBX_LOG_INFO_USB", 0x2091025c, "U1", 1, "",
-         "Output rate of the UBX-LOG-INFO message on port USB"),
-        # CFG-MSGOUT-UBX_MON
-        ("CFG-MSGOUT-UBX_MON_COMMS_I2C", 0x2091034f, "U1", 1, "",
-         "Output rate of the UBX-MON-COMMS message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_COMMS_SPI", 0x20910353, "U1", 1, "",
-         "Output rate of the UBX-MON-COMMS message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_COMMS_UART1", 0x20910350, "U1", 1, "",
-         "Output rate of the UBX-MON-COMMS message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_COMMS_UART2", 0x20910351, "U1", 1, "",
-         "Output rate of the UBX-MON-COMMS message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_COMMS_USB", 0x20910352, "U1", 1, "",
-         "Output rate of the UBX-MON-COMMS message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_HW2_I2C", 0x209101b9, "U1", 1, "",
-         "Output rate of the UBX-MON-HW2 message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_HW2_SPI", 0x209101bd, "U1", 1, "",
-         "Output rate of the UBX-MON-HW2 message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_HW2_UART1", 0x209101ba, "U1", 1, "",
-         "Output rate of the UBX-MON-HW2 message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_HW2_UART2", 0x209101bb, "U1", 1, "",
-         "Output rate of the UBX-MON-HW2 message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_HW2_USB", 0x209101bc, "U1", 1, "",
-         "Output rate of the UBX-MON-HW2 message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_HW3_I2C", 0x20910354, "U1", 1, "",
-         "Output rate of the UBX-MON-HW3 message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_HW3_SPI", 0x20910358, "U1", 1, "",
-         "Output rate of the UBX-MON-HW3 message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_HW3_UART1", 0x20910355, "U1", 1, "",
-         "Output rate of the UBX-MON-HW3 message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_HW3_UART2", 0x20910356, "U1", 1, "",
-         "Output rate of the UBX-MON-HW3 message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_HW3_USB", 0x20910357, "U1", 1, "",
-         "Output rate of the UBX-MON-HW3 message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_HW_I2C", 0x209101b4, "U1", 1, "",
-         "Output rate of the UBX-MON-HW message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_HW_SPI", 0x209101b8, "U1", 1, "",
-         "Output rate of the UBX-MON-HW message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_HW_UART1", 0x209101b5, "U1", 1, "",
-         "Output rate of the UBX-MON-HW message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_HW_UART2", 0x209101b6, "U1", 1, "",
-         "Output rate of the UBX-MON-HW message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_HW_USB", 0x209101b7, "U1", 1, "",
-         "Output rate of the UBX-MON-HW message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_IO_I2C", 0x209101a5, "U1", 1, "",
-         "Output rate of the UBX-MON-IO message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_IO_SPI", 0x209101a9, "U1", 1, "",
-         "Output rate of the UBX-MON-IO message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_IO_UART1", 0x209101a6, "U1", 1, "",
-         "Output rate of the UBX-MON-IO message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_IO_UART2", 0x209101a7, "U1", 1, "",
-         "Output rate of the UBX-MON-IO message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_IO_USB", 0x209101a8, "U1", 1, "",
-         "Output rate of the UBX-MON-IO message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_MSGPP_I2C", 0x20910196, "U1", 1, "",
-         "Output rate of the UBX-MON-MSGPP message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_MSGPP_SPI", 0x2091019a, "U1", 1, "",
-         "Output rate of the UBX-MON-MSGPP message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_MSGPP_UART1", 0x20910197, "U1", 1, "",
-         "Output rate of the UBX-MON-MSGPP message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_MSGPP_UART2", 0x20910198, "U1", 1, "",
-         "Output rate of the UBX-MON-MSGPP message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_MSGPP_USB", 0x20910199, "U1", 1, "",
-         "Output rate of the UBX-MON-MSGPP message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_RF_I2C", 0x20910359, "U1", 1, "",
-         "Output rate of the UBX-MON-RF message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_RF_SPI", 0x2091035d, "U1", 1, "",
-         "Output rate of the UBX-MON-RF message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_RF_UART1", 0x2091035a, "U1", 1, "",
-         "Output rate of the UBX-MON-RF message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_RF_UART2", 0x2091035b, "U1", 1, "",
-         "Output rate of the UBX-MON-RF message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_RF_USB", 0x2091035c, "U1", 1, "",
-         "Output rate of the UBX-MON-RF message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_RXBUF_I2C", 0x209101a0, "U1", 1, "",
-         "Output rate of the UBX-MON-RXBUF message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_RXBUF_SPI", 0x209101a4, "U1", 1, "",
-         "Output rate of the UBX-MON-RXBUF message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_RXBUF_UART1", 0x209101a1, "U1", 1, "",
-         "Output rate of the UBX-MON-RXBUF message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_RXBUF_UART2", 0x209101a2, "U1", 1, "",
-         "Output rate of the UBX-MON-RXBUF message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_RXBUF_USB", 0x209101a3, "U1", 1, "",
-         "Output rate of the UBX-MON-RXBUF message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_RXR_I2C", 0x20910187, "U1", 1, "",
-         "Output rate of the UBX-MON-RXR message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_RXR_SPI", 0x2091018b, "U1", 1, "",
-         "Output rate of the UBX-MON-RXR message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_RXR_UART1", 0x20910188, "U1", 1, "",
-         "Output rate of the UBX-MON-RXR message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_RXR_UART2", 0x20910189, "U1", 1, "",
-         "Output rate of the UBX-MON-RXR message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_RXR_USB", 0x2091018a, "U1", 1, "",
-         "Output rate of the UBX-MON-RXR message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_I2C", 0x2091019b, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_SPI", 0x2091019f, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_UART1", 0x2091019c, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_UART2", 0x2091019d, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_USB", 0x2091019e, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port USB"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_I2C", 0x2091019b, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port I2C"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_SPI", 0x2091019f, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port SPI"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_UART1", 0x2091019c, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port UART1"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_UART2", 0x2091019d, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port UART2"),
-        ("CFG-MSGOUT-UBX_MON_TXBUF_USB", 0x2091019e, "U1", 1, "",
-         "Output rate of the UBX-MON-TXBUF message on port USB"),
-        # CFG-MSGOUT-UBX_NAV
-        ("CFG-MSGOUT-UBX_NAV_CLOCK_I2C", 0x20910065, "U1", 1, "",
-         "Output rate of the UBX-NAV-CLOCK message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_CLOCK_SPI", 0x20910069, "U1", 1, "",
-         "Output rate of the UBX-NAV-CLOCK message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_CLOCK_UART1", 0x20910066, "U1", 1, "",
-         "Output rate of the UBX-NAV-CLOCK message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_CLOCK_UART2", 0x20910067, "U1", 1, "",
-         "Output rate of the UBX-NAV-CLOCK message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_CLOCK_USB", 0x20910068, "U1", 1, "",
-         "Output rate of the UBX-NAV- CLOCK message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_DOP_I2C", 0x20910038, "U1", 1, "",
-         "Output rate of the UBX-NAV-DOP message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_DOP_SPI", 0x2091003c, "U1", 1, "",
-         "Output rate of the UBX-NAV-DOP message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_DOP_UART1", 0x20910039, "U1", 1, "",
-         "Output rate of the UBX-NAV-DOP message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_DOP_UART2", 0x2091003a, "U1", 1, "",
-         "Output rate of the UBX-NAV-DOP message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_DOP_USB", 0x2091003b, "U1", 1, "",
-         "Output rate of the UBX-NAV-DOP message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_EOE_I2C", 0x2091015f, "U1", 1, "",
-         "Output rate of the UBX-NAV-EOE message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_EOE_SPI", 0x20910163, "U1", 1, "",
-         "Output rate of the UBX-NAV-EOE message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_EOE_UART1", 0x20910160, "U1", 1, "",
-         "Output rate of the UBX-NAV-EOE message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_EOE_UART2", 0x20910161, "U1", 1, "",
-         "Output rate of the UBX-NAV-EOE message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_EOE_USB", 0x20910162, "U1", 1, "",
-         "Output rate of the UBX-NAV-EOE message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_GEOFENCE_I2C", 0x209100a1, "U1", 1, "",
-         "Output rate of the UBX-NAV-GEOFENCE message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_GEOFENCE_SPI", 0x209100a5, "U1", 1, "",
-         "Output rate of the UBX-NAV-GEOFENCE message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_GEOFENCE_UART1", 0x209100a2, "U1", 1, "",
-         "Output rate of the UBX-NAV-GEOFENCE message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_GEOFENCE_UART2", 0x209100a3, "U1", 1, "",
-         "Output rate of the UBX-NAV-GEOFENCE message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_GEOFENCE_USB", 0x209100a4, "U1", 1, "",
-         "Output rate of the UBX-NAV- GEOFENCE message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSECEF_I2C", 0x2091002e, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSECEF message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSECEF_SPI", 0x20910032, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSECEF message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSECEF_UART1", 0x2091002f, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSECEF message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSECEF_UART2", 0x20910030, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSECEF message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSECEF_USB", 0x20910031, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSECEF message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSLLH_I2C", 0x20910033, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSLLH message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSLLH_SPI", 0x20910037, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSLLH message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSLLH_UART1", 0x20910034, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSLLH message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSLLH_UART2", 0x20910035, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSLLH message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_HPPOSLLH_USB", 0x20910036, "U1", 1, "",
-         "Output rate of the UBX-NAV-HPPOSLLH message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_ODO_I2C", 0x2091007e, "U1", 1, "",
-         "Output rate of the UBX-NAV-ODO message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_ODO_SPI", 0x20910082, "U1", 1, "",
-         "Output rate of the UBX-NAV-ODO message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_ODO_UART1", 0x2091007f, "U1", 1, "",
-         "Output rate of the UBX-NAV-ODO message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_ODO_UART2", 0x20910080, "U1", 1, "",
-         "Output rate of the UBX-NAV-ODO message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_ODO_USB", 0x20910081, "U1", 1, "",
-         "Output rate of the UBX-NAV-ODO message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_ORB_I2C", 0x20910010, "U1", 1, "",
-         "Output rate of the UBX-NAV-ORB message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_ORB_SPI", 0x20910014, "U1", 1, "",
-         "Output rate of the UBX-NAV-ORB message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_ORB_UART1", 0x20910011, "U1", 1, "",
-         "Output rate of the UBX-NAV-ORB message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_ORB_UART2", 0x20910012, "U1", 1, "",
-         "Output rate of the UBX-NAV-ORB message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_ORB_USB", 0x20910013, "U1", 1, "",
-         "Output rate of the UBX-NAV-ORB message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_POSECEF_I2C", 0x20910024, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSECEF message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_POSECEF_SPI", 0x20910028, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSECEF message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_POSECEF_UART1", 0x20910025, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSECEF message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_POSECEF_UART2", 0x20910026, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSECEF message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_POSECEF_USB", 0x20910027, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSECEF message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_POSLLH_I2C", 0x20910029, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSLLH message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_POSLLH_SPI", 0x2091002d, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSLLH message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_POSLLH_UART1", 0x2091002a, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSLLH message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_POSLLH_UART2", 0x2091002b, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSLLH message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_POSLLH_USB", 0x2091002c, "U1", 1, "",
-         "Output rate of the UBX-NAV-POSLLH message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_PVT_I2C", 0x20910006, "U1", 1, "",
-         "Output rate of the UBX-NAV-PVT message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_PVT_SPI", 0x2091000a, "U1", 1, "",
-         "Output rate of the UBX-NAV-PVT message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_PVT_UART1", 0x20910007, "U1", 1, "",
-         "Output rate of the UBX-NAV-PVT message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_PVT_UART2", 0x20910008, "U1", 1, "",
-         "Output rate of the UBX-NAV-PVT message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_PVT_USB", 0x20910009, "U1", 1, "",
-         "Output rate of the UBX-NAV-PVT message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_RELPOSNED_I2C", 0x2091008d, "U1", 1, "",
-         "Output rate of the UBX-NAV-RELPOSNED message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_RELPOSNED_SPI", 0x20910091, "U1", 1, "",
-         "Output rate of the UBX-NAV-RELPOSNED message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_RELPOSNED_UART1", 0x2091008e, "U1", 1, "",
-         "Output rate of the UBX-NAV-RELPOSNED message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_RELPOSNED_UART2", 0x2091008f, "U1", 1, "",
-         "Output rate of the UBX-NAV-RELPOSNED message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_RELPOSNED_USB", 0x20910090, "U1", 1, "",
-         "Output rate of the UBX-NAV-RELPOSNED message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_SAT_I2C", 0x20910015, "U1", 1, "",
-         "Output rate of the UBX-NAV-SAT message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_SAT_SPI", 0x20910019, "U1", 1, "",
-         "Output rate of the UBX-NAV-SAT message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_SAT_UART1", 0x20910016, "U1", 1, "",
-         "Output rate of the UBX-NAV-SAT message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_SAT_UART2", 0x20910017, "U1", 1, "",
-         "Output rate of the UBX-NAV-SAT message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_SAT_USB", 0x20910018, "U1", 1, "",
-         "Output rate of the UBX-NAV-SAT message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_SBAS_I2C", 0x2091006a, "U1", 1, "",
-         "Output rate of the UBX-NAV-SBAS message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_SBAS_SPI", 0x2091006e, "U1", 1, "",
-         "Output rate of the UBX-NAV-SBAS message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_SBAS_UART1", 0x2091006b, "U1", 1, "",
-         "Output rate of the UBX-NAV-SBAS message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_SBAS_UART2", 0x2091006c, "U1", 1, "",
-         "Output rate of the UBX-NAV-SBAS message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_SBAS_USB", 0x2091006d, "U1", 1, "",
-         "Output rate of the UBX-NAV-SBAS message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_SIG_I2C", 0x20910345, "U1", 1, "",
-         "Output rate of the UBX-NAV-SIG message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_SIG_SPI", 0x20910349, "U1", 1, "",
-         "Output rate of the UBX-NAV-SIG message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_SIG_UART1", 0x20910346, "U1", 1, "",
-         "Output rate of the UBX-NAV-SIG message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_SIG_UART2", 0x20910347, "U1", 1, "",
-         "Output rate of the UBX-NAV-SIG message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_SIG_USB", 0x20910348, "U1", 1, "",
-         "Output rate of the UBX-NAV-SIG message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_STATUS_I2C", 0x2091001a, "U1", 1, "",
-         "Output rate of the UBX-NAV-STATUS message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_STATUS_SPI", 0x2091001e, "U1", 1, "",
-         "Output rate of the UBX-NAV-STATUS message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_STATUS_UART1", 0x2091001b, "U1", 1, "",
-         "Output rate of the UBX-NAV-STATUS message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_STATUS_UART2", 0x2091001c, "U1", 1, "",
-         "Output rate of the UBX-NAV-STATUS message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_STATUS_USB", 0x2091001d, "U1", 1, "",
-         "Output rate of the UBX-NAV-STATUS message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_SVIN_I2C", 0x20910088, "U1", 1, "",
-         "Output rate of the UBX-NAV-SVIN message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_SVIN_SPI", 0x2091008c, "U1", 1, "",
-         "Output rate of the UBX-NAV-SVIN message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_SVIN_UART1", 0x20910089, "U1", 1, "",
-         "Output rate of the UBX-NAV-SVIN message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_SVIN_UART2", 0x2091008a, "U1", 1, "",
-         "Output rate of the UBX-NAV-SVIN message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_SVIN_USB", 0x2091008b, "U1", 1, "",
-         "Output rate of the UBX-NAV-SVIN message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEBDS_I2C", 0x20910051, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEBDS message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEBDS_SPI", 0x20910055, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEBDS message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEBDS_UART1", 0x20910052, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEBDS message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEBDS_UART2", 0x20910053, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEBDS message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEBDS_USB", 0x20910054, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEBDS message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGAL_I2C", 0x20910056, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGAL message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGAL_SPI", 0x2091005a, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGAL message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGAL_UART1", 0x20910057, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGAL message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGAL_UART2", 0x20910058, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGAL message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGAL_USB", 0x20910059, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGAL message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGLO_I2C", 0x2091004c, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGLO message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGLO_SPI", 0x20910050, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGLO message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGLO_UART1", 0x2091004d, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGLO message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGLO_UART2", 0x2091004e, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGLO message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGLO_USB", 0x2091004f, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGLO message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGPS_I2C", 0x20910047, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGPS message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGPS_SPI", 0x2091004b, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGPS message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGPS_UART1", 0x20910048, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGPS message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGPS_UART2", 0x20910049, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGPS message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEGPS_USB", 0x2091004a, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEGPS message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMELS_I2C", 0x20910060, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMELS message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMELS_SPI", 0x20910064, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMELS message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_TIMELS_UART1", 0x20910061, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMELS message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMELS_UART2", 0x20910062, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMELS message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMELS_USB", 0x20910063, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMELS message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEUTC_I2C", 0x2091005b, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEUTC message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEUTC_SPI", 0x2091005f, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEUTC message on port S"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEUTC_UART1", 0x2091005c, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEUTC message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEUTC_UART2", 0x2091005d, "U1", 1, "",
-         "Output rate of the UBX-NAV-TIMEUTC message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_TIMEUTC_USB", 0x2091005e, "U1", 1, "",
-         "Output rate of the UBX-NAV- TIMEUTC message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_VELECEF_I2C", 0x2091003d, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELECEF message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_VELECEF_SPI", 0x20910041, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELECEF message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_VELECEF_UART1", 0x2091003e, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELECEF message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_VELECEF_UART2", 0x2091003f, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELECEF message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_VELECEF_USB", 0x20910040, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELECEF message on port USB"),
-        ("CFG-MSGOUT-UBX_NAV_VELNED_I2C", 0x20910042, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELNED message on port I2C"),
-        ("CFG-MSGOUT-UBX_NAV_VELNED_SPI", 0x20910046, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELNED message on port SPI"),
-        ("CFG-MSGOUT-UBX_NAV_VELNED_UART1", 0x20910043, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELNED message on port UART1"),
-        ("CFG-MSGOUT-UBX_NAV_VELNED_UART2", 0x20910044, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELNED message on port UART2"),
-        ("CFG-MSGOUT-UBX_NAV_VELNED_USB", 0x20910045, "U1", 1, "",
-         "Output rate of the UBX-NAV-VELNED message on port USB"),
-        # CFG-MSGOUT-UBX_RXM
-        ("CFG-MSGOUT-UBX_RXM_MEASX_I2C", 0x20910204, "U1", 1, "",
-         "Output rate of the UBX-RXM-MEASX message on port I2C"),
-        ("CFG-MSGOUT-UBX_RXM_MEASX_SPI", 0x20910208, "U1", 1, "",
-         "Output rate of the UBX-RXM-MEASX message on port SPI"),
-        ("CFG-MSGOUT-UBX_RXM_MEASX_UART1", 0x20910205, "U1", 1, "",
-         "Output rate of the UBX-RXM-MEASX message on port UART1"),
-        ("CFG-MSGOUT-UBX_RXM_MEASX_UART2", 0x20910206, "U1", 1, "",
-         "Output rate of the UBX-RXM-MEASX message on port UART2"),
-        ("CFG-MSGOUT-UBX_RXM_MEASX_USB", 0x20910207, "U1", 1, "",
-         "Output rate of the UBX-RXM-MEASX message on port USB"),
-        ("CFG-MSGOUT-UBX_RXM_RAWX_I2C", 0x209102a4, "U1", 1, "",
-         "Output rate of the UBX-RXM-RAWX message on port I2C"),
-        ("CFG-MSGOUT-UBX_RXM_RAWX_SPI", 0x209102a8, "U1", 1, "",
-         "Output rate of the UBX-RXM-RAWX message on port SPI"),
-        ("CFG-MSGOUT-UBX_RXM_RAWX_UART1", 0x209102a5, "U1", 1, "",
-         "Output rate of the UBX-RXM-RAWX message on port UART1"),
-        ("CFG-MSGOUT-UBX_RXM_RAWX_UART2", 0x209102a6, "U1", 1, "",
-         "Output rate of the UBX-RXM-RAWX message on port UART2"),
-        ("CFG-MSGOUT-UBX_RXM_RAWX_USB", 0x209102a7, "U1", 1, "",
-         "Output rate of the UBX-RXM-RAWX message on port USB"),
-        ("CFG-MSGOUT-UBX_RXM_RLM_I2C", 0x2091025e, "U1", 1, "",
-         "Output rate of the UBX-RXM-RLM message on port I2C"),
-        ("CFG-MSGOUT-UBX_RXM_RLM_SPI", 0x20910262, "U1", 1, "",
-         "Output rate of the UBX-RXM-RLM message on port SPI"),
-        ("CFG-MSGOUT-UBX_RXM_RLM_UART1", 0x2091025f, "U1", 1, "",
-         "Output rate of the UBX-RXM-RLM message on port UART1"),
-        ("CFG-MSGOUT-UBX_RXM_RLM_UART2", 0x20910260, "U1", 1, "",
-         "Output rate of the UBX-RXM-RLM message on port UART2"),
-        ("CFG-MSGOUT-UBX_RXM_RLM_USB", 0x20910261, "U1", 1, "",
-         "Output rate of the UBX-RXM-RLM message on port USB"),
-        ("CFG-MSGOUT-UBX_RXM_RTCM_I2C", 0x20910268, "U1", 1, "",
-         "Output rate of the UBX-RXM-RTCM message on port I2C"),
-        ("CFG-MSGOUT-UBX_RXM_RTCM_SPI", 0x2091026c, "U1", 1, "",
-         "Output rate of the UBX-RXM-RTCM message on port SPI"),
-        ("CFG-MSGOUT-UBX_RXM_RTCM_UART1", 0x20910269, "U1", 1, "",
-         "Output rate of the UBX-RXM-RTCM message on port UART1"),
-        ("CFG-MSGOUT-UBX_RXM_RTCM_UART2", 0x2091026a, "U1", 1, "",
-         "Output rate of the UBX-RXM-RTCM message on port UART2"),
-        ("CFG-MSGOUT-UBX_RXM_RTCM_USB", 0x2091026b, "U1", 1, "",
-         "Output rate of the UBX-RXM-RTCM message on port USB"),
-        ("CFG-MSGOUT-UBX_RXM_SFRBX_I2C", 0x20910231, "U1", 1, "",
-         "Output rate of the UBX-RXM-SFRBX message on port I2C"),
-        ("CFG-MSGOUT-UBX_RXM_SFRBX_SPI", 0x20910235, "U1", 1, "",
-         "Output rate of the UBX-RXM-SFRBX message on port SPI"),
-        ("CFG-MSGOUT-UBX_RXM_SFRBX_UART1", 0x20910232, "U1", 1, "",
-         "Output rate of the UBX-RXM-SFRBX message on port UART1"),
-        ("CFG-MSGOUT-UBX_RXM_SFRBX_UART2", 0x20910233, "U1", 1, "",
-         "Output rate of the UBX-RXM-SFRBX message on port UART2"),
-        ("CFG-MSGOUT-UBX_RXM_SFRBX_USB", 0x20910234, "U1", 1, "",
-         "Output rate of the UBX-RXM-SFRBX message on port USB"),
-        # CFG-MSGOUT-UBX_TIM
-        ("CFG-MSGOUT-UBX_TIM_SVIN_I2C", 0x20910097, "U1", 1, "",
-         "Output rate of the UBX-TIM-SVIN message on port I2C"),
-        ("CFG-MSGOUT-UBX_TIM_SVIN_SPI", 0x2091009b, "U1", 1, "",
-         "Output rate of the UBX-TIM-SVIN message on port SPI"),
-        ("CFG-MSGOUT-UBX_TIM_SVIN_UART1", 0x20910098, "U1", 1, "",
-         "Output rate of the UBX-TIM-SVIN message on port UART1"),
-        ("CFG-MSGOUT-UBX_TIM_SVIN_UART2", 0x20910099, "U1", 1, "",
-         "Output rate of the UBX-TIM-SVIN message on port UART2"),
-        ("CFG-MSGOUT-UBX_TIM_SVIN_USB", 0x2091009a, "U1", 1, "",
-         "Output rate of the UBX-TIM-SVIN message on port USB"),
-        ("CFG-MSGOUT-UBX_TIM_TM2_I2C", 0x20910178, "U1", 1, "",
-         "Output rate of the UBX-TIM-TM2 message on port I2C"),
-        ("CFG-MSGOUT-UBX_TIM_TM2_SPI", 0x2091017c, "U1", 1, "",
-         "Output rate of the UBX-TIM-TM2 message on port SPI"),
-        ("CFG-MSGOUT-UBX_TIM_TM2_UART1", 0x20910179, "U1", 1, "",
-         "Output rate of the UBX-TIM-TM2 message on port UART1"),
-        ("CFG-MSGOUT-UBX_TIM_TM2_UART2", 0x2091017a, "U1", 1, "",
-         "Output rate of the UBX-TIM-TM2 message on port UART2"),
-        ("CFG-MSGOUT-UBX_TIM_TM2_USB", 0x2091017b, "U1", 1, "",
-         "Output rate of the UBX-TIM-TM2 message on port USB"),
-        ("CFG-MSGOUT-UBX_TIM_TP_I2C", 0x2091017d, "U1", 1, "",
-         "Output rate of the UBX-TIM-TP message on port I2C"),
-        ("CFG-MSGOUT-UBX_TIM_TP_SPI", 0x20910181, "U1", 1, "",
-         "Output rate of the UBX-TIM-TP message on port SPI"),
-        ("CFG-MSGOUT-UBX_TIM_TP_UART1", 0x2091017e, "U1", 1, "",
-         "Output rate of the UBX-TIM-TP message on port UART1"),
-        ("CFG-MSGOUT-UBX_TIM_TP_UART2", 0x2091017f, "U1", 1, "",
-         "Output rate of the UBX-TIM-TP message on port UART2"),
-        ("CFG-MSGOUT-UBX_TIM_TP_USB", 0x20910180, "U1", 1, "",
-         "Output rate of the UBX-TIM-TP message on port USB"),
-        ("CFG-MSGOUT-UBX_TIM_VRFY_I2C", 0x20910092, "U1", 1, "",
-         "Output rate of the UBX-TIM-VRFY message on port I2C"),
-        ("CFG-MSGOUT-UBX_TIM_VRFY_SPI", 0x20910096, "U1", 1, "",
-         "Output rate of the UBX-TIM-VRFY message on port SPI"),
-        ("CFG-MSGOUT-UBX_TIM_VRFY_UART1", 0x20910093, "U1", 1, "",
-         "Output rate of the UBX-TIM-VRFY message on port UART1"),
-        ("CFG-MSGOUT-UBX_TIM_VRFY_UART2", 0x20910094, "U1", 1, "",
-         "Output rate of the UBX-TIM-VRFY message on port UART2"),
-        ("CFG-MSGOUT-UBX_TIM_VRFY_USB", 0x20910095, "U1", 1, "",
-         "Output rate of the UBX-TIM-VRFY message on port USB"),
-        # CFG-NAVHPG-
-        ("CFG-NAVHPG-DGNSSMODE", 0x20140011, "E1", 1, "",
-         "Differential corrections mode"),
-        # CFG-NAVSPG-
-        ("CFG-NAVSPG-FIXMODE", 0x20110011, "E1", 1, "",
-         "Position fix mode"),
-        ("CFG-NAVSPG-INIFIX3D", 0x10110013, "L", 1, "",
-         "Initial fix must be a 3d fix"),
-        ("CFG-NAVSPG-WKNROLLOVER", 0x30110017, "U2", 1, "",
-         "GPS week rollover number"),
-        ("CFG-NAVSPG-USE_PPP", 0x10110019, "L", 1, "",
-         "Use Precise Point Positioning"),
-        ("CFG-NAVSPG-UTCSTANDARD", 0x2011001c, "E1", 1, "",
-         "UTC standard to be used"),
-        ("CFG-NAVSPG-DYNMODEL", 0x20110021, "E1", 1, "",
-         "Dynamic platform model"),
-        ("CFG-NAVSPG-ACKAIDING", 0x10110025, "L", 1, "",
-         "Acknowledge assistance input messages"),
-        ("CFG-NAVSPG-USE_USRDAT", 0x10110061, "L", 1, "",
-         "Use user geodetic datum"),
-        ("CFG-NAVSPG-USRDAT_MAJA", 0x50110062, "R8", 1, "m",
-         "Geodetic datum semi-major axis"),
-        ("CFG-NAVSPG-USRDAT_FLAT", 0x50110063, "R8", 1, "",
-         "Geodetic datum 1.0 / flattening"),
-        ("CFG-NAVSPG-USRDAT_DX", 0x40110064, "R4", 1, "m",
-         "Geodetic datum X axis shift at the orgin"),
-        ("CFG-NAVSPG-USRDAT_DY", 0x40110065, "R4", 1, "m",
-         "Geodetic datum Y axis shift at the origin"),
-        ("CFG-NAVSPG-USRDAT_DZ", 0x40110066, "R4", 1, "m",
-         "Geodetic datum Z axis shift at the origin"),
-        ("CFG-NAVSPG-USRDAT_ROTX", 0x40110067, "R4", 1, "arcsec",
-         "Geodetic datum rotation about the X axis"),
-        ("CFG-NAVSPG-USRDAT_ROTY", 0x40110068, "R4", 1, "arcsec",
-         "Geodetic datum rotation about the Y axis ()"),
-        ("CFG-NAVSPG-USRDAT_ROTZ", 0x40110069, "R4", 1, "arcsec",
-         "Geodetic datum rotation about the Z axis"),
-        ("CFG-NAVSPG-USRDAT_SCALE", 0x4011006a, "R4", 1, "ppm",
-         "Geodetic datum scale factor"),
-        ("CFG-NAVSPG-INFIL_MINSVS", 0x201100a1, "U1", 1, "",
-         "Minimum number of satellites for navigation"),
-        ("CFG-NAVSPG-INFIL_MAXSVS", 0x201100a2, "U1", 1, "",
-         "Maximum number of satellites for navigation"),
-        ("CFG-NAVSPG-INFIL_MINCNO", 0x201100a3, "U1", 1, "dBHz",
-         "Minimum satellite signal level for navigation"),
-        ("CFG-NAVSPG-INFIL_MINELEV", 0x201100a4, "I1", 1, "deg",
-         "Minimum elevation for a GNSS satellite to be used in navigation"),
-        ("CFG-NAVSPG-INFIL_NCNOTHRS", 0x201100aa, "U1", 1, "",
-         "Number of satellites required to have C/N0 above "
-         "CFG-NAVSPG-INFIL_CNOTHRS for a fix to be attempted"),
-        ("CFG-NAVSPG-INFIL_CNOTHRS", 0x201100ab, "U1", 1, "",
-         "C/N0 threshold for deciding whether to attempt a fix"),
-        ("CFG-NAVSPG-OUTFIL_PDOP", 0x301100b1, "U2", 0.1, "",
-         "Output filter position DOP mask (threshold)"),
-        ("CFG-NAVSPG-OUTFIL_TDOP", 0x301100b2, "U2", 0.11, "",
-         "Output filter time DOP mask (threshold)"),
-        ("CFG-NAVSPG-OUTFIL_PACC", 0x301100b3, "U2", 1, "m",
-         "Output filter position accuracy mask (threshold)"),
-        ("CFG-NAVSPG-OUTFIL_TACC", 0x301100b4, "U2", 1, "m",
-         "Output filter time accuracy mask (threshold)"),
-        ("CFG-NAVSPG-OUTFIL_FACC", 0x301100b5, "U2", 0.01, "m/s",
-         "Output filter frequency accuracy mask (threshold)"),
-        ("CFG-NAVSPG-CONSTR_ALT", 0x401100c1, "I4", 0.01, "m",
-         "Fixed altitude (mean sea level) for 2D fix mode"),
-        ("CFG-NAVSPG-CONSTR_ALTVAR", 0x401100c2, "U4", 0.0001, "M^2",
-         "Fixed altitude variance for 2D mode"),
-        ("CFG-NAVSPG-CONSTR_DGNSSTO", 0x201100c4, "U1", 1, "s",
-         "DGNSS timeout"),
-        # CFG-NMEA-
-        ("CFG-NMEA-PROTVER", 0x20930001, "E1", 1, "",
-         "NMEA protocol version"),
-        ("CFG-NMEA-MAXSVS", 0x20930002, "E1", 1, "",
-         "Maximum number of SVs to report per Talker ID"),
-        ("CFG-NMEA-COMPAT", 0x10930003, "L", 1, "",
-         "Enable compatibility mode"),
-        ("CFG-NMEA-CONSIDER", 0x10930004, "L", 1, "",
-         "Enable considering mode"),
-        ("CFG-NMEA-LIMIT82", 0x10930005, "L", 1, "",
-         "Enable strict limit to 82 characters maximum NMEA message length"),
-        ("CFG-NMEA-HIGHPREC", 0x10930006, "L", 1, "",
-         "Enable high precision mode"),
-        ("CFG-NMEA-SVNUMBERING", 0x20930007, "E1", 1, "",
-         "Display configuration for SVs that have no value defined in NMEA"),
-        ("CFG-NMEA-FILT_GPS", 0x10930011, "L", 1, "",
-         "Disable reporting of GPS satellites"),
-        ("CFG-NMEA-FILT_SBAS", 0x10930012, "L", 1, "",
-         "Disable reporting of SBAS satellites"),
-        ("CFG-NMEA-FILT_QZSS", 0x10930015, "L", 1, "",
-         "Disable reporting of QZSS satellites"),
-        ("CFG-NMEA-FILT_GLO", 0x10930016, "L", 1, "",
-         "Disable reporting of GLONASS satellites"),
-        ("CFG-NMEA-FILT_BDS", 0x10930017, "L", 1, "",
-         "Disable reporting of BeiDou satellites"),
-        ("CFG-NMEA-OUT_INVFIX", 0x10930021, "L", 1, "",
-         "Enable position output for failed or invalid fixes"),
-        ("CFG-NMEA-OUT_MSKFIX", 0x10930022, "L", 1, "",
-         "Enable position output for invalid fixes"),
-        ("CFG-NMEA-OUT_INVTIME", 0x10930023, "L", 1, "",
-         "Enable time output for invalid times"),
-        ("CFG-NMEA-OUT_INVDATE", 0x10930024, "L", 1, "",
-         "Enable date output for invalid dates"),
-        ("CFG-NMEA-OUT_ONLYGPS", 0x10930025, "L", 1, "",
-         "Restrict output to GPS satellites only"),
-        ("CFG-NMEA-OUT_FROZENCOG", 0x10930026, "L", 1, "",
-         "Enable course over ground output even if it is frozen"),
-        ("CFG-NMEA-MAINTALKERID", 0x20930031, "E1", 1, "",
-         "Main Talker ID"),
-        ("CFG-NMEA-GSVTALKERID", 0x20930032, "E1", 1, "",
-         "Talker ID for GSV NMEA messages"),
-        ("CFG-NMEA-BDSTALKERID", 0x30930033, "U2", 1, "",
-         "BeiDou Talker ID"),
-        # CFG-ODO-
-        ("CFG-ODO-USE_ODO", 0x10220001, "L", 1, "",
-         "Use odometer"),
-        ("CFG-ODO-USE_COG", 0x10220002, "L", 1, "",
-         "Use low-speed course over ground filter"),
-        ("CFG-ODO-OUTLPVEL", 0x10220003, "L", 1, "",
-         "Output low-pass filtered velocity"),
-        ("CFG-ODO-OUTLPCOG", 0x10220004, "L", 1, "",
-         "Output low-pass filtered course over ground (heading)"),
-        ("CFG-ODO-PROFILE", 0x20220005, "E1", 1, "",
-         "Odometer profile configuration"),
-        ("CFG-ODO-COGMAXSPEED", 0x20220021, "U1", 1, "m/s",
-         "Upper speed limit for low-speed course over ground filter"),
-        ("CFG-ODO-COGMAXPOSACC", 0x20220022, "U1", 1, "",
-         "Maximum acceptable position accuracy for computing low-speed  "
-         "filtered course over ground"),
-        ("CFG-ODO-COGLPGAIN", 0x20220032, "", 1, "",
-         "Course over ground low-pass filter level (at speed < 8 m/s)"),
-        ("CFG-ODO-VELLPGAIN", 0x20220031, "U1", 1, "",
-         "Velocity low-pass filter level"),
-        # CFG-RATE-
-        ("CFG-RATE-MEAS", 0x30210001, "U2", 0.001, "s",
-         "Nominal time between GNSS measurements"),
-        ("CFG-RATE-NAV", 0x30210002, "U2", 1, "",
-         "Ratio of number of measurements to number of navigation solutions"),
-        ("CFG-RATE-TIMEREF", 0x20210003, "E1", 1, "",
-         "Time system to which measurements are aligned"),
-        # CFG-RINV-
-        ("CFG-RINV-DUMP", 0x10c70001, "L", 1, "",
-         "Dump data at startup"),
-        ("CFG-RINV-BINARY", 0x10c70002, "L", 1, "",
-         "Data is binary"),
-        ("CFG-RINV-DATA_SIZE", 0x20c70003, "U1", 1, "",
-         "Size of data"),
-        ("CFG-RINV-CHUNK0", 0x50c70004, "X8", 1, "",
-         "Data bytes 1-8 (LSB)"),
-        ("CFG-RINV-CHUNK1", 0x50c70005, "X8", 1, "",
-         "Data bytes 9-16"),
-        ("CFG-RINV-CHUNK2", 0x50c70006, "X8", 1, "",
-         "Data bytes 17-24"),
-        ("CFG-RINV-CHUNK3", 0x50c70007, "X8", 1, "",
-         "Data bytes 25-30 (MSB)"),
-        # CFG-SBAS-
-        ("CFG-SBAS-USE_TESTMODE", 0x10360002, "L", 1, "",
-         "Use SBAS data when it is in test mode"),
-        ("CFG-SBAS-USE_RANGING", 0x10360003, "L", 1, "",
-         "Use SBAS GEOs as a ranging source (for navigation)"),
-        ("CFG-SBAS-USE_DIFFCORR", 0x10360004, "L", 1, "",
-         "Use SBAS differential corrections"),
-        ("CFG-SBAS-USE_INTEGRITY", 0x10360005, "L", 1, "",
-         "Use SBAS integrity information"),
-        ("CFG-SBAS-PRNSCANMASK", 0x50360006, "X8", 1, "",
-         "SBAS PRN search configuration"),
-        # CFG-SIGNAL-
-        ("CFG-SIGNAL-GPS_ENA", 0x1031001f, "L", 1, "",
-         "GPS enable"),
-        ("CFG-SIGNAL-GPS_L1CA_ENA", 0x10310001, "L", 1, "",
-         "GPS L1C/A"),
-        ("CFG-SIGNAL-GPS_L2C_ENA", 0x10310003, "L", 1, "",
-         "GPS L2C"),
-        ("CFG-SIGNAL-SBAS_ENA", 0x10310020, "L", 1, "",
-         "SBAS enable"),
-        ("CFG-SIGNAL-SBAS_L1CA_ENA", 0x10310005, "L", 1, "",
-         "SBAS L1C/A"),
-        ("CFG-SIGNAL-GAL_ENA", 0x10310021, "L", 1, "",
-         "Galileo enable"),
-        ("CFG-SIGNAL-GAL_E1_ENA", 0x10310007, "L", 1, "",
-         "Galileo E1"),
-        ("CFG-SIGNAL-GAL_E5B_ENA", 0x1031000a, "L", 1, "",
-         "Galileo E5b"),
-        ("CFG-SIGNAL-BDS_ENA", 0x10310022, "L", 1, "",
-         "BeiDou Enable"),
-        ("CFG-SIGNAL-BDS_B1_ENA", 0x1031000d, "L", 1, "",
-         "BeiDou B1I"),
-        ("CFG-SIGNAL-BDS_B2_ENA", 0x1031000e, "L", 1, "",
-         "BeiDou B2I"),
-        ("CFG-SIGNAL-QZSS_ENA", 0x10310024, "L", 1, "",
-         "QZSS enable"),
-        ("CFG-SIGNAL-QZSS_L1CA_ENA", 0x10310012, "L", 1, "",
-         "QZSS L1C/A"),
-        ("CFG-SIGNAL-QZSS_L1S_ENA", 0x10310014, "L", 1, "",
-         "QZSS L1S"),
-        ("CFG-SIGNAL-QZSS_L2C_ENA", 0x10310015, "L", 1, "",
-         "QZSS L2C"),
-        ("CFG-SIGNAL-GLO_ENA", 0x10310025, "L", 1, "",
-         "GLONASS enable"),
-        ("CFG-SIGNAL-GLO_L1_ENA", 0x10310018, "L", 1, "",
-         "GLONASS L1"),
-        ("CFG-SIGNAL-GLO_L2_ENA", 0x1031001a, "L", 1, "",
-         "GLONASS L2"),
-        # CFG-SPI-
-        ("CFG-SPI-MAXFF", 0x20640001, "U1", 1, "",
-         "Number of bytes containing 0xFF to receive before "
-         "switching off reception."),
-        ("CFG-SPI-CPOLARITY", 0x10640002, "L", 1, "",
-         "Clock polarity select"),
-        ("CFG-SPI-CPHASE", 0x10640003, "L", 1, "",
-         "Clock phase select"),
-        ("CFG-SPI-EXTENDEDTIMEOUT", 0x10640005, "L", 1, "",
-         "Flag to disable timeouting the interface after 1.5s"),
-        ("CFG-SPI-ENABLED", 0x10640006, "L", 1, "",
-         "Flag to indicate if the SPI interface should be enabled"),
-        # CFG-SPIINPROT-
-        ("CFG-SPIINPROT-UBX", 0x10790001, "L", 1, "",
-         "Flag to indicate if UBX should be an input protocol on SPI"),
-        ("CFG-SPIINPROT-NMEA", 0x10790002, "L", 1, "",
-         "Flag to indicate if NMEA should be an input protocol on SPI"),
-        ("CFG-SPIINPROT-RTCM2X", 0x10790003, "L", 1, "",
-         "Flag to indicate if RTCM2X should be an input protocol on SPI"),
-        ("CFG-SPIINPROT-RTCM3X", 0x10790004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an input protocol on SPI"),
-        # CFG-SPIOUTPROT-
-        ("CFG-SPIOUTPROT-UBX", 0x107a0001, "L", 1, "",
-         "Flag to indicate if UBX should be an output protocol on SPI"),
-        ("CFG-SPIOUTPROT-NMEA", 0x107a0002, "L", 1, "",
-         "Flag to indicate if NMEA should be an output protocol on SPI"),
-        ("CFG-SPIOUTPROT-RTCM3X", 0x107a0004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an output protocol on SPI"),
-        # CFG-TMODE-
-        ("CFG-TMODE-MODE", 0x20030001, "E1", 1, "",
-         "Receiver mode"),
-        ("CFG-TMODE-POS_TYPE", 0x20030002, "E1", 1, "",
-         "Determines whether the ARP position is given in ECEF or "
-         "LAT/LON/HEIGHT?"),
-        ("CFG-TMODE-ECEF_X", 0x40030003, "I4", 1, "cm",
-         "ECEF X coordinate of the ARP position."),
-        ("CFG-TMODE-ECEF_Y", 0x40030004, "I4", 1, "cm",
-         "ECEF Y coordinate of the ARP position."),
-        ("CFG-TMODE-ECEF_Z", 0x40030005, "I4", 1, "cm",
-         "ECEF Z coordinate of the ARP position."),
-        ("CFG-TMODE-ECEF_X_HP", 0x20030006, "I1", 0.1, "mm",
-         "High-precision ECEF X coordinate of the ARP position."),
-        ("CFG-TMODE-ECEF_Y_HP", 0x20030007, "I1", 0.1, "mm",
-         "High-precision ECEF Y coordinate of the ARP position."),
-        ("CFG-TMODE-ECEF_Z_HP", 0x20030008, "I1", 0.1, "mm",
-         "High-precision ECEF Z coordinate of the ARP position."),
-        ("CFG-TMODE-LAT", 0x40030009, "I4", 1e-7, "deg",
-         "Latitude of the ARP position."),
-        ("CFG-TMODE-LON", 0x4003000a, "I4", 1e-7, "deg",
-         "Longitude of the ARP position."),
-        ("CFG-TMODE-HEIGHT", 0x4003000b, "I4", 1, "cm",
-         "Height of the ARP position."),
-        ("CFG-TMODE-LAT_HP", 0x2003000c, "I1", 1e-9, "deg",
-         "High-precision latitude of the ARP position"),
-        ("CFG-TMODE-LON_HP", 0x2003000d, "I1", 1e-9, "deg",
-         "High-precision longitude of the ARP position."),
-        ("CFG-TMODE-HEIGHT_HP", 0x2003000e, "I1", 0.1, "mm",
-         "High-precision height of the ARP position."),
-        ("CFG-TMODE-FIXED_POS_ACC", 0x4003000f, "U4", 0.1, "mm",
-         "Fixed position 3D accuracy"),
-        ("CFG-TMODE-SVIN_MIN_DUR", 0x40030010, "U4", 1, "s",
-         "Survey-in minimum duration"),
-        ("CFG-TMODE-SVIN_ACC_LIMIT", 0x40030011, "U4", 0.1, "mm",
-         "Survey-in position accuracy limit"),
-        # CFG-TP-
-        ("CFG-TP-PULSE_DEF", 0x20050023, "E1", 1, "",
-         "Determines whether the time pulse is interpreted as frequency "
-         "or period?"),
-        ("CFG-TP-PULSE_LENGTH_DEF", 0x20050030, "E1", 1, "",
-         "Determines whether the time pulse length is interpreted as "
-         "length[us] or pulse ratio[%]?"),
-        ("CFG-TP-ANT_CABLEDELAY", 0x30050001, "I2", 0.000000001, "s",
-         "Antenna cable delay"),
-        ("CFG-TP-PERIOD_TP1", 0x40050002, "U4", 0.000001, "s",
-         "Time pulse period (TP1)"),
-        ("CFG-TP-PERIOD_LOCK_TP1", 0x40050003, "U4", 0.000001, "s",
-         "Time pulse period when locked to GNSS time (TP1)"),
-        ("CFG-TP-FREQ_TP1", 0x40050024, "U4", 1, "Hz",
-         "Time pulse frequency (TP1)"),
-        ("CFG-TP-FREQ_LOCK_TP1", 0x40050025, "U4", 1, "Hz",
-         "Time pulse frequency when locked to GNSS time (TP1)"),
-        ("CFG-TP-LEN_TP1", 0x40050004, "U4", 0.000001, "s",
-         "Time pulse length (TP1)"),
-        ("CFG-TP-LEN_LOCK_TP1", 0x40050005, "U4", 0.000001, "s",
-         "Time pulse length when locked to GNSS time (TP1)"),
-        ("CFG-TP-DUTY_TP1", 0x5005002a, "R8", 1, "%",
-         "Time pulse duty cycle (TP1)"),
-        ("CFG-TP-DUTY_LOCK_TP1", 0x5005002b, "R8", 1, "%",
-         "Time pulse duty cycle when locked to GNSS time (TP1)"),
-        ("CFG-TP-USER_DELAY_TP1", 0x40050006, "I4", 0.000000001, "s",
-         "User configurable time pulse delay (TP1)"),
-        ("CFG-TP-TP1_ENA", 0x10050007, "L", 1, "",
-         "Enable the first timepulse"),
-        ("CFG-TP-SYNC_GNSS_TP1", 0x10050008, "L", 1, "",
-         "Sync time pulse to GNSS time or local clock (TP1)"),
-        ("CFG-TP-USE_LOCKED_TP1", 0x10050009, "L", 1, "",
-         "Use locked parameters when possible (TP1)"),
-        ("CFG-TP-ALIGN_TO_TOW_TP1", 0x1005000a, "L", 1, "",
-         "Align time pulse to top of second (TP1)"),
-        ("CFG-TP-POL_TP1", 0x1005000b, "L", 1, "",
-         "Set time pulse polarity (TP1)"),
-        ("CFG-TP-TIMEGRID_TP1", 0x2005000c, "E1", 1, "",
-         "Time grid to use (TP1)"),
-        ("CFG-TP-PERIOD_TP2", 0x4005000d, "U4", 0.000001, "s",
-         "Time pulse period (TP2)"),
-        ("CFG-TP-PERIOD_LOCK_TP2", 0x4005000e, "U4", 0.000001, "s",
-         "Time pulse period when locked to GNSS time (TP2)"),
-        ("CFG-TP-FREQ_TP2", 0x40050026, "U4", 1, "Hz",
-         "Time pulse frequency (TP2)"),
-        ("CFG-TP-FREQ_LOCK_TP2", 0x40050027, "U4", 1, "Hz",
-         "Time pulse frequency when locked to GNSS time (TP2)"),
-        ("CFG-TP-LEN_TP2", 0x4005000f, "U4", 0.000001, "s",
-         "Time pulse length (TP2)"),
-        ("CFG-TP-LEN_LOCK_TP2", 0x40050010, "U4", 0.000001, "s",
-         "Time pulse length when locked to GNSS time (TP2)"),
-        ("CFG-TP-DUTY_TP2", 0x5005002c, "R8", 1, "%",
-         "Time pulse duty cycle (TP2)"),
-        ("CFG-TP-DUTY_LOCK_TP2", 0x5005002d, "R8", 1, "%",
-         "Time pulse duty cycle when locked to GNSS time (TP2)"),
-        ("CFG-TP-USER_DELAY_TP2", 0x40050011, "I4", 0.000000001, "s",
-         "User configurable time pulse delay (TP2)"),
-        ("CFG-TP-TP2_ENA", 0x10050012, "L", 1, "",
-         "Enable the second timepulse"),
-        ("CFG-TP-SYNC_GNSS_TP2", 0x10050013, "L", 1, "",
-         "Sync time pulse to GNSS time or local clock (TP2)"),
-        ("CFG-TP-USE_LOCKED_TP2", 0x10050014, "L", 1, "",
-         "Use locked parameters when possible (TP2)"),
-        ("CFG-TP-ALIGN_TO_TOW_TP2", 0x10050015, "L", 1, "",
-         "Align time pulse to top of second (TP2)"),
-        ("CFG-TP-POL_TP2", 0x10050016, "L", 1, "",
-         "Set time pulse polarity (TP2)"),
-        ("CFG-TP-TIMEGRID_TP2", 0x20050017, "E1", 1, "",
-         "Time grid to use (TP2)"),
-        # CFG-UART1-
-        ("CFG-UART1-BAUDRATE", 0x40520001, "U4", 1, "",
-         "The baud rate that should be configured on the UART1"),
-        ("CFG-UART1-STOPBITS", 0x20520002, "E1", 1, "",
-         "Number of stopbits that should be used on UART1"),
-        ("CFG-UART1-DATABITS", 0x20520003, "E1", 1, "",
-         "Number of databits that should be used on UART1"),
-        ("CFG-UART1-PARITY", 0x20520004, "E1", 1, "",
-         "Parity mode that should be used on UART1"),
-        ("CFG-UART1-ENABLED", 0x10520005, "L", 1, "",
-         "Flag to indicate if the UART1 should be enabled"),
-        # CFG-UART1INPROT
-        ("CFG-UART1INPROT-UBX", 0x10730001, "L", 1, "",
-         "Flag to indicate if UBX should be an input protocol on UART1"),
-        ("CFG-UART1INPROT-NMEA", 0x10730002, "L", 1, "",
-         "Flag to indicate if NMEA should be an input protocol on UART1"),
-        ("CFG-UART1INPROT-RTCM2X", 0x10730003, "L", 1, "",
-         "Flag to indicate if RTCM2X should be an input protocol on UART1"),
-        ("CFG-UART1INPROT-RTCM3X", 0x10730004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an input protocol on UART1"),
-        # CFG-UART1OUTPROT
-        ("CFG-UART1OUTPROT-UBX", 0x10740001, "L", 1, "",
-         "Flag to indicate if UBX should be an output protocol on UART1"),
-        ("CFG-UART1OUTPROT-NMEA", 0x10740002, "L", 1, "",
-         "Flag to indicate if NMEA should be an output protocol on UART1"),
-        ("CFG-UART1OUTPROT-RTCM3X", 0x10740004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an output protocol on UART1"),
-        # CFG-UART2-
-        ("CFG-UART2-BAUDRATE", 0x40530001, "U4", 1, "",
-         "The baud rate that should be configured on the UART2"),
-        ("CFG-UART2-STOPBITS", 0x20530002, "E1", 1, "",
-         "Number of stopbits that should be used on UART2"),
-        ("CFG-UART2-DATABITS", 0x20530003, "E1", "1", "",
-         "Number of databits that should be used on UART2"),
-        ("CFG-UART2-PARITY", 0x20530004, "E1", "1", "",
-         "Parity mode that should be used on UART2"),
-        ("CFG-UART2-ENABLED", 0x10530005, "L", "1", "",
-         "Flag to indicate if the UART2 should be enabled"),
-        ("CFG-UART2-REMAP", 0x10530006, "L", "1", "",
-         "UART2 Remapping"),
-        # CFG-UART1INPROT
-        ("CFG-UART2INPROT-UBX", 0x10750001, "L", 1, "",
-         "Flag to indicate if UBX should be an input protocol on UART2"),
-        ("CFG-UART2INPROT-NMEA", 0x10750002, "L", 1, "",
-         "Flag to indicate if NMEA should be an input protocol on UART2"),
-        ("CFG-UART2INPROT-RTCM2X", 0x10750003, "L", 1, "",
-         "Flag to indicate if RTCM2X should be an input protocol on UART2"),
-        ("CFG-UART2INPROT-RTCM3X", 0x10750004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an input protocol on UART2"),
-        # CFG-UART1OUTPROT
-        ("CFG-UART2OUTPROT-UBX", 0x10760001, "L", 1, "",
-         "Flag to indicate if UBX should be an output protocol on UART2"),
-        ("CFG-UART2OUTPROT-NMEA", 0x10760002, "L", 1, "",
-         "Flag to indicate if NMEA should be an output protocol on UART2"),
-        ("CFG-UART2OUTPROT-RTCM3X", 0x10760004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an output protocol on UART2"),
-        # CFG-USB-
-        ("CFG-USB-ENABLED", 0x10650001, "L", 1, "",
-         "Flag to indicate if the USB interface should be enabled"),
-        ("CFG-USB-SELFPOW", 0x10650002, "L", 1, "",
-         "Self-Powered device"),
-        ("CFG-USB-VENDOR_ID", 0x3065000a, "U2", 1, "",
-         "Vendor ID"),
-        ("CFG-USB-PRODUCT_ID", 0x3065000b, "U2", 1, "",
-         "Product ID"),
-        ("CFG-USB-POWER", 0x3065000c, "U2", 1, "mA",
-         "Power consumption"),
-        ("CFG-USB-VENDOR_STR0", 0x5065000d, "X8", 1, "",
-         "Vendor string characters 0-7"),
-        ("CFG-USB-VENDOR_STR1", 0x5065000e, "X8", 1, "",
-         "Vendor string characters 8-15"),
-        ("CFG-USB-VENDOR_STR2", 0x5065000f, "X8", 1, "",
-         "Vendor string characters 16-23"),
-        ("CFG-USB-VENDOR_STR3", 0x50650010, "X8", 1, "",
-         "Vendor string characters 24-31"),
-        ("CFG-USB-PRODUCT_STR0", 0x50650011, "X8", 1, "",
-         "Product string characters 0-7"),
-        ("CFG-USB-PRODUCT_STR1", 0x50650012, "X8", 1, "",
-         "Product string characters 8-15"),
-        ("CFG-USB-PRODUCT_STR2", 0x50650013, "X8", 1, "",
-         "Product string characters 16-23"),
-        ("CFG-USB-PRODUCT_STR3", 0x50650014, "X8", 1, "",
-         "Product string characters 24-31"),
-        ("CFG-USB-SERIAL_NO_STR0", 0x50650015, "X8", 1, "",
-         "Serial number string characters 0-7"),
-        ("CFG-USB-SERIAL_NO_STR1", 0x50650016, "X8", 1, "",
-         "Serial number string characters 8-15"),
-        ("CFG-USB-SERIAL_NO_STR2", 0x50650017, "X8", 1, "",
-         "Serial number string characters 16-23"),
-        ("CFG-USB-SERIAL_NO_STR3", 0x50650018, "X8", 1, "",
-         "Serial number string characters 24-31"),
-        # CFG-USB-INPROT
-        ("CFG-USBINPROT-UBX", 0x10770001, "L", 1, "",
-         "Flag to indicate if UBX should be an input protocol on USB"),
-        ("CFG-USBINPROT-NMEA", 0x10770002, "L", 1, "",
-         "Flag to indicate if NMEA should be an input protocol on USB"),
-        ("CFG-USBINPROT-RTCM2X", 0x10770003, "L", 1, "",
-         "Flag to indicate if RTCM2X should be an input protocol on USB"),
-        ("CFG-USBINPROT-RTCM3X", 0x10770004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an input protocol on USB"),
-        # CFG-USB-OUTPROT
-        ("CFG-USBOUTPROT-UBX", 0x10780001, "L", 1, "",
-         "Flag to indicate if UBX should be an output protocol on USB"),
-        ("CFG-USBOUTPROT-NMEA", 0x10780002, "L", 1, "",
-         "Flag to indicate if NMEA should be an output protocol on USB"),
-        ("CFG-USBOUTPROT-RTCM3X", 0x10780004, "L", 1, "",
-         "Flag to indicate if RTCM3X should be an output protocol on USB"),
-       )
-
-    def item_to_type(self, item):
-        """Return (size, pack format, i/i/f) for item"""
-
-        # conversion of known types from known key
-        cfg_types = {
-                     "E1": (1, "<B", "u"),
-                     "E2": (2, "<H", "u"),
-                     "E4": (4, "<L", "u"),
-                     "I1": (1, "<b", "i"),
-                     "I2": (2, "<h", "i"),
-                     "I4": (4, "<l", "i"),
-                     "I8": (8, "<q", "i"),
-                     "L": (1, "<B", "u"),
-                     "R4": (4, "<f", "f"),
-                     "R8": (2, "<d", "f"),
-                     "U1": (1, "<B", "u"),
-                     "U2": (2, "<H", "u"),
-                     "U4": (4, "<L", "u"),
-                     "U8": (8, "<Q", "u"),
-                     "X1": (1, "<B", "u"),
-                     "X2": (2, "<H", "u"),
-                     "X4": (4, "<L", "u"),
-                     "X8": (8, "<Q", "u"),
-                     }
-        # guess of known types from unknown key
-        key_map = {0: (1, "<B", "u"),       # illegal
+    # loaded from ubxtool_cfgs on first use
+    cfgs = lazy_table('ubxtool_cfgs', 'cfgs')
+
+    # conversion of known types from known key
+    cfg_types = {
+                 "E1": (1, "<B", "u"),
+                 "E2": (2, "<H", "u"),
+                 "E4": (4, "<L", "u"),
+                 "I1": (1, "<b", "i"),
+                 "I2": (2, "<h", "i"),
+                 "I4": (4, "<l", "i"),
+                 "I8": (8, "<q", "i"),
+                 "L": (1, "<B", "u"),
+                 "R4": (4, "<f", "f"),
+                 "R8": (8, "<d", "f"),
+                 "U1": (1, "<B", "u"),
+                 "U2": (2, "<H", "u"),
+                 "U4": (4, "<L", "u"),
+                 "U8": (8, "<Q", "u"),
+                 "X1": (1, "<B", "u"),
+                 "X2": (2, "<H", "u"),
+                 "X4": (4, "<L", "u"),
+                 "X8": (8, "<Q", "u"),
+                 }
+    # guess of known types from unknown key
+    cfg_key_map = {0: (1, "<B", "u"),       # illegal
                    1: (1, "<B", "u"),       # one bit
                    2: (1, "<B", "u"),       # one byte
                    3: (2, "<H", "u"),       # two byte
@@ -1734,49 +611,77 @@ class ubx(object):
                    6: (1, "<B", "u"),       # illegal
                    7: (1, "<B", "u"),       # illegal
                    }
+    # type guess of unknown key, by key size
+    cfg_key_kmap = {0: "Z0",
+                    1: "L",
+                    2: "U1",
+                    3: "U2",
+                    4: "U4",
+                    5: "U8",
+                    6: "Z6",
+                    7: "Z7",
+                    }
+
+    # indexes of cfgs, built on first lookup by cfg_index()
+    # cfg_names maps name to item, cfg_keys maps key to (item, type)
+    # a few names and keys are duplicated in cfgs, first one wins,
+    # as it did with the linear search
+    cfg_names = None
+    cfg_keys = None
+
+    def cfg_index(self):
+        """Build name and key indexes of cfgs, if not built yet"""
+
+        if ubx.cfg_keys is not None:
+            return
+        names = {}
+        keys = {}
+        for item in self.cfgs:
+            if item[0] not in names:
+                names[item[0]] = item
+            if item[1] not in keys:
+                keys[item[1]] = (item, self.item_to_type(item))
+        ubx.cfg_names = names
+        ubx.cfg_keys = keys
+
+    def item_to_type(self, item):
+        """Return (size, pack format, i/i/f) for item"""
 
-        key = item[1]
         val_type = item[2]
-        if val_type in cfg_types:
-            cfg_type = cfg_types[val_type]
-        else:
-            # unknown? get length correct
-            key_size = (key >> 28) & 0x07
-            cfg_type = key_map[key_size]
+        if val_type in self.cfg_types:
+            return self.cfg_types[val_type]
 
-        return cfg_type
+        # unknown? get length correct
+        key_size = (item[1] >> 28) & 0x07
+        return self.cfg_key_map[key_size]
 
     def cfg_by_key(self, key):
         """Find a config item by key"""
 
-        for item in self.cfgs:
-            if item[1] == key:
-                return item
+        return self.cfg_type_by_key(key)[0]
+
+    def cfg_type_by_key(self, key):
+        """Find a config item by key, return (item, item_to_type(item))"""
+
+        if ubx.cfg_keys is None:
+            self.cfg_index()
+        found = self.cfg_keys.get(key)
+        if found is not None:
+            return found
 
         # not found, build a fake item, guess on decode
         name = "CFG-%u-%u" % ((key >> 16) & 0xff, key & 0xff)
-        kmap = {0: "Z0",
-                1: "L",
-                2: "U1",
-                3: "U2",
-                4: "U4",
-                5: "U8",
-                6: "Z6",
-                7: "Z7",
-                }
         size = (key >> 28) & 0x07
-        item = (name, key, kmap[size], 1, "Unk", "Unknown")
+        item = (name, key, self.cfg_key_kmap[size], 1, "Unk", "Unknown")
 
-        return item
+        return (item, self.item_to_type(item))
 
     def cfg_by_name(self, name):
         """Find a config item by name"""
 
-        for item in self.cfgs:
-            if item[0] == name:
-                return item
-
-        return None
+        if ubx.cfg_names is None:
+            self.cfg_index()
+        return self.cfg_names.get(name)
 
     id_map = {
         0: {"name": "GPS",
@@ -1831,11 +736,13 @@ class ubx(object):
         u = struct.unpack_from('<BB', buf, 0)
         return '  NAK to %s' % self.class_id_s(u[0], u[1])
 
+    ack_layout = ubx_layout('UBX-ACK', '<BB', 'clsID msgID')
+
     # UBX-ACK-
     ack_ids = {0: {'str': 'NAK', 'dec': ack_nak, 'minlen': 2,
-                   'name': 'UBX-ACK-NAK'},
+                   'name': 'UBX-ACK-NAK', 'layout': ack_layout},
                1: {'str': 'ACK', 'dec': ack_ack, 'minlen': 2,
-                   'name': 'UBX-ACK-ACK'}}
+                   'name': 'UBX-ACK-ACK', 'layout': ack_layout}}
 
     # UBX-AID-
     def aid_alm(self, buf):
@@ -2109,7 +1016,7 @@ class ubx(object):
                  "  rotX %.1f rotY %.1f rotZ %.1f scale %.1f" % u)
             if VERB_DECODE <= opts['verbosity']:
                 s += ('\n   datumName (%s)' %
-                      gps.polystr(buf[2:8]).rstrip('\0'))
+                      gps.polystr(bytes(buf[2:8])).rstrip('\0'))
 
         else:
             s = "I'm confused..."
@@ -2213,14 +1120,15 @@ Programming the fixed seed for host interface signature"""
             0x100000: "L2"},
         }
 
+    cfg_gnss_block = struct.Struct('<BBBBL')
+
     def cfg_gnss(self, buf):
         """UBX-CFG-GNSS decode, GNSS system configuration"""
 
         u = struct.unpack_from('<BBBB', buf, 0)
         s = " msgVer %u  numTrkChHw %u numTrkChUse %u numConfigBlocks %u" % u
 
-        for i in range(0, u[3]):
-            u = struct.unpack_from('<BBBBL', buf, 4 + (i * 8))
+        for u in self.blocks(self.cfg_gnss_block, buf, 4, u[3]):
             sat = u[0]
             s += ("\n  gnssId %u TrkCh %2u maxTrCh %2u reserved %u "
                   "Flags x%08x\n" % u)
@@ -3116,9 +2024,9 @@ Save and Load non-volatile storage data"""
         s += ('\n  vendorString %s\n'
               '  productString %s\n'
               '  serialNumber %s' %
-              (gps.polystr(buf[12:43]).rstrip('\0'),
-               gps.polystr(buf[44:75]).rstrip('\0'),
-               gps.polystr(buf[76:107]).rstrip('\0')))
+              (gps.polystr(bytes(buf[12:43])).rstrip('\0'),
+               gps.polystr(bytes(buf[44:75])).rstrip('\0'),
+               gps.polystr(bytes(buf[76:107])).rstrip('\0')))
         return s
 
     cfg_valdel_layers = {
@@ -3198,8 +2106,7 @@ Save and Load non-volatile storage data"""
                 u = struct.unpack_from('<L', buf, i)
                 m_len -= 4
                 i += 4
-                item = self.cfg_by_key(u[0])
-                cfg_type = self.item_to_type(item)
+                item, cfg_type = self.cfg_type_by_key(u[0])
 
                 size = cfg_type[0]
                 frmat = cfg_type[1]
@@ -3230,8 +2137,7 @@ Save and Load non-volatile storage data"""
             u = struct.unpack_from('<L', buf, i)
             m_len -= 4
             i += 4
-            item = self.cfg_by_key(u[0])
-            cfg_type = self.item_to_type(item)
+            item, cfg_type = self.cfg_type_by_key(u[0])
 
             size = cfg_type[0]
             frmat = cfg_type[1]
@@ -3242,6 +2148,144 @@ Save and Load non-volatile storage data"""
             i += size
         return s
 
+    def cfg_values(self, buf):
+        """Return list of (item, value) of a VALGET answer or VALSET payload"""
+
+        values = []
+        i = 4
+        while i + 4 < len(buf):
+            u = struct.unpack_from('<L', buf, i)
+            item, cfg_type = self.cfg_type_by_key(u[0])
+            i += 4
+            if i + cfg_type[0] > len(buf):
+                # truncated
+                break
+            v = struct.unpack_from(cfg_type[1], buf, i)
+            values.append((item, v[0]))
+            i += cfg_type[0]
+        return values
+
+    # VALGET wildcard key, all items of all groups
+    cfg_all_keys = 0x0fffffff
+    # VALGET layers of a snapshot, by number
+    cfg_snapshot_layers = {0: 'RAM', 1: 'BBR', 2: 'Flash', 7: 'Default'}
+    # first bytes of a snapshot file
+    cfg_snapshot_magic = b'UBXCFG1\n'
+
+    def cfg_key_size(self, key):
+        """Return size in bytes of the value of key, from the key itself"""
+
+        return self.cfg_key_map[(key >> 28) & 0x07][0]
+
+    def cfg_raw_values(self, buf):
+        """Return list of (key, value bytes) of a VALGET answer"""
+
+        values = []
+        i = 4
+        while i + 4 < len(buf):
+            key = struct.unpack_from('<L', buf, i)[0]
+            size = self.cfg_key_size(key)
+            i += 4
+            if i + size > len(buf):
+                # truncated
+                break
+            values.append((key, bytes(buf[i:i + size])))
+            i += size
+        return values
+
+    def cfg_raw_s(self, key, raw):
+        """Return string of value bytes raw of key, as its type"""
+
+        if raw is None:
+            return '(none)'
+        cfg_type = self.cfg_type_by_key(key)[1]
+        return str(struct.unpack_from(cfg_type[1],
+                                      raw.ljust(cfg_type[0], b'\0'))[0])
+
+    def write_cfg_snapshot(self, name, snapshot):
+        """Save snapshot, sorted (layer, key, value bytes), to file name
+
+Each item is layer (U1), key (U4), then as many value bytes as the key
+size says, so a file is about 6 bytes per item."""
+
+        with open(name, 'wb') as f:
+            f.write(self.cfg_snapshot_magic)
+            for layer, key, raw in snapshot:
+                f.write(struct.pack('<BL', layer, key) + raw)
+
+    def read_cfg_snapshot(self, name):
+        """Return snapshot, sorted (layer, key, value bytes), of file name
+
+name is a snapshot file, or a u-center configuration file, its [set]
+lines like "Flash CFG-RATE-MEAS 0x3e8".
+Return (snapshot, True if a u-center file)."""
+
+        with open(name, 'rb') as f:
+            buf = f.read()
+        if not buf.startswith(self.cfg_snapshot_magic):
+            return (self.read_cfg_profile(buf), True)
+
+        snapshot = []
+        i = len(self.cfg_snapshot_magic)
+        while i + 5 <= len(buf):
+            layer, key = struct.unpack_from('<BL', buf, i)
+            i += 5
+            size = self.cfg_key_size(key)
+            snapshot.append((layer, key, buf[i:i + size]))
+            i += size
+        return (snapshot, False)
+
+    def read_cfg_profile(self, buf):
+        """Return snapshot of u-center configuration file contents buf"""
+
+        layers = dict((v.upper(), k)
+                      for k, v in self.cfg_snapshot_layers.items())
+        snapshot = {}
+        section = None
+        for line in gps.polystr(buf).splitlines():
+            fields = line.split()
+            if 1 == len(fields) and '[' == fields[0][0]:
+                section = fields[0]
+                continue
+            if '[set]' != section or 3 > len(fields):
+                continue
+            item = self.cfg_by_name(fields[1])
+            if item is None or fields[0].upper() not in layers:
+                raise ValueError('bad config line %s' % line.strip())
+            size = self.cfg_key_size(item[1])
+            raw = struct.pack('<Q', int(fields[2], 16) & 0xffffffffffffffff)
+            # last one wins, as when applied
+            snapshot[(layers[fields[0].upper()], item[1])] = raw[:size]
+        return [(layer, key, raw)
+                for (layer, key), raw in sorted(snapshot.items())]
+
+    def cfg_diff(self, old, new, old_part=False, new_part=False):
+        """Compare sorted snapshots old and new, in one pass
+
+Yield (layer, key, old value bytes, new value bytes) of each item
+that differs, value bytes are None where an item is missing.  Items
+missing in old when old_part, or in new when new_part, are not
+differences, as a u-center file sets only some items."""
+
+        old = iter(old)
+        new = iter(new)
+        a = next(old, None)
+        b = next(new, None)
+        while a is not None or b is not None:
+            if b is None or (a is not None and a[:2] < b[:2]):
+                if not new_part:
+                    yield (a[0], a[1], a[2], None)
+                a = next(old, None)
+            elif a is None or b[:2] < a[:2]:
+                if not old_part:
+                    yield (b[0], b[1], None, b[2])
+                b = next(new, None)
+            else:
+                if a[2] != b[2]:
+                    yield (a[0], a[1], a[2], b[2])
+                a = next(old, None)
+                b = next(new, None)
+
     cfg_ids = {
                # in u-blox 5+
                0x00: {'str': 'PRT', 'dec': cfg_prt, 'minlen': 1,
@@ -3397,23 +2441,23 @@ Save and Load non-volatile storage data"""
 
     def inf_debug(self, buf):
         """UBX-INF-DEBUG decode"""
-        return ' Debug: ' + gps.polystr(buf)
+        return ' Debug: ' + gps.polystr(bytes(buf))
 
     def inf_error(self, buf):
         """UBX-INF-ERROR decode"""
-        return ' Error: ' + gps.polystr(buf)
+        return ' Error: ' + gps.polystr(bytes(buf))
 
     def inf_notice(self, buf):
         """UBX-INF-NOTICE decode"""
-        return ' Notice: ' + gps.polystr(buf)
+        return ' Notice: ' + gps.polystr(bytes(buf))
 
     def inf_test(self, buf):
         """UBX-INF-TET decode"""
-        return ' Test: ' + gps.polystr(buf)
+        return ' Test: ' + gps.polystr(bytes(buf))
 
     def inf_warning(self, buf):
         """UBX-INF-WARNING decode"""
-        return ' Warning: ' + gps.polystr(buf)
+        return ' Warning: ' + gps.polystr(bytes(buf))
 
     inf_ids = {0x0: {'str': 'ERROR', 'dec': inf_error, 'minlen': 0,
                      'name': 'UBX-INF-ERROR'},
@@ -3735,6 +2779,8 @@ Oddly this is the poll for UBX-LOG-BATCH
         255: "None",
         }
 
+    mon_comms_block = struct.Struct('<HHLBBHLBBHHHHHLLL')
+
     def mon_comms(self, buf):
         """UBX-MON-COMMS decode, Comm port information"""
 
@@ -3759,8 +2805,8 @@ Oddly this is the poll for UBX-LOG-BATCH
 
             s += "     txErrors (%s)\n" % (flag_s(u[2], errors))
 
-        for i in range(0, u[1]):
-            u = struct.unpack_from('<HHLBBHLBBHHHHHLLL', buf, (8 + (i * 40)))
+        for i, u in enumerate(self.blocks(self.mon_comms_block, buf, 8,
+                                          u[1])):
             name = "%#x (%s)" % (u[0], index_s(u[0], self.port_ids1))
             if 0 < i:
                 s += "\n"
@@ -3817,6 +2863,11 @@ Oddly this is the poll for UBX-LOG-BATCH
         3: "Critical",
         }
 
+    mon_hw_layout = ubx_layout(
+        'UBX-MON-HW', '<LLLLHHBBBBL17sB2sLLL',
+        'pinSel pinBank pinDir pinVal noisePerMS agcCnt aStatus aPower '
+        'flags reserved1 usedMask VP jamInd reserved2 pinIrq pullH pullL')
+
     def mon_hw(self, buf):
         """UBX-MON-HW decode, Hardware Status"""
 
@@ -3873,7 +2924,7 @@ Oddly this is the poll for UBX-LOG-BATCH
         u = struct.unpack_from('<BBB', buf, 0)
         s = '   version %u nPins %u flags x%x' % u
         nPins = u[1]
-        substr = buf[3:12]
+        substr = bytes(buf[3:12])
         substr = substr.split(gps.polybytes('\0'))[0]
         s += ' hwVersion %s' % gps.polystr(substr)
 
@@ -3956,6 +3007,8 @@ Oddly this is the poll for UBX-LOG-BATCH
         2: "Unk",
         }
 
+    mon_rf_block = struct.Struct('<BBBBLBBBBHHBbBbBBBB')
+
     def mon_rf(self, buf):
         """UBX-MON-RF decode, RF Information"""
 
@@ -3966,8 +3019,7 @@ Oddly this is the poll for UBX-LOG-BATCH
 
         u = struct.unpack_from('<BBBB', buf, 0)
         s = ' version %u nBlocks %u reserved1 %u %u' % u
-        for i in range(0, u[1]):
-            u = struct.unpack_from('<BBBBLBBBBHHBbBbBBBB', buf, 4 + (24 * i))
+        for u in self.blocks(self.mon_rf_block, buf, 4, u[1]):
             s += ("\n   blockId %u flags x%x antStatus %u antPower %u "
                   "postStatus %u reserved2 %u %u %u %u"
                   "\n    noisePerMS %u agcCnt %u jamInd %u ofsI %d magI %u "
@@ -4082,6 +3134,8 @@ Oddly this is the poll for UBX-LOG-BATCH
         # min len = 40 in u-blox 5/6
         # min len = 70 in u-blox 9
         m_len = len(buf)
+        # strings, split() needs bytes
+        buf = bytes(buf)
 
         substr = buf.split(gps.polybytes('\0'))[0]
         substr1 = buf[30:39]
@@ -4110,7 +3164,8 @@ Oddly this is the poll for UBX-LOG-BATCH
                0x08: {'str': 'TXBUF', 'dec': mon_txbuf, 'minlen': 28,
                       'name': 'UBX-MON-TXBUF'},
                0x09: {'str': 'HW', 'dec': mon_hw, 'minlen': 60,
-                      'name': 'UBX-MON-HW'},
+                      'name': 'UBX-MON-HW',
+                      'layout': mon_hw_layout},
                0x0b: {'str': 'HW2', 'dec': mon_hw2, 'minlen': 28,
                       'name': 'UBX-MON-HW2'},
                0x21: {'str': 'RXR', 'dec': mon_rxr, 'minlen': 1,
@@ -4163,6 +3218,8 @@ Oddly this is the poll for UBX-LOG-BATCH
         1: "PR+PRR correction",
         }
 
+    nav_dgps_block = struct.Struct('<BbHff')
+
     def nav_dgps(self, buf):
         """UBX-NAV-DGPS decode, DGPS Data used for NAV"""
 
@@ -4174,8 +3231,7 @@ Oddly this is the poll for UBX-LOG-BATCH
             s += ("\n  status (%s)" %
                   index_s(u[5], self.nav_dgps_status))
 
-        for i in range(0, u[4]):
-            u = struct.unpack_from('<BbHff', buf, 16 + i * 12)
+        for u in self.blocks(self.nav_dgps_block, buf, 16, u[4]):
             s += ('\n  svid %3u flags x%2x ageC %u prc %f prcc %f' % u)
             if VERB_DECODE <= opts['verbosity']:
                 s += ("\n   channel %u dgps %u" %
@@ -4235,6 +3291,11 @@ Oddly this is the poll for UBX-LOG-BATCH
                 '  ecefHP: X %d Y %d Z %d\n'
                 '  reserved2 %u pAcc %u' % u)
 
+    nav_hpposllh_layout = ubx_layout(
+        'UBX-NAV-HPPOSLLH', '<B2sBLllllbbbbLL',
+        'version reserved0 flags iTOW lon lat height hMSL '
+        'lonHp latHp heightHp hMSLHp hAcc vAcc')
+
     def nav_hpposllh(self, buf):
         """UBX-NAV-HPPOSLLH decode, HP Geodetic Position Solution"""
 
@@ -4275,14 +3336,15 @@ Oddly this is the poll for UBX-LOG-BATCH
             2: "Assist now autonomous data",
         }
 
+    nav_orb_block = struct.Struct('<BBBBBB')
+
     def nav_orb(self, buf):
         """UBX-NAV-ORB decode, GNSS Orbit Database Info"""
 
         u = struct.unpack_from('<LBBH', buf, 0)
         s = "  iTOW %u version %u numSv %u reserved1 %u" % u
 
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBBBB', buf, 8 + (i * 6))
+        for u in self.blocks(self.nav_orb_block, buf, 8, u[2]):
             s += ("\n   gnssId %u svId %3u svFlag x%02x eph x%02x alm x%02x "
                   "otherOrb x%x" % u)
             if VERB_DECODE <= opts['verbosity']:
@@ -4376,6 +3438,13 @@ Oddly this is the poll for UBX-LOG-BATCH
         2: "Fixed",
         }
 
+    # protver 15+ layout
+    nav_pvt_layout = ubx_layout(
+        'UBX-NAV-PVT', '<LHBBBBBBLlBBBBllllLLlllllLLHB5slhH',
+        'iTOW year month day hour min sec valid tAcc nano fixType flags '
+        'flags2 numSV lon lat height hMSL hAcc vAcc velN velE velD gSpeed '
+        'headMot sAcc headAcc pDOP flags3 reserved0 headVeh magDec magAcc')
+
     def nav_pvt(self, buf):
         """UBX-NAV-PVT decode, Navigation Position Velocity Time Solution"""
         m_len = len(buf)
@@ -4384,18 +3453,24 @@ Oddly this is the poll for UBX-LOG-BATCH
         # 92 bytes long in protver 15.
 
         # flags2 is protver 27
-        u = struct.unpack_from('<LHBBBBBBLlBBBBllllLLlllllLLHHHH', buf, 0)
+        head = self.nav_pvt_layout.head
+        if head.size > m_len:
+            # protver 14, no headVeh, magDec, magAcc
+            buf = bytes(buf).ljust(head.size, b'\0')
+        u = head.unpack_from(buf, 0)
+        # flags3 and reserved0, shown as reserved1
+        reserved = struct.unpack('<HHH', bytes(u[28:29]) + u[29])
         s = ('  iTOW %u time %u/%u/%u %2u:%2u:%2u valid x%x\n'
              '  tAcc %u nano %d fixType %u flags x%x flags2 x%x\n'
              '  numSV %u lon %d lat %d height %d\n'
              '  hMSL %d hAcc %u vAcc %u\n'
              '  velN %d velE %d velD %d gSpeed %d headMot %d\n'
-             '  sAcc %u headAcc %u pDOP %u reserved1 %u %u %u' % u)
+             '  sAcc %u headAcc %u pDOP %u reserved1 %u %u %u' %
+             (u[:28] + reserved))
 
         if 92 <= m_len:
             # version 15
-            u1 = struct.unpack_from('<lhH', buf, 81)
-            s += ('\n  headVeh %d magDec %d magAcc %u' % u1)
+            s += ('\n  headVeh %d magDec %d magAcc %u' % u[30:33])
 
         if VERB_DECODE <= opts['verbosity']:
             s += ("\n    valid (%s) fixType (%s)"
@@ -4501,14 +3576,17 @@ High Precision GNSS products only."""
         0x400000: "doCorrUsed",
         }
 
+    nav_sat_layout = ubx_layout(
+        'UBX-NAV-SAT', '<LBB2s', 'iTOW version numSvs reserved0',
+        '<BBBbhhL', 'gnssId svId cno elev azim prRes flags', 'numSvs')
+
     def nav_sat(self, buf):
         """UBX-NAV-SAT decode"""
 
         u = struct.unpack_from('<LBBBB', buf, 0)
         s = '  iTOW %u version %u numSvs %u reserved1 %u %u' % u
 
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBbhhL', buf, 8 + (i * 12))
+        for u in self.blocks(self.nav_sat_layout.block, buf, 8, u[2]):
             s += ('\n   gnssId %u svid %3u cno %2u elev %3d azim %3d prRes %6d'
                   ' flags x%x' % u)
             if VERB_DECODE <= opts['verbosity']:
@@ -4545,6 +3623,8 @@ High Precision GNSS products only."""
         8: "Testmode",
         }
 
+    nav_sbas_block = struct.Struct('<BBBBBBhHh')
+
     def nav_sbas(self, buf):
         """UBX-NAV-SBAS decode, SBAS Status Data"""
 
@@ -4562,8 +3642,7 @@ High Precision GNSS products only."""
                    index_s(u[3], self.nav_sbas_sys),
                    flag_s(u[4], self.nav_sbas_service)))
 
-        for i in range(0, u[5]):
-            u = struct.unpack_from('<BBBBBBhHh', buf, 12 + (i * 12))
+        for u in self.blocks(self.nav_sbas_block, buf, 12, u[5]):
             s += ("\n  svid %3d flags x%04x udre x%02x svSys %3d svService %2d"
                   " reserved2 %u"
                   "\n   prc %3d reserved3 %u ic %3d" % u)
@@ -4603,18 +3682,23 @@ High Precision GNSS products only."""
         0x100: "doCorrUsed",
         }
 
+    nav_sig_layout = ubx_layout(
+        'UBX-NAV-SIG', '<LBB2s', 'iTOW version numSigs reserved0',
+        '<BBBBhBBBBH4s',
+        'gnssId svId sigId freqId prRes cno qualityInd corrSource '
+        'ionoModel sigFlags reserved1', 'numSigs')
+
     def nav_sig(self, buf):
         """UBX-NAV-SIG decode, Signal Information"""
 
         u = struct.unpack_from('<LBBH', buf, 0)
         s = '  iTOW %u version %u numSigs %u reserved1 %u' % u
 
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBBhBBBBHL', buf, 8 + (i * 16))
+        for u in self.blocks(self.nav_sig_layout.block, buf, 8, u[2]):
             s += ('\n   gnssId %u svId %u sigId %u freqId %u prRes %d cno %u '
                   'qualityInd %u\n'
                   '    corrSource %u ionoModel %u sigFlags %#x reserved2 %u' %
-                  u)
+                  (u[:10] + (int.from_bytes(u[10], 'little'),)))
 
             if VERB_DECODE <= opts['verbosity']:
                 s += ("\n      (%s) corrSource (%s)"
@@ -4635,6 +3719,8 @@ High Precision GNSS products only."""
         4: "testMode",
         }
 
+    nav_slas_block = struct.Struct('<BBLh')
+
     def nav_slas(self, buf):
         """UBX-NAV-SLAS decode, QZSS L1S SLAS Status Data"""
 
@@ -4643,8 +3729,7 @@ High Precision GNSS products only."""
              '  gmsLon %d gmsLon %d gmsCode %u qzssSvId %u'
              '  serviceFlags x%x cnt %d' % u)
 
-        for i in range(0, u[8]):
-            u = struct.unpack_from('<BBLh', buf, 20 + (i * 8))
+        for u in self.blocks(self.nav_slas_block, buf, 20, u[8]):
             s += '\n   gnssId %u svId %u reserved23 %u prc %d ' % u
 
             if VERB_DECODE <= opts['verbosity']:
@@ -4677,6 +3762,10 @@ High Precision GNSS products only."""
 
         return s
 
+    nav_status_layout = ubx_layout(
+        'UBX-NAV-STATUS', '<LBBBBLL',
+        'iTOW gpsFix flags fixStat flags2 ttff msss')
+
     def nav_status(self, buf):
         """UBX-NAV-STATUS decode"""
 
@@ -4684,6 +3773,11 @@ High Precision GNSS products only."""
         return ('  iTOW:%d ms, fix:%d flags:%#x fixstat:%#x flags2:%#x\n'
                 '  ttff:%d, msss:%d' % u)
 
+    nav_svin_layout = ubx_layout(
+        'UBX-NAV-SVIN', '<B3sLLlllbbbBLLBB2s',
+        'version reserved0 iTOW dur meanX meanY meanZ meanXHP meanYHP '
+        'meanZHP reserved1 meanAcc obs valid active reserved2')
+
     def nav_svin(self, buf):
         """UBX-NAV-SVIN decode, Survey-in data"""
 
@@ -4693,17 +3787,15 @@ High Precision GNSS products only."""
                 '  meanXHP %d meanYHP %d meanZHP %d reserved2 %u meanAcc %u\n'
                 '  obs %u valid %u active %u' % u)
 
+    nav_svinfo_block = struct.Struct('<BBBBBbhl')
+
     def nav_svinfo(self, buf):
         """UBX-NAV-SVINFO decode"""
-        m_len = len(buf)
 
         u = struct.unpack_from('<Lbb', buf, 0)
         s = ' iTOW:%d ms, numCh:%d globalFlags:%d' % u
 
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBBBBbhl', buf, 8 + i * 12)
+        for u in self.blocks(self.nav_svinfo_block, buf, 8):
             s += ('\n  chn %3d svid %3d flags %#0.2x quality %#x cno %2d'
                   ' elev %3d azim %3d prRes %6d' % u)
             if 0 < u[2]:
@@ -4724,8 +3816,6 @@ High Precision GNSS products only."""
                     s += 'orbitAop '
                 if 0x80 & u[2]:
                     s += 'smoothed '
-            m_len -= 12
-            i += 1
 
         return s
 
@@ -4862,7 +3952,8 @@ High Precision GNSS products only."""
                0x02: {'str': 'POSLLH', 'dec': nav_posllh, 'minlen': 20,
                       'name': 'UBX-NAV-POSLLH'},
                0x03: {'str': 'STATUS', 'dec': nav_status, 'minlen': 16,
-                      'name': 'UBX-NAV-STATUS'},
+                      'name': 'UBX-NAV-STATUS',
+                      'layout': nav_status_layout},
                0x04: {'str': 'DOP', 'dec': nav_dop, 'minlen': 18,
                       'name': 'UBX-NAV-DOP'},
                0x05: {'str': 'ATT', 'dec': nav_att, 'minlen': 32,
@@ -4870,7 +3961,8 @@ High Precision GNSS products only."""
                0x06: {'str': 'SOL', 'dec': nav_sol, 'minlen': 52,
                       'name': 'UBX-NAV-SOL'},
                0x07: {'str': 'PVT', 'dec': nav_pvt, 'minlen': 84,
-                      'name': 'UBX-NAV-PVT'},
+                      'name': 'UBX-NAV-PVT',
+                      'layout': nav_pvt_layout},
                0x09: {'str': 'ODO', 'dec': nav_odo, 'minlen': 20,
                       'name': 'UBX-NAV-ODO'},
                0x10: {'str': 'RESETODO', 'dec': nav_resetodo, 'minlen': 0,
@@ -4882,7 +3974,8 @@ High Precision GNSS products only."""
                0x13: {'str': 'HPPOSECEF', 'dec': nav_hpposecef, 'minlen': 28,
                       'name': 'UBX-NAV-HPPOSECEF'},
                0x14: {'str': 'HPPOSLLH', 'dec': nav_hpposllh, 'minlen': 36,
-                      'name': 'UBX-NAV-HPPOSLLH'},
+                      'name': 'UBX-NAV-HPPOSLLH',
+                      'layout': nav_hpposllh_layout},
                0x20: {'str': 'TIMEGPS', 'dec': nav_timegps, 'minlen': 16,
                       'name': 'UBX-NAV-TIMEGPS'},
                0x21: {'str': 'TIMEUTC', 'dec': nav_timeutc, 'minlen': 20,
@@ -4906,11 +3999,13 @@ High Precision GNSS products only."""
                0x34: {'str': 'ORB', 'dec': nav_orb, 'minlen': 8,
                       'name': 'UBX-NAV-ORB'},
                0x35: {'str': 'SAT', 'dec': nav_sat, 'minlen': 8,
-                      'name': 'UBX-NAV-SAT'},
+                      'name': 'UBX-NAV-SAT',
+                      'layout': nav_sat_layout},
                0x39: {'str': 'GEOFENCE', 'dec': nav_geofence, 'minlen': 8,
                       'name': 'UBX-NAV-GEOFENCE'},
                0x3B: {'str': 'SVIN', 'dec': nav_svin, 'minlen': 40,
-                      'name': 'UBX-NAV-SVIN'},
+                      'name': 'UBX-NAV-SVIN',
+                      'layout': nav_svin_layout},
                0x3C: {'str': 'RELPOSNED', 'dec': nav_relposned, 'minlen': 64,
                       'name': 'UBX-NAV-RELPOSNED'},
                # deprecated in u-blox 6, SFDR only
@@ -4919,7 +4014,8 @@ High Precision GNSS products only."""
                0x42: {'str': 'SLAS', 'dec': nav_slas, 'minlen': 20,
                       'name': 'UBX-NAV-SLAS'},
                0x43: {'str': 'SIG', 'dec': nav_sig, 'minlen': 8,
-                      'name': 'UBX-NAV-SIG'},
+                      'name': 'UBX-NAV-SIG',
+                      'layout': nav_sig_layout},
                0x60: {'str': 'AOPSTATUS', 'dec': nav_aopstatus, 'minlen': 16,
                       'name': 'UBX-NAV-AOPSTATUS'},
                0x61: {'str': 'EOE', 'dec': nav_eoe, 'minlen': 4,
@@ -4977,9 +4073,10 @@ High Precision GNSS products only."""
 
         return s
 
+    rxm_measx_block = struct.Struct('<BBBBllHHLBBH')
+
     def rxm_measx(self, buf):
         """UBX-RXM-RAW decode"""
-        m_len = len(buf)
 
         u = struct.unpack_from('<BBBBLLLLLHHHHHBBLL', buf, 0)
         s = (' version %u reserved1 %u %u %u gpsTOW %u gloTOW %u\n'
@@ -4987,33 +4084,24 @@ High Precision GNSS products only."""
              ' gloTOWacc %u bdsTOWacc %u reserved3 %u qzssTOWacc %u\n'
              ' numSV %u flags %#x reserved4 %u %u' % u)
 
-        m_len -= 44
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBBBllHHLBBH', buf, 44 + i * 24)
+        for u in self.blocks(self.rxm_measx_block, buf, 44):
             s += ('\n  gnssId %u svId %u cNo %u mpathIndic %u DopplerMS %d\n'
                   '    dopplerHz %d wholeChips %u fracChips %u codephase %u\n'
                   '    intCodePhase %u pseudoRangeRMSErr %u reserved5 %u' % u)
-            m_len -= 24
-            i += 1
 
         return s
 
+    rxm_raw_block = struct.Struct('<ddfBbbB')
+
     def rxm_raw(self, buf):
         """UBX-RXM-RAW decode"""
-        m_len = len(buf)
 
         u = struct.unpack_from('<lhBB', buf, 0)
         s = ' iTOW %d weeks %d numSV %u res1 %u' % u
 
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<ddfBbbB', buf, 8 + i * 24)
+        for u in self.blocks(self.rxm_raw_block, buf, 8):
             s += ('\n  cpMes %f prMes %f doMes %f sv %d mesQI %d\n'
                   '     eno %d lli %d' % u)
-            m_len -= 24
-            i += 1
 
         return s
 
@@ -5022,32 +4110,42 @@ High Precision GNSS products only."""
         2: "clkReset",
         }
 
+    rxm_rawx_layout = ubx_layout(
+        'UBX-RXM-RAWX', '<dHbBBB2s',
+        'rcvTow week leapS numMeas recStat version reserved0',
+        '<ddfBBBBHBBBBBB',
+        'prMes cpMes doMes gnssId svId sigId freqId locktime cno '
+        'prStdev cpStdev doStdev trkStat reserved1', 'numMeas')
+
+    # last byte, reserved, is not shown
+    rxm_rawx_block_s = 'ddfBBBBHBBBBBx'
+    rxm_rawx_fmt = ('\n  prmes %.3f cpMes %.3f doMes %f\n'
+                    '   gnssId %u svId %u sigId %u freqId %u locktime %u '
+                    'cno %u\n'
+                    '   prStdev %u cpStdev %u doStdev %u trkStat %u')
+
     def rxm_rawx(self, buf):
         """UBX-RXM-RAWX decode"""
-        m_len = len(buf)
 
         # version not here before protver 18, I hope it is zero.
-        u = struct.unpack_from('<dHbBBBBB', buf, 0)
+        u = self.rxm_rawx_layout.head.unpack_from(buf, 0)
         s = (' rcvTow %.3f week %u leapS %d numMeas %u recStat %#x'
              ' version %u\n'
-             ' reserved1[2] %#x %#x\n  recStat (' % u)
+             ' reserved1[2] %#x %#x\n  recStat (' % (u[:6] + tuple(u[6])))
         s += flag_s(u[4], self.rxm_rawx_recs) + ')'
 
-        m_len -= 16
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<ddfBBBBHBBBBB', buf, 16 + i * 32)
-            s += ('\n  prmes %.3f cpMes %.3f doMes %f\n'
-                  '   gnssId %u svId %u sigId %u freqId %u locktime %u '
-                  'cno %u\n'
-                  '   prStdev %u cpStdev %u doStdev %u trkStat %u' % u)
+        if VERB_DECODE >= opts['verbosity']:
+            # the bulk of busy logs, all the blocks at once
+            return s + self.blocks_s(self.rxm_rawx_block_s,
+                                     self.rxm_rawx_fmt, buf, 16)
 
-            if VERB_DECODE < opts['verbosity']:
-                s += '\n      (%s)' % self.gnss_s(u[3], u[4], u[5])
-
-            m_len -= 32
-            i += 1
-        return s
+        # format all the blocks at once, with their gnss_s() appended
+        values = []
+        for u in self.blocks(self.rxm_rawx_layout.block, buf, 16):
+            values.extend(u[:13])
+            values.append(self.gnss_s(u[3], u[4], u[5]))
+        fmt = self.rxm_rawx_fmt + '\n      (%s)'
+        return s + fmt * (len(values) // 14) % tuple(values)
 
     def rxm_rlm(self, buf):
         """UBX-RXM-RLM decode, Galileo SAR RLM report"""
@@ -5432,20 +4530,16 @@ High Precision GNSS products only."""
 
         return s
 
+    rxm_svsi_block = struct.Struct('<BBhbB')
+
     def rxm_svsi(self, buf):
         """UBX-RXM-SVSI decode, SV Status Info"""
-        m_len = len(buf)
 
         u = struct.unpack_from('<LhBB', buf, 0)
         s = ' iTOW %d week %d numVis %d numSV %d' % u
 
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBhbB', buf, 8 + i * 6)
+        for u in self.blocks(self.rxm_svsi_block, buf, 8):
             s += '\n  svid %3d svFlag %#x azim %3d elev % 3d age %3d' % u
-            m_len -= 6
-            i += 1
 
         return s
 
@@ -5458,7 +4552,8 @@ High Precision GNSS products only."""
                0x14: {'str': 'MEASX', 'dec': rxm_measx, 'minlen': 44,
                       'name': 'UBX-RXM-MEASX'},
                0x15: {'str': 'RAWX', 'dec': rxm_rawx, 'minlen': 16,
-                      'name': 'UBX-RXM-RAWX'},
+                      'name': 'UBX-RXM-RAWX',
+                      'layout': rxm_rawx_layout},
                0x20: {'str': 'SVSI', 'dec': rxm_svsi, 'minlen': 8,
                       'name': 'UBX-RXM-SVSI'},
                # deprecated in u-blox 6, 7, raw option only
@@ -5686,8 +4781,98 @@ High Precision GNSS products only."""
 
         return s
 
+    # sync chars of all messages we understand, and leftover line ends
+    sync_re = re.compile(b'[\xb5$\xd3{#\r\n]')
+
     def decode_msg(self, out):
-        """Decode one message and then return number of chars consumed"""
+        """Decode one message and then return number of chars consumed
+
+Finds the next sync point, then slices out the whole frame by its
+length field.  Zero is returned when the frame is not complete yet.
+out is any bytes-like object, bytes, bytearray or memoryview."""
+
+        if VERB_RAW <= opts['verbosity']:
+            # trace every byte, the old slow way
+            return self.decode_msg_bytewise(out)
+
+        match = self.sync_re.search(out)
+        if match is None:
+            # nothing but garbage
+            return len(out)
+        start = match.start()
+        c = out[start]
+        m_len = len(out) - start
+
+        if 0xb5 == c:
+            if 2 > m_len:
+                return start
+            if ord('b') != out[start + 1]:
+                # not UBX after all, skip the mu
+                return start + 1
+            if 6 > m_len:
+                return start
+            m_class = out[start + 2]
+            m_id = out[start + 3]
+            p_len = out[start + 4] | (out[start + 5] << 8)
+            end = start + 8 + p_len
+            if end > len(out):
+                # wait for the rest
+                return start
+
+            chk = self.checksum(out[start + 2:end - 2], p_len + 4)
+            if (chk[0] != out[end - 2]) or (chk[1] != out[end - 1]):
+                sys.stderr.write("%s: ERROR checksum failed,"
+                                 "was (%d,%d) s/b (%d, %d)\n" %
+                                 (PROG_NAME, out[end - 2], out[end - 1],
+                                  chk[0], chk[1]))
+                if self.msg_hook is not None:
+                    # never hand a hook a corrupt frame, a false sync
+                    # may have swallowed real frames, resync past the mu
+                    return start + 1
+            # a slice of out, decoders copy what they keep
+            self.decode_ubx(m_class, m_id, out[start + 6:end - 2])
+            return end
+
+        if 0xd3 == c:
+            # RTCM3
+            if 3 > m_len:
+                return start
+            if 0 != (out[start + 1] & 0xfc):
+                # high 6 bits must be zero
+                return start + 1
+            # 10-bit length, plus header, plus 3 for checksum
+            end = start + 6 + (((out[start + 1] & 0x03) << 8) |
+                               out[start + 2])
+            if end > len(out):
+                return start
+            if VERB_DECODE <= opts['verbosity'] and end - start > 7:
+                ptype = (out[start + 3] << 4) | (out[start + 4] >> 4)
+                print("RTCM3 packet: type %d\n" % ptype)
+            return end
+
+        if c in (ord('\n'), ord('\r')):
+            # CR or LF, leftovers
+            return start + 1
+
+        # NMEA, JSON or comment, up to <CR> or <LF>
+        match = self.sync_re.search(out, start + 1)
+        while match is not None and out[match.start()] not in b'\r\n':
+            match = self.sync_re.search(out, match.start() + 1)
+        if match is None:
+            return start
+        end = match.start()
+        comment = gps.polystr(bytes(out[start:end]))
+        if ord('{') == c and '{"class":"ERROR"' in comment:
+            # always print gpsd errors
+            print(comment)
+        elif VERB_DECODE <= opts['verbosity']:
+            print(comment + '\n' if ord('$') == c else comment)
+        return end + 1
+
+    def decode_msg_bytewise(self, out):
+        """Decode one message and then return number of chars consumed
+
+Byte at a time state machine, slow.  Used to trace input at VERB_RAW."""
 
         state = 'BASE'
         consumed = 0
@@ -5884,47 +5069,11 @@ High Precision GNSS products only."""
                                      "was (%d,%d) s/b (%d, %d)\n" %
                                      (PROG_NAME, m_ck_a, m_ck_b,
                                       chk[0], chk[1]))
+                    if self.msg_hook is not None:
+                        # as decode_msg(), resync past the mu
+                        return consumed - len(m_raw) - 3
 
-                s_payload = ''.join('{:02x} '.format(x) for x in m_payload)
-                x_payload = ','.join(['%02x' % x for x in m_payload])
-
-                if m_class in self.classes:
-                    this_class = self.classes[m_class]
-                    if 'ids' in this_class:
-                        if m_id in this_class['ids']:
-                            # got an entry for this message
-                            # name is mandatory
-                            s_payload = this_class['ids'][m_id]['name']
-                            s_payload += ':\n'
-
-                            if ((('minlen' in this_class['ids'][m_id]) and
-                                 (0 == m_len) and
-                                 (0 != this_class['ids'][m_id]['minlen']))):
-                                s_payload += "  Poll request"
-                            elif (('minlen' in this_class['ids'][m_id]) and
-                                  (this_class['ids'][m_id]['minlen'] >
-                                   m_len)):
-                                # failed minimum length for this message
-                                s_payload += "  Bad Length %s" % m_len
-                            elif 'dec' in this_class['ids'][m_id]:
-                                # got a decoder for this message
-                                dec = this_class['ids'][m_id]['dec']
-                                s_payload += dec(self, m_payload)
-                            else:
-                                s_payload += ("  len %#x, raw %s" %
-                                              (m_len, x_payload))
-
-                if not s_payload:
-                    # huh?
-                    s_payload = ("%s, len %#x, raw %s" %
-                                 (self.class_id_s(m_class, m_id),
-                                  m_len, x_payload))
-
-                if VERB_INFO <= opts['verbosity']:
-                    print("%s, len: %#x" %
-                          (self.class_id_s(m_class, m_id), m_len))
-                    print("payload: %s" % x_payload)
-                print("%s\n" % s_payload)
+                self.decode_ubx(m_class, m_id, m_payload)
                 return consumed
 
             # give up
@@ -5933,18 +5082,180 @@ High Precision GNSS products only."""
         # fell out of loop, no more chars to look at
         return 0
 
+    def decode_ubx(self, m_class, m_id, m_payload):
+        """Decode, and print, a checked UBX message payload"""
+
+        if ((self.msg_hook is not None and
+             self.msg_hook(m_class, m_id, m_payload))):
+            return
+        s_payload = self.msg_text(m_class, m_id, m_payload)
+        if VERB_INFO <= opts['verbosity']:
+            print("%s, len: %#x" %
+                  (self.class_id_s(m_class, m_id), len(m_payload)))
+            print("payload: %s" % self.x_payload(m_payload))
+        print("%s\n" % s_payload)
+
+    def msg_text(self, m_class, m_id, m_payload):
+        """Return a checked UBX message payload decoded as text"""
+
+        m_len = len(m_payload)
+        # hex dumps are slow to build, only make them when needed
+        s_payload = None
+
+        if m_class in self.classes:
+            this_class = self.classes[m_class]
+            if 'ids' in this_class:
+                if m_id in this_class['ids']:
+                    # got an entry for this message
+                    # name is mandatory
+                    s_payload = this_class['ids'][m_id]['name']
+                    s_payload += ':\n'
+
+                    if ((('minlen' in this_class['ids'][m_id]) and
+                         (0 == m_len) and
+                         (0 != this_class['ids'][m_id]['minlen']))):
+                        s_payload += "  Poll request"
+                    elif (('minlen' in this_class['ids'][m_id]) and
+                          (this_class['ids'][m_id]['minlen'] >
+                           m_len)):
+                        # failed minimum length for this message
+                        s_payload += "  Bad Length %s" % m_len
+                    elif 'dec' in this_class['ids'][m_id]:
+                        # got a decoder for this message
+                        dec = this_class['ids'][m_id]['dec']
+                        s_payload += dec(self, m_payload)
+                    else:
+                        s_payload += ("  len %#x, raw %s" %
+                                      (m_len, self.x_payload(m_payload)))
+
+        if s_payload is None:
+            s_payload = ''.join('{:02x} '.format(x) for x in m_payload)
+
+        if not s_payload:
+            # huh?
+            s_payload = ("%s, len %#x, raw %s" %
+                         (self.class_id_s(m_class, m_id),
+                          m_len, self.x_payload(m_payload)))
+        return s_payload
+
+    x_payload_hex = ['%02x' % x for x in range(256)]
+
+    def x_payload(self, m_payload):
+        """Return payload as comma separated hex string"""
+        return ','.join(map(self.x_payload_hex.__getitem__, m_payload))
+
     def checksum(self, msg, m_len):
         """Calculate u-blox message checksum"""
         # the checksum is calculated over the Message, starting and including
         # the CLASS field, up until, but excluding, the Checksum Field:
 
-        ck_a = 0
-        ck_b = 0
-        for c in msg[0:m_len]:
-            ck_a += c
-            ck_b += ck_a
+        # ck_b is the sum of all the running ck_a, let C do the loops,
+        # over a bytes copy, iterating a memoryview is much slower
+        msg = bytes(msg[0:m_len])
+        return [sum(msg) & 0xff, sum(accumulate(msg)) & 0xff]
+
+    def blocks(self, block, buf, start, count=None):
+        """Iterate over repeated blocks of buf, from offset start on
+
+Each block is unpacked by compiled struct.Struct block.  Without count,
+all the whole blocks up to the end of buf."""
+
+        end = len(buf)
+        if count is not None:
+            end = min(end, start + count * block.size)
+        end = max(end - (end - start) % block.size, start)
+        return block.iter_unpack(memoryview(buf)[start:end])
+
+    # (block, fmt, count): struct.Struct of count blocks, fmt * count
+    blocks_s_cache = {}
+
+    def blocks_s(self, block, fmt, buf, start, count=None):
+        """Return repeated blocks of buf, from offset start on, formatted
+
+Same blocks as blocks() iterates, but all of them are unpacked by one
+struct.Struct and formatted by one % operation, both made once per
+count.  block is the struct format of one block, without byte order,
+with pad bytes for the fields fmt does not show."""
+
+        size = struct.calcsize('<' + block)
+        end = len(buf)
+        if count is not None:
+            end = min(end, start + count * size)
+        count = max(end - start, 0) // size
+        key = (block, fmt, count)
+        if key not in self.blocks_s_cache:
+            self.blocks_s_cache[key] = (struct.Struct('<' + block * count),
+                                        fmt * count)
+        blocks, fmts = self.blocks_s_cache[key]
+        return fmts % blocks.unpack_from(buf, start)
+
+    ubx_sync_re = re.compile(b'\xb5\x62')
+
+    def find_sync(self, buf, pos=0):
+        """Return offset of first UBX frame at, or after, pos with a good
+checksum.  -1 if buf holds no such complete frame."""
+
+        while True:
+            match = self.ubx_sync_re.search(buf, pos)
+            if match is None:
+                return -1
+            pos = match.start()
+            end = pos + 8
+            if end <= len(buf):
+                end += buf[pos + 4] | (buf[pos + 5] << 8)
+            if end <= len(buf):
+                chk = self.checksum(buf[pos + 2:end - 2], end - pos - 4)
+                if (chk[0] == buf[end - 2]) and (chk[1] == buf[end - 1]):
+                    return pos
+            pos += 1
+
+    def msg_name(self, m_class, m_id):
+        """Return UBX-CLASS-ID name of a message"""
+
+        try:
+            return self.classes[m_class]['ids'][m_id]['name']
+        except KeyError:
+            return self.class_id_s(m_class, m_id)
+
+    def decode(self, frame):
+        """Decode one whole UBX frame, sync to checksum, into a ubx_record
+
+Unlike decode_msg() nothing is printed, no text is built.
+Raises ValueError if frame is not one good UBX frame."""
+
+        if ((8 > len(frame) or 0xb5 != frame[0] or ord('b') != frame[1] or
+             len(frame) != 8 + (frame[4] | (frame[5] << 8)))):
+            raise ValueError('not a UBX frame')
+        chk = self.checksum(frame[2:-2], len(frame) - 4)
+        if (chk[0] != frame[-2]) or (chk[1] != frame[-1]):
+            raise ValueError('UBX checksum failed')
 
-        return [ck_a & 0xff, ck_b & 0xff]
+        return self.make_record(frame[2], frame[3], bytes(frame[6:-2]))
+
+    def make_record(self, m_class, m_id, payload):
+        """Return ubx_record of a checked message payload"""
+
+        try:
+            layout = self.classes[m_class]['ids'][m_id]['layout']
+        except KeyError:
+            layout = None
+        if layout is not None and layout.head.size > len(payload):
+            layout = None
+        return ubx_record(m_class, m_id, payload, layout)
+
+    def records(self, buf):
+        """Yield ubx_record of every good UBX frame in buf, skip the rest"""
+
+        pos = 0
+        while True:
+            pos = self.find_sync(buf, pos)
+            if 0 > pos:
+                return
+            end = pos + 8 + (buf[pos + 4] | (buf[pos + 5] << 8))
+            # find_sync() already checked it
+            yield self.make_record(buf[pos + 2], buf[pos + 3],
+                                   bytes(buf[pos + 6:end - 2]))
+            pos = end
 
     def make_pkt(self, m_class, m_id, m_data):
         """Make a message packet"""
@@ -6573,59 +5884,94 @@ Always double check with "-p CFG-GNSS".
             m_data.extend(k_data)
         gps_model.gps_send(0x06, 0x8c, m_data)
 
-    def send_cfg_valget(self, keys):
-        """UBX-CFG-VALGET, get config items by key"""
+    def make_cfg_valget(self, keys, layer=0, position=0):
+        """Return UBX-CFG-VALGET poll payload for up to 64 keys"""
         m_data = bytearray(4)
         m_data[0] = 0      # version, 0 = request, 1 = answer
-        m_data[1] = 0      # RAM layer
+        m_data[1] = layer  # 0 = RAM, 1 = BBR, 2 = Flash, 7 = Default
+        struct.pack_into('<H', m_data, 2, position)  # skip this many
         for key in keys:
-            k_data = bytearray(4)
-            k_data[0] = (key) & 0xff
-            k_data[1] = (key >> 8) & 0xff
-            k_data[2] = (key >> 16) & 0xff
-            k_data[3] = (key >> 24) & 0xff
-            m_data.extend(k_data)
-        gps_model.gps_send(0x06, 0x8b, m_data)
+            m_data.extend(struct.pack('<L', key))
+        return m_data
 
-    def send_cfg_valset(self, nvs, layer):
-        """UBX-CFG-VALSET, set config items by key/val pairs"""
+    def send_cfg_valget(self, keys):
+        """UBX-CFG-VALGET, get config items by key"""
+        gps_model.gps_send(0x06, 0x8b, self.make_cfg_valget(keys))
 
+    def cfg_raw_value(self, name, raw):
+        """Return raw, item name bits as an unsigned int, as its type
+
+u-center exports values like that, signed and float ones included."""
+
+        item = self.cfg_by_name(name)
+        if item is None:
+            raise ValueError('unknown config item %s' % name)
+        cfg_type = self.cfg_type_by_key(item[1])[1]
+        bits = struct.pack('<Q', raw & 0xffffffffffffffff)
+        return struct.unpack_from(cfg_type[1], bits)[0]
+
+    def cfg_value(self, name, val):
+        """Return val, a string, converted to the type of item name"""
+
+        item, cfg_type = self.cfg_type_by_key(self.cfg_by_name(name)[1])
+        if 'f' == cfg_type[2]:
+            return float(val)
+        return int(val, 0)
+
+    def make_cfg_valset(self, nvs, layer, transaction=None):
+        """Return UBX-CFG-VALSET payload, nvs are (name, value) pairs
+
+transaction is None for a transactionless VALSET, else the action, one
+of cfg_valxxx_trans."""
 
         m_data = bytearray(4)
         m_data[0] = 0              # version, 0 = request, 1 = transaction
-        m_data[1] = int(layer, 0)  # RAM layer, 1=RAM, 2=BBR, 4=Flash
+        m_data[1] = layer          # RAM layer, 1=RAM, 2=BBR, 4=Flash
+        if transaction is not None:
+            m_data[0] = 1
+            m_data[2] = transaction
+
+        for name, val in nvs:
+            item = self.cfg_by_name(name)
+            if item is None:
+                raise ValueError('unknown config item %s' % name)
+            item, cfg_type = self.cfg_type_by_key(item[1])
+
+            m_data.extend(struct.pack('<L', item[1]))
+            m_data.extend(struct.pack(cfg_type[1], val))
+        return m_data
+
+    def make_cfg_valset_frames(self, nvs, layer, keys=64):
+        """Return list of whole UBX-CFG-VALSET frames setting nvs pairs
+
+Pairs are packed keys per VALSET, in one transaction, applied by the last
+VALSET, when there are more than keys of them."""
+
+        nvs = list(nvs)
+        frames = []
+        for i in range(0, len(nvs), keys):
+            if keys >= len(nvs):
+                transaction = None     # transactionless
+            elif 0 == i:
+                transaction = 1        # (re)start
+            elif len(nvs) <= i + keys:
+                transaction = 3        # apply and end
+            else:
+                transaction = 2        # continue
+            frames.append(self.make_pkt(0x06, 0x8a,
+                self.make_cfg_valset(nvs[i:i + keys], layer, transaction)))
+        return frames
 
+    def send_cfg_valset(self, nvs, layer):
+        """UBX-CFG-VALSET, set config items by key/val pairs"""
+
+        values = []
         for nv in nvs:
-            size = 4
             nv_split = nv.split(',')
             name = nv_split[0]
-            val = nv_split[1]
-
-            item = gps_model.cfg_by_name(name)
-            key = item[1]
-            val_type = item[2]
-
-            cfg_type = self.item_to_type(item)
-
-            size = 4 + cfg_type[0]
-            frmat = cfg_type[1]
-            flavor = cfg_type[2]
-            if 'u' == flavor:
-                val1 = int(val, 0)
-            elif 'i' == flavor:
-                val1 = int(val, 0)
-            elif 'f' == flavor:
-                val1 = float(val)
-
-            kv_data = bytearray(size)
-            kv_data[0] = (key) & 0xff
-            kv_data[1] = (key >> 8) & 0xff
-            kv_data[2] = (key >> 16) & 0xff
-            kv_data[3] = (key >> 24) & 0xff
-
-            struct.pack_into(frmat, kv_data, 4, val1)
-            m_data.extend(kv_data)
-        gps_model.gps_send(0x06, 0x8a, m_data)
+            values.append((name, self.cfg_value(name, nv_split[1])))
+        gps_model.gps_send(0x06, 0x8a,
+                           self.make_cfg_valset(values, int(layer, 0)))
 
     def send_poll(self, m_data):
         """generic send poll request"""
@@ -7049,6 +6395,52 @@ Always double check with "-p CFG-GNSS".
     # end class ubx
 
 
+class read_buffer(object):
+    """Bytes read, waiting to be decoded
+
+    A bytearray with a read cursor.  Decoders see a memoryview from the
+    cursor on, nothing is copied per message.  Consumed bytes are dropped
+    only when they are the bigger half of the buffer, so decoding a long
+    backlog is linear, not quadratic.
+    """
+
+    # not worth compacting less than this
+    compact_min = 64 * 1024
+
+    def __init__(self):
+        self.data = bytearray()
+        self.start = 0
+
+    def __len__(self):
+        return len(self.data) - self.start
+
+    def __bytes__(self):
+        return bytes(self.data[self.start:])
+
+    def extend(self, new_data):
+        """Append new input"""
+        if ((self.compact_min < self.start and
+             len(self.data) <= 2 * self.start)):
+            del self.data[:self.start]
+            self.start = 0
+        self.data += new_data
+
+    def decode(self, decoder):
+        """Pass unread input to decoder, return number of bytes consumed"""
+        view = memoryview(self.data)[self.start:]
+        try:
+            consumed = decoder(view)
+        finally:
+            # the bytearray can not grow while exported
+            view.release()
+        self.start += consumed
+        if self.start == len(self.data):
+            # all gone, cheap to reset
+            del self.data[:]
+            self.start = 0
+        return consumed
+
+
 class gps_io(object):
     """All the GPS I/O in one place"
 
@@ -7058,9 +6450,13 @@ class gps_io(object):
     3. read only from a gpsd instance
     """
 
-    out = b''
+    out = None
     ser = None
     input_is_device = False
+    # bytes to read from a plain file at a time
+    file_window = 64 * 1024
+    # bytes of a plain file to hand to a -j worker at a time
+    job_size = 4 * 1024 * 1024
 
     def __init__(self):
         """Initialize class"""
@@ -7068,7 +6464,7 @@ class gps_io(object):
         Serial = serial
         Serial_v3 = Serial and Serial.VERSION.split('.')[0] >= '3'
         # buffer to hold read data
-        self.out = b''
+        self.out = read_buffer()
 
         # open the input: device, file, or gpsd
         if opts['input_file_name'] is not None:
@@ -7187,24 +6583,14 @@ class gps_io(object):
             ret_code = 0
 
         try:
-            if read_opts['target']['server'] is not None:
-                # gpsd input
-                start = gps.monotonic()
-                while read_opts['input_wait'] > (gps.monotonic() - start):
-                    # First priority is to be sure the input buffer is read.
-                    # This is to prevent input buffer overuns
-                    if 0 < self.ser.waiting():
-                        # We have serial input waiting, get it
-                        # No timeout possible
-                        # RTCM3 JSON can be over 4.4k long, so go big
-                        new_out = self.ser.sock.recv(8192)
-                        if raw is not None:
-                            # save to raw file
-                            raw.write(new_out)
-                        self.out += new_out
-
-                    consumed = gps_model.decode_msg(self.out)
-                    self.out = self.out[consumed:]
+            if ((read_opts['target']['server'] is not None or
+                 self.input_is_device)):
+                # gpsd or serial device input, sleep in select() until
+                # input comes, or the wait is over
+                deadline = gps.monotonic() + read_opts['input_wait']
+                while True:
+                    while 0 < self.out.decode(gps_model.decode_msg):
+                        pass
                     if ((gps_model.expect_statement_identifier and
                          (gps_model.expect_statement_identifier ==
                           gps_model.last_statement_identifier))):
@@ -7214,46 +6600,36 @@ class gps_io(object):
                             # Done
                             break
 
-            elif self.input_is_device:
-                # input is a serial device
-                start = gps.monotonic()
-                while read_opts['input_wait'] > (gps.monotonic() - start):
-                    # First priority is to be sure the input buffer is read.
-                    # This is to prevent input buffer overuns
-                    # pyserial 3.0+ deprecates inWaiting() in favor of
-                    # in_waiting, but inWaiting() is still present.
-                    if 0 < self.ser.inWaiting():
-                        # We have serial input waiting, get it
-                        # 1024 is comfortably large, almost always the
-                        # Read timeout is what causes ser.read() to return
-                        new_out = self.ser.read(1024)
-                        if raw is not None:
-                            # save to raw file
-                            raw.write(new_out)
-                        self.out += new_out
-
-                    consumed = gps_model.decode_msg(self.out)
-                    self.out = self.out[consumed:]
-                    if ((gps_model.expect_statement_identifier and
-                         (gps_model.expect_statement_identifier ==
-                          gps_model.last_statement_identifier))):
-                        # Got what we were waiting for.  Done?
-                        ret_code = 0
-                        if not read_opts['input_forced_wait']:
-                            # Done
-                            break
+                    timeout = deadline - gps.monotonic()
+                    if 0 >= timeout:
+                        break
+                    new_out = self.read_input(timeout)
+                    if new_out is None:
+                        # gpsd closed the connection
+                        break
+                    if raw is not None:
+                        # save to raw file
+                        raw.write(new_out)
+                    self.out.extend(new_out)
+
+            elif 1 < read_opts['jobs']:
+                # ordinary file, decode chunks of it in parallel
+                self.read_jobs(read_opts)
             else:
-                # ordinary file, so all read at once
-                self.out += self.ser.read()
-                if raw is not None:
-                    # save to raw file
-                    raw.write(self.out)
-
+                # ordinary file, read and decode it one window at a time,
+                # so memory use does not grow with the file size
                 while True:
-                    consumed = gps_model.decode_msg(self.out)
-                    self.out = self.out[consumed:]
-                    if 0 >= consumed:
+                    new_out = self.ser.read(self.file_window)
+                    if not new_out:
+                        # EOF
                         break
+                    if raw is not None:
+                        # save to raw file
+                        raw.write(new_out)
+                    self.out.extend(new_out)
+
+                    while 0 < self.out.decode(gps_model.decode_msg):
+                        pass
 
         except IOError:
             # This happens on a good device name, but gpsd already running.
@@ -7272,6 +6648,75 @@ class gps_io(object):
                                 gps_model.expect_statement_identifier))
         return ret_code
 
+    def read_input(self, timeout):
+        """Wait up to timeout seconds for device or gpsd input, return it
+
+Sleeps in select() until input comes.  Returns b'' if none came in
+time, None if gpsd closed the connection."""
+
+        timeout = max(timeout, 0)
+        if opts['target']['server'] is not None:
+            sock = self.ser.sock
+            if not select.select([sock], [], [], timeout)[0]:
+                return b''
+            # RTCM3 JSON can be over 4.4k long, so go big
+            return sock.recv(8192) or None
+
+        if not select.select([self.ser.fileno()], [], [], timeout)[0]:
+            return b''
+        # select() says there is input, read all of it
+        # pyserial 3.0+ deprecates inWaiting() in favor of
+        # in_waiting, but inWaiting() is still present.
+        return self.ser.read(self.ser.inWaiting() or 1)
+
+    def next_sync(self, pos):
+        """Return file offset of the first good UBX frame at, or after, pos.
+None if there is none."""
+
+        self.ser.seek(pos)
+        buf = b''
+        while True:
+            new_out = self.ser.read(self.file_window)
+            if not new_out:
+                return None
+            buf += new_out
+            found = gps_model.find_sync(buf)
+            if 0 <= found:
+                return pos + found
+
+    def read_jobs(self, read_opts):
+        """Decode a plain file in parallel worker processes
+
+The file is split into chunks at UBX frames with good checksums, each
+chunk is decoded by decode_chunk() in a worker, and the text output is
+written in file order."""
+
+        # only -j needs it, and it is slow to import
+        import concurrent.futures  # for ProcessPoolExecutor()
+
+        size = os.fstat(self.ser.fileno()).st_size
+        jobs = read_opts['jobs']
+        chunk = max(min(self.job_size, size // jobs), 1)
+        bounds = [0]
+        while bounds[-1] + chunk < size:
+            pos = self.next_sync(bounds[-1] + chunk)
+            if pos is None:
+                break
+            bounds.append(pos)
+        bounds.append(size)
+
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            # only keep a few chunks of output waiting in memory
+            pending = collections.deque()
+            for start, end in zip(bounds, bounds[1:]):
+                pending.append(executor.submit(decode_chunk,
+                                               read_opts['input_file_name'],
+                                               start, end, read_opts))
+                if 2 * jobs <= len(pending):
+                    sys.stdout.write(pending.popleft().result())
+            while pending:
+                sys.stdout.write(pending.popleft().result())
+
     def write_gpsd(self, data):
         """write data to gpsd daemon"""
 
@@ -7298,8 +6743,357 @@ class gps_io(object):
         return 0
 
 
+def decode_chunk(file_name, start, end, chunk_opts):
+    """Decode bytes start to end of file_name, return the text output
+
+Runs in a worker process of gps_io.read_jobs()"""
+
+    opts.update(chunk_opts)
+    out = read_buffer()
+    text = io.StringIO()
+    with open(file_name, 'rb') as chunk_file, \
+            contextlib.redirect_stdout(text):
+        chunk_file.seek(start)
+        left = end - start
+        while 0 < left:
+            new_out = chunk_file.read(min(left, gps_io.file_window))
+            if not new_out:
+                break
+            left -= len(new_out)
+            out.extend(new_out)
+            while 0 < out.decode(gps_model.decode_msg):
+                pass
+    return text.getvalue()
+
+
+class ubx_session(object):
+    """Persistent session with a u-blox receiver on a serial device
+
+For use as a library.  The port is opened once, then any number of
+VALSET, VALGET and polls are sent, each one waiting for its own ACK/NAK
+or response, not for the fixed -w time:
+
+    with ubxtool.ubx_session('/dev/serial0', 115200) as session:
+        session.valset([('CFG-TMODE-MODE', 1)], layer=7)
+        values = session.valget(['CFG-TMODE-MODE'])
+
+Received messages are printed only at verbosity VERB_DECODE and up."""
+
+    # most keys one UBX-CFG-VALGET poll may ask for
+    valget_keys = 64
+    # most keys one UBX-CFG-VALSET may set
+    valset_keys = 64
+
+    def __init__(self, device, speed=None, timeout=2.0,
+                 verbosity=VERB_QUIET):
+        global io_handle
+
+        opts['input_file_name'] = device
+        if speed is not None:
+            opts['input_speed'] = speed
+        opts['verbosity'] = verbosity
+        # seconds to wait for an answer
+        self.timeout = timeout
+        self.io = gps_io()
+        if not self.io.input_is_device:
+            self.io.ser.close()
+            raise ValueError('%s is not a device' % device)
+        # ubx.gps_send() writes to it
+        io_handle = self.io
+        # awaited message, see wait()
+        self.match = None
+        self.matched = None
+        gps_model.msg_hook = self.msg_hook
+
+    def close(self):
+        """Close the port"""
+
+        gps_model.msg_hook = None
+        self.io.ser.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def msg_hook(self, m_class, m_id, m_payload):
+        """ubx.msg_hook, look for the awaited message"""
+
+        if self.match is not None and self.matched is None:
+            record = gps_model.make_record(m_class, m_id, m_payload)
+            if self.match(record):
+                # m_payload is a view of the input buffer, keep a copy
+                self.matched = gps_model.make_record(m_class, m_id,
+                                                     bytes(m_payload))
+        return VERB_DECODE > opts['verbosity']
+
+    def wait(self, match, timeout=None):
+        """Read input until match(record) is true for a received message
+
+Return that ubx_record, None if timeout seconds passed first."""
+
+        if timeout is None:
+            timeout = self.timeout
+        self.match = match
+        self.matched = None
+        deadline = gps.monotonic() + timeout
+        try:
+            while True:
+                # left overs of the last wait() first
+                while ((self.matched is None and
+                        0 < self.io.out.decode(gps_model.decode_msg))):
+                    pass
+                if self.matched is not None or deadline <= gps.monotonic():
+                    break
+                new_out = self.io.read_input(deadline - gps.monotonic())
+                if raw is not None:
+                    # save to raw file
+                    raw.write(new_out)
+                self.io.out.extend(new_out)
+        finally:
+            self.match = None
+        return self.matched
+
+    @staticmethod
+    def is_ack(record, m_class, m_id):
+        """Return True if record is the ACK or NAK of m_class, m_id"""
+
+        return (0x05 == record.m_class and record.m_id in (0, 1) and
+                record.payload[:2] == bytearray((m_class, m_id)))
+
+    def command(self, m_class, m_id, m_data, timeout=None):
+        """Send a message, and wait for its ACK or NAK
+
+Return True if it was ACKed, False if NAKed or not answered in time."""
+
+        gps_model.gps_send(m_class, m_id, m_data)
+        return self.wait_ack(m_class, m_id, timeout)
+
+    def wait_ack(self, m_class, m_id, timeout=None):
+        """Wait for the next ACK or NAK of m_class, m_id
+
+Return True if it was an ACK, False if a NAK or none came in time."""
+
+        record = self.wait(lambda rec: self.is_ack(rec, m_class, m_id),
+                           timeout)
+        if record is None:
+            sys.stderr.write('%s: no ACK of %s in %0.2f seconds\n' %
+                             (PROG_NAME, gps_model.msg_name(m_class, m_id),
+                              self.timeout if timeout is None else timeout))
+            return False
+        if 0 == record.m_id:
+            sys.stderr.write('%s: %s NAKed\n' %
+                             (PROG_NAME, gps_model.msg_name(m_class, m_id)))
+            return False
+        return True
+
+    def poll(self, m_class, m_id, m_data=b'', timeout=None):
+        """Send a poll request, and wait for the answer
+
+Return ubx_record of the answer, None if NAKed or not answered in time."""
+
+        def match(record):
+            if (m_class, m_id) == (record.m_class, record.m_id):
+                return True
+            return 0 == record.m_id and self.is_ack(record, m_class, m_id)
+
+        gps_model.gps_send(m_class, m_id, m_data)
+        record = self.wait(match, timeout)
+        if record is None or (m_class, m_id) != (record.m_class, record.m_id):
+            return None
+        return record
+
+    def valset(self, nvs, layer=1, timeout=None):
+        """UBX-CFG-VALSET (name, value) pairs, wait for the ACK
+
+Up to 64 pairs go in one transactionless VALSET.  More are sent 64 at a
+time in one transaction, applied by the last VALSET, each one waiting
+for its ACK.  Either way, the receiver applies all or nothing.
+layer is a mask, 1 = RAM, 2 = BBR, 4 = Flash.
+Return True if ACKed, False if NAKed or not answered in time."""
+
+        return self.valset_bulk(nvs, layer, 1, timeout) is not None
+
+    def valset_bulk(self, nvs, layer=1, window=4, timeout=None):
+        """Pipelined UBX-CFG-VALSET of any number of (name, value) pairs
+
+Pairs are packed 64 per VALSET, the most one may carry, in one
+transaction when there are more than 64.  Up to window VALSETs are sent
+before waiting for the ACK of the oldest, so the port is kept busy
+while the receiver works.
+Return list of seconds each VALSET took to be ACKed, None if one was
+NAKed or not answered in time."""
+
+        frames = gps_model.make_cfg_valset_frames(nvs, layer,
+                                                  self.valset_keys)
+        return self.send_pipelined(frames, window, timeout)
+
+    def send_pipelined(self, frames, window=4, timeout=None):
+        """Send whole UBX frames, each one to be ACKed, pipelined
+
+Up to window frames are sent before waiting for the ACK of the oldest.
+Return list of seconds each frame took to be ACKed, None if one was
+NAKed or not answered in time."""
+
+        latency = []
+        # send times of frames waiting for their ACK, oldest first
+        sent = collections.deque()
+        for m_all in list(frames) + [None]:
+            while sent and (m_all is None or window <= len(sent)):
+                m_class, m_id, start = sent.popleft()
+                if not self.wait_ack(m_class, m_id, timeout):
+                    return None
+                latency.append(gps.monotonic() - start)
+            if m_all is not None:
+                gps_model.gps_send_raw(m_all)
+                sent.append((m_all[2], m_all[3], gps.monotonic()))
+        return latency
+
+    def valget(self, names, layer=0, timeout=None):
+        """UBX-CFG-VALGET items by name, 64 per poll
+
+layer is 0 = RAM, 1 = BBR, 2 = Flash, 7 = Default.
+Return dict of item name to value, None if any poll was NAKed or not
+answered in time."""
+
+        keys = []
+        for name in names:
+            item = gps_model.cfg_by_name(name)
+            if item is None:
+                raise ValueError('unknown config item %s' % name)
+            keys.append(item[1])
+
+        values = {}
+
+        def match(record):
+            if ((0x06 == record.m_class and 0x8b == record.m_id and
+                 4 <= len(record.payload) and 1 == record.payload[0])):
+                # the answer, comes before the ACK
+                for item, value in gps_model.cfg_values(record.payload):
+                    values[item[0]] = value
+                return False
+            return self.is_ack(record, 0x06, 0x8b)
+
+        for i in range(0, len(keys), self.valget_keys):
+            m_data = gps_model.make_cfg_valget(keys[i:i + self.valget_keys],
+                                               layer)
+            gps_model.gps_send(0x06, 0x8b, m_data)
+            record = self.wait(match, timeout)
+            if record is None or 0 == record.m_id:
+                return None
+        return values
+
+    def snapshot(self, layers=(0, 1, 2, 7), timeout=None):
+        """Get all config items of layers, by wildcard UBX-CFG-VALGET
+
+Each VALGET gets the next up to 64 items of a layer, one VALGET of
+each layer in flight at a time, so a few dozen round trips dump a
+receiver.  layers are 0 = RAM, 1 = BBR, 2 = Flash, 7 = Default.
+Return sorted list of (layer, key, value bytes), None if a VALGET was
+not answered in time."""
+
+        snapshot = []
+        # items of the oldest VALGET in flight
+        items = []
+        # (layer, position) of VALGETs in flight, oldest first
+        sent = collections.deque()
+
+        def match(record):
+            if ((0x06 == record.m_class and 0x8b == record.m_id and
+                 4 <= len(record.payload) and 1 == record.payload[0])):
+                # the answer, comes before the ACK
+                items.extend(gps_model.cfg_raw_values(record.payload))
+                return False
+            return self.is_ack(record, 0x06, 0x8b)
+
+        def send(layer, position):
+            gps_model.gps_send(0x06, 0x8b, gps_model.make_cfg_valget(
+                [gps_model.cfg_all_keys], layer, position))
+            sent.append((layer, position))
+
+        for layer in layers:
+            send(layer, 0)
+        while sent:
+            del items[:]
+            record = self.wait(match, timeout)
+            if record is None:
+                return None
+            layer, position = sent.popleft()
+            # the receiver answers in order
+            # a NAK, or a short answer, means no more items
+            if 1 == record.m_id:
+                snapshot.extend((layer, key, raw) for key, raw in items)
+                if self.valget_keys <= len(items):
+                    send(layer, position + len(items))
+        snapshot.sort()
+        return snapshot
+
+
 # instantiate the GPS class
 gps_model = ubx()
+# gps_io of the main program, or of ubx_session
+io_handle = None
+# raw log file, -R
+raw = None
+
+
+def cfg_snapshot_main():
+    """Save config snapshot, -D, compare snapshots, -C
+
+Return exit code, 0 if no differences found."""
+
+    names = list(opts['cmp_file'])
+    if opts['snapshot_file'] is not None:
+        if opts['input_file_name'] is None:
+            sys.stderr.write('%s: -D requires a device, -f\n' % PROG_NAME)
+            return 2
+        try:
+            with ubx_session(opts['input_file_name'],
+                             timeout=opts['input_wait'],
+                             verbosity=opts['verbosity']) as session:
+                start = gps.monotonic()
+                snapshot = session.snapshot()
+                elapsed = gps.monotonic() - start
+        except ValueError as err:
+            sys.stderr.write('%s: %s\n' % (PROG_NAME, err))
+            return 2
+        if snapshot is None:
+            sys.stderr.write('%s: config snapshot failed\n' % PROG_NAME)
+            return 2
+        gps_model.write_cfg_snapshot(opts['snapshot_file'], snapshot)
+        if VERB_QUIET < opts['verbosity']:
+            print('%s: %u items saved to %s in %0.2f seconds' %
+                  (PROG_NAME, len(snapshot), opts['snapshot_file'],
+                   elapsed))
+        names.append(opts['snapshot_file'])
+
+    if not opts['cmp_file']:
+        return 0
+    if 2 != len(names):
+        sys.stderr.write('%s: -C requires two files, or -D\n' % PROG_NAME)
+        return 2
+
+    snapshots = []
+    for name in names:
+        try:
+            snapshots.append(gps_model.read_cfg_snapshot(name))
+        except (IOError, ValueError) as err:
+            sys.stderr.write('%s: %s: %s\n' % (PROG_NAME, name, err))
+            return 2
+
+    (old, old_part), (new, new_part) = snapshots
+    exit_code = 0
+    for layer, key, old_raw, new_raw in gps_model.cfg_diff(old, new,
+                                                           old_part,
+                                                           new_part):
+        print('%-7s %s %s -> %s' %
+              (gps_model.cfg_snapshot_layers.get(layer, layer),
+               gps_model.cfg_by_key(key)[0],
+               gps_model.cfg_raw_s(key, old_raw),
+               gps_model.cfg_raw_s(key, new_raw)))
+        exit_code = 1
+    return exit_code
 
 
 def usage():
@@ -7307,7 +7101,11 @@ def usage():
     print('usage: %s [OPTION] ... [[server[:port[:device]]]]\n\n'
           '   Options:\n'
           '       -?            print help, increase -v for extra help\n'
+          '       -C F          compare config snapshot, or u-center\n'
+          '                     file, F with another -C F or -D S\n'
           '       -c C          send raw command C (cls,id...) to GPS\n'
+          '       -D S          save all config layers of GPS to\n'
+          '                     snapshot file S\n'
           '       -d D          disable D\n'
           '       -e E          enable E\n'
           '       -f F          open F as file/device\n'
@@ -7315,6 +7113,7 @@ def usage():
           '       -g I          get config item I\n'
           '       -h            print help, increase -v for extra help\n'
           '       -i P          port (interface ) for UBX-CFG-PRT\n'
+          '       -j J          decode input file with J worker processes\n'
           '       -m M          optional mode to -p P\n'
           '       -P P          Protocol version for sending commands\n'
           '                     default: %s\n'
@@ -7362,291 +7161,309 @@ def usage():
     sys.exit(0)
 
 
-if 'UBXOPTS' in os.environ:
-    # grab the UBXOPTS environment variable for options
-    opts['progopts'] = os.environ['UBXOPTS']
-    options = opts['progopts'].split(' ') + sys.argv[1:]
-else:
-    options = sys.argv[1:]
-
-
-try:
-    (options, arguments) = getopt.getopt(options,
-                                         "?c:d:e:f:g:hi:m:rP:p:"
-                                         "s:w:v:R:S:Vx:z:l:")
-except getopt.GetoptError as err:
-    sys.stderr.write("%s: %s\n"
-                     "Try '%s -h' for more information.\n" %
-                     (PROG_NAME, str(err), PROG_NAME))
-    sys.exit(2)
-
-for (opt, val) in options:
-    if opt == '-c':
-        opts['command'] = val
-    elif opt == '-d':
-        parts = val.split(',')
-        # don't force the user to upper case
-        opts['disable'] = parts[0].upper()
-        if 1 in parts:
-            # optional parameter
-            opts['parm1'] = parts[1]
-    elif opt == '-e':
-        parts = val.split(',')
-        # don't force the user to upper case
-        opts['enable'] = val.upper()
-        if 1 in parts:
-            # optional parameter
-            opts['parm1'] = parts[1]
-    elif opt == '-f':
-        opts['input_file_name'] = val
-    elif opt == '-g':
-        opts['get_item'].append(val)
-    elif opt in ('-h', '-?'):
-        opts['help'] = True
-    elif opt == '-i':
-        valnum = gps_model.port_id_map.get(val.upper())
-        opts['port'] = valnum if valnum is not None else int(val)
-    elif opt == '-m':
-        opts['mode'] = int(val)
-    elif opt == '-P':
-        # to handle vesion like 23.01
-        opts['protver'] = float(val)
-        if 10 > opts['protver']:
-            opts['protver'] = 10
-        if 27 < opts['protver']:
-            opts['protver'] = 27
-    elif opt == '-p':
-        # don't force the user to upper case
-        opts['poll'] = val.upper()
-    elif opt in '-R':
-        # raw log file
-        opts['raw_file'] = val
-    elif opt == '-r':
-        opts['read_only'] = True
-    elif opt in '-S':
-        opts['set_speed'] = int(val)
-        if opts['set_speed'] not in gps_model.speeds:
-            sys.stderr.write('%s: -S invalid speed %s\n' %
-                             (PROG_NAME, opts['set_speed']))
-            sys.exit(1)
-    elif opt == '-s':
-        try:
-            opts['input_speed'] = int(val)
-        except ValueError:
-            sys.stderr.write('%s: -s invalid speed %s\n' %
-                             (PROG_NAME, val))
-            sys.exit(1)
-
-        if opts['input_speed'] not in gps_model.speeds:
-            sys.stderr.write('%s: -s invalid speed %s\n' %
-                             (PROG_NAME, opts['input_speed']))
-            sys.exit(1)
-
-    elif opt == '-V':
-        # version
-        sys.stderr.write('%s: Version %s\n' % (PROG_NAME, gps_version))
-        sys.exit(0)
-    elif opt in '-v':
-        opts['verbosity'] = int(val)
-    elif opt == '-w':
-        try:
-            opts['input_wait'] = float(val)
-        except (ValueError):
-            sys.stderr.write('%s: -w invalid time %s\n' % (PROG_NAME, val))
-            sys.exit(1)
-
-    elif opt == '-x':
-        opts['del_item'].append(val)
-    elif opt == '-z':
-        opts['set_item'].append(val)
-    elif opt == '-l':
-        opts['level'] = val
-
-if opts['help']:
-    usage()
-
-if opts['input_file_name'] is None:
-    # no input file given
-    # default to local gpsd
-    opts['target']['server'] = "localhost"
-    opts['target']['port'] = gps.GPSD_PORT
-    opts['target']['device'] = None
-    if arguments:
-        # TODO: move to module gps as a function
-        # server[:port[:device]]
-        # or maybe ::device
-        # or maybe \[ipv6\][:port[:device]]
-        if '[' == arguments[0][0]:
-            # hex IPv6 address
-            match = re.match(r'''\[([:a-fA-F0-9]+)\](.*)''', arguments[0])
-            opts['target']['server'] = match.group(1)
-            parts = match.group(2).split(':')
-        else:
-            # maybe IPv4 address, maybe hostname
-            parts = arguments[0].split(':')
-            if parts[0]:
-                opts['target']['server'] = parts[0]
-
-        if 1 < len(parts):
-            if parts[1]:
-                opts['target']['port'] = parts[1]
-            if 2 < len(parts) and parts[2]:
-                opts['target']['device'] = parts[2]
-
-elif arguments:
-    sys.stderr.write('%s: Both input file and server specified\n' % PROG_NAME)
-    sys.exit(1)
-
-if VERB_PROG <= opts['verbosity']:
-    # dump versions and all options
-    print('%s: Version %s\n' % (PROG_NAME, gps_version))
-    print('Options:')
-    for option in sorted(opts):
-        print("   %s: %s" % (option, opts[option]))
-
-# done parsing arguments from environment and CLI
+if __name__ == '__main__':
+    if 'UBXOPTS' in os.environ:
+        # grab the UBXOPTS environment variable for options
+        opts['progopts'] = os.environ['UBXOPTS']
+        options = opts['progopts'].split(' ') + sys.argv[1:]
+    else:
+        options = sys.argv[1:]
+
+
+    try:
+        (options, arguments) = getopt.getopt(options,
+                                             "?C:c:D:d:e:f:g:hi:j:m:rP:p:"
+                                             "s:w:v:R:S:Vx:z:l:")
+    except getopt.GetoptError as err:
+        sys.stderr.write("%s: %s\n"
+                         "Try '%s -h' for more information.\n" %
+                         (PROG_NAME, str(err), PROG_NAME))
+        sys.exit(2)
+
+    for (opt, val) in options:
+        if opt == '-C':
+            opts['cmp_file'].append(val)
+        elif opt == '-c':
+            opts['command'] = val
+        elif opt == '-D':
+            opts['snapshot_file'] = val
+        elif opt == '-d':
+            parts = val.split(',')
+            # don't force the user to upper case
+            opts['disable'] = parts[0].upper()
+            if 1 in parts:
+                # optional parameter
+                opts['parm1'] = parts[1]
+        elif opt == '-e':
+            parts = val.split(',')
+            # don't force the user to upper case
+            opts['enable'] = val.upper()
+            if 1 in parts:
+                # optional parameter
+                opts['parm1'] = parts[1]
+        elif opt == '-f':
+            opts['input_file_name'] = val
+        elif opt == '-g':
+            opts['get_item'].append(val)
+        elif opt in ('-h', '-?'):
+            opts['help'] = True
+        elif opt == '-i':
+            valnum = gps_model.port_id_map.get(val.upper())
+            opts['port'] = valnum if valnum is not None else int(val)
+        elif opt == '-j':
+            try:
+                opts['jobs'] = int(val)
+            except ValueError:
+                opts['jobs'] = 0
+            if 1 > opts['jobs']:
+                sys.stderr.write('%s: -j invalid jobs %s\n' %
+                                 (PROG_NAME, val))
+                sys.exit(1)
+        elif opt == '-m':
+            opts['mode'] = int(val)
+        elif opt == '-P':
+            # to handle vesion like 23.01
+            opts['protver'] = float(val)
+            if 10 > opts['protver']:
+                opts['protver'] = 10
+            if 27 < opts['protver']:
+                opts['protver'] = 27
+        elif opt == '-p':
+            # don't force the user to upper case
+            opts['poll'] = val.upper()
+        elif opt in '-R':
+            # raw log file
+            opts['raw_file'] = val
+        elif opt == '-r':
+            opts['read_only'] = True
+        elif opt in '-S':
+            opts['set_speed'] = int(val)
+            if opts['set_speed'] not in gps_model.speeds:
+                sys.stderr.write('%s: -S invalid speed %s\n' %
+                                 (PROG_NAME, opts['set_speed']))
+                sys.exit(1)
+        elif opt == '-s':
+            try:
+                opts['input_speed'] = int(val)
+            except ValueError:
+                sys.stderr.write('%s: -s invalid speed %s\n' %
+                                 (PROG_NAME, val))
+                sys.exit(1)
 
-try:
-    # raw log file requested?
-    raw = None
-    if opts['raw_file']:
-        try:
-            raw = open(opts['raw_file'], 'w')
-        except IOError:
-            sys.stderr.write('%s: failed to open raw file %s\n' %
-                             (PROG_NAME, opts['raw_file']))
-            sys.exit(1)
+            if opts['input_speed'] not in gps_model.speeds:
+                sys.stderr.write('%s: -s invalid speed %s\n' %
+                                 (PROG_NAME, opts['input_speed']))
+                sys.exit(1)
 
-    # create the I/O instance
-    io_handle = gps_io()
+        elif opt == '-V':
+            # version
+            sys.stderr.write('%s: Version %s\n' % (PROG_NAME, gps_version))
+            sys.exit(0)
+        elif opt in '-v':
+            opts['verbosity'] = int(val)
+        elif opt == '-w':
+            try:
+                opts['input_wait'] = float(val)
+            except (ValueError):
+                sys.stderr.write('%s: -w invalid time %s\n' % (PROG_NAME, val))
+                sys.exit(1)
 
-    sys.stdout.flush()
+        elif opt == '-x':
+            opts['del_item'].append(val)
+        elif opt == '-z':
+            opts['set_item'].append(val)
+        elif opt == '-l':
+            opts['level'] = val
+
+    if opts['help']:
+        usage()
+
+    if opts['input_file_name'] is None:
+        # no input file given
+        # default to local gpsd
+        opts['target']['server'] = "localhost"
+        opts['target']['port'] = gps.GPSD_PORT
+        opts['target']['device'] = None
+        if arguments:
+            # TODO: move to module gps as a function
+            # server[:port[:device]]
+            # or maybe ::device
+            # or maybe \[ipv6\][:port[:device]]
+            if '[' == arguments[0][0]:
+                # hex IPv6 address
+                match = re.match(r'''\[([:a-fA-F0-9]+)\](.*)''', arguments[0])
+                opts['target']['server'] = match.group(1)
+                parts = match.group(2).split(':')
+            else:
+                # maybe IPv4 address, maybe hostname
+                parts = arguments[0].split(':')
+                if parts[0]:
+                    opts['target']['server'] = parts[0]
+
+            if 1 < len(parts):
+                if parts[1]:
+                    opts['target']['port'] = parts[1]
+                if 2 < len(parts) and parts[2]:
+                    opts['target']['device'] = parts[2]
+
+    elif arguments:
+        sys.stderr.write('%s: Both input file and server specified\n' %
+                         PROG_NAME)
+        sys.exit(1)
+
+    if VERB_PROG <= opts['verbosity']:
+        # dump versions and all options
+        print('%s: Version %s\n' % (PROG_NAME, gps_version))
+        print('Options:')
+        for option in sorted(opts):
+            print("   %s: %s" % (option, opts[option]))
+
+    # done parsing arguments from environment and CLI
+
+    if opts['snapshot_file'] is not None or opts['cmp_file']:
+        sys.exit(cfg_snapshot_main())
+
+    try:
+        # raw log file requested?
+        raw = None
+        if opts['raw_file']:
+            try:
+                raw = open(opts['raw_file'], 'w')
+            except IOError:
+                sys.stderr.write('%s: failed to open raw file %s\n' %
+                                 (PROG_NAME, opts['raw_file']))
+                sys.exit(1)
 
-    if opts['disable'] is not None:
-        if VERB_QUIET < opts['verbosity']:
-            print('%s: disable %s\n' % (PROG_NAME, opts['disable']))
-        if opts['disable'] in gps_model.able_commands:
-            command = gps_model.able_commands[opts['disable']]
-            command["command"](gps, 0)
-        else:
-            sys.stderr.write('%s: disable %s not found\n' %
-                             (PROG_NAME, opts['disable']))
-            sys.exit(1)
+        # create the I/O instance
+        io_handle = gps_io()
 
-    elif opts['enable'] is not None:
-        if VERB_QUIET < opts['verbosity']:
-            print('%s: enable %s\n' % (PROG_NAME, opts['enable']))
-        if opts['enable'] in gps_model.able_commands:
-            command = gps_model.able_commands[opts['enable']]
-            command["command"](gps, 1)
-        else:
-            sys.stderr.write('%s: enable %s not found\n' %
-                             (PROG_NAME, opts['enable']))
-            sys.exit(1)
+        sys.stdout.flush()
 
-    elif opts['poll'] is not None:
-        if VERB_QUIET < opts['verbosity']:
-            print('%s: poll %s\n' % (PROG_NAME, opts['poll']))
-
-        if 'MODEL' == opts["poll"]:
-            if opts["mode"] is None:
-                opts["mode"] = 0   # default to portable model
-
-        if opts['poll'] in gps_model.commands:
-            command = gps_model.commands[opts['poll']]
-            if (('minVer' in command and
-                 opts['protver'] < command['minVer'])):
-                print('%s: WARNING poll %s requires protVer >= %s '
-                      'you have %s\n' %
-                      (PROG_NAME, opts['poll'], command['minVer'],
-                       opts['protver']))
-
-            if (('maxVer' in command and
-                 opts['protver'] > command['maxVer'])):
-                print('%s: WARNING poll %s requires protVer <= %s '
-                      'you have %s\n' %
-                      (PROG_NAME, opts['poll'], command['maxVer'],
-                       opts['protver']))
-
-            if 'opt' in command:
-                command["command"](gps, command["opt"])
+        if opts['disable'] is not None:
+            if VERB_QUIET < opts['verbosity']:
+                print('%s: disable %s\n' % (PROG_NAME, opts['disable']))
+            if opts['disable'] in gps_model.able_commands:
+                command = gps_model.able_commands[opts['disable']]
+                command["command"](gps, 0)
             else:
-                command["command"](gps)
-        else:
-            sys.stderr.write('%s: poll %s not found\n' %
-                             (PROG_NAME, opts['poll']))
-            sys.exit(1)
-
-    elif opts['set_speed'] is not None:
-        gps_model.send_set_speed(opts['set_speed'])
-
-    elif opts['command'] is not None:
-        cmd_list = opts['command'].split(',')
-        try:
-            cmd_data = [int(v, 16) for v in cmd_list]
-        except ValueError:
-            badarg = True
-        else:
-            data_or = reduce(operator.or_, cmd_data)
-            badarg = data_or != data_or & 0xFF
-        if badarg or len(cmd_list) < 2:
-            sys.stderr.write('%s: Argument format (hex bytes) is'
-                             ' class,id[,payload...]\n' % PROG_NAME)
-            sys.exit(1)
-        payload = bytearray(cmd_data[2:])
-        if VERB_QUIET < opts['verbosity']:
-            print('%s: command %s\n' % (PROG_NAME, opts['command']))
-        gps_model.gps_send(cmd_data[0], cmd_data[1], payload)
+                sys.stderr.write('%s: disable %s not found\n' %
+                                 (PROG_NAME, opts['disable']))
+                sys.exit(1)
 
-    elif opts['del_item']:
-        keys = []
-        for name in opts['del_item']:
-            item = gps_model.cfg_by_name(name)
-            if item:
-                keys.append(item[1])
+        elif opts['enable'] is not None:
+            if VERB_QUIET < opts['verbosity']:
+                print('%s: enable %s\n' % (PROG_NAME, opts['enable']))
+            if opts['enable'] in gps_model.able_commands:
+                command = gps_model.able_commands[opts['enable']]
+                command["command"](gps, 1)
             else:
-                sys.stderr.write('%s: ERROR: item %s unknown\n' %
-                                 (PROG_NAME, opts['del_item']))
-                exit(1)
-        gps_model.send_cfg_valdel(keys)
+                sys.stderr.write('%s: enable %s not found\n' %
+                                 (PROG_NAME, opts['enable']))
+                sys.exit(1)
 
-    elif opts['get_item']:
-        keys = []
-        for name in opts['get_item']:
-            item = gps_model.cfg_by_name(name)
-            if item:
-                keys.append(item[1])
+        elif opts['poll'] is not None:
+            if VERB_QUIET < opts['verbosity']:
+                print('%s: poll %s\n' % (PROG_NAME, opts['poll']))
+
+            if 'MODEL' == opts["poll"]:
+                if opts["mode"] is None:
+                    opts["mode"] = 0   # default to portable model
+
+            if opts['poll'] in gps_model.commands:
+                command = gps_model.commands[opts['poll']]
+                if (('minVer' in command and
+                     opts['protver'] < command['minVer'])):
+                    print('%s: WARNING poll %s requires protVer >= %s '
+                          'you have %s\n' %
+                          (PROG_NAME, opts['poll'], command['minVer'],
+                           opts['protver']))
+
+                if (('maxVer' in command and
+                     opts['protver'] > command['maxVer'])):
+                    print('%s: WARNING poll %s requires protVer <= %s '
+                          'you have %s\n' %
+                          (PROG_NAME, opts['poll'], command['maxVer'],
+                           opts['protver']))
+
+                if 'opt' in command:
+                    command["command"](gps, command["opt"])
+                else:
+                    command["command"](gps)
             else:
-                sys.stderr.write('%s: ERROR: item %s unknown\n' %
-                                 (PROG_NAME, name))
-                exit(1)
-        gps_model.send_cfg_valget(keys)
-
-    elif opts['set_item']:
-        nvs = []
-        for nv in opts['set_item']:
-            (name, val) = nv.split(',')
-            item = gps_model.cfg_by_name(name)
-            if item:
-                nvs.append(nv)
+                sys.stderr.write('%s: poll %s not found\n' %
+                                 (PROG_NAME, opts['poll']))
+                sys.exit(1)
+
+        elif opts['set_speed'] is not None:
+            gps_model.send_set_speed(opts['set_speed'])
+
+        elif opts['command'] is not None:
+            cmd_list = opts['command'].split(',')
+            try:
+                cmd_data = [int(v, 16) for v in cmd_list]
+            except ValueError:
+                badarg = True
             else:
-                sys.stderr.write('%s: ERROR: item %s unknown\n' %
-                                 (PROG_NAME, opts['set_item']))
-                exit(1)
-        gps_model.send_cfg_valset(nvs, opts['level'])
+                data_or = reduce(operator.or_, cmd_data)
+                badarg = data_or != data_or & 0xFF
+            if badarg or len(cmd_list) < 2:
+                sys.stderr.write('%s: Argument format (hex bytes) is'
+                                 ' class,id[,payload...]\n' % PROG_NAME)
+                sys.exit(1)
+            payload = bytearray(cmd_data[2:])
+            if VERB_QUIET < opts['verbosity']:
+                print('%s: command %s\n' % (PROG_NAME, opts['command']))
+            gps_model.gps_send(cmd_data[0], cmd_data[1], payload)
+
+        elif opts['del_item']:
+            keys = []
+            for name in opts['del_item']:
+                item = gps_model.cfg_by_name(name)
+                if item:
+                    keys.append(item[1])
+                else:
+                    sys.stderr.write('%s: ERROR: item %s unknown\n' %
+                                     (PROG_NAME, opts['del_item']))
+                    exit(1)
+            gps_model.send_cfg_valdel(keys)
+
+        elif opts['get_item']:
+            keys = []
+            for name in opts['get_item']:
+                item = gps_model.cfg_by_name(name)
+                if item:
+                    keys.append(item[1])
+                else:
+                    sys.stderr.write('%s: ERROR: item %s unknown\n' %
+                                     (PROG_NAME, name))
+                    exit(1)
+            gps_model.send_cfg_valget(keys)
+
+        elif opts['set_item']:
+            nvs = []
+            for nv in opts['set_item']:
+                (name, val) = nv.split(',')
+                item = gps_model.cfg_by_name(name)
+                if item:
+                    nvs.append(nv)
+                else:
+                    sys.stderr.write('%s: ERROR: item %s unknown\n' %
+                                     (PROG_NAME, opts['set_item']))
+                    exit(1)
+            gps_model.send_cfg_valset(nvs, opts['level'])
 
-    exit_code = io_handle.read(opts)
+        exit_code = io_handle.read(opts)
 
-    if ((VERB_RAW <= opts['verbosity']) and io_handle.out):
-        # dump raw left overs
-        print("Left over data:")
-        print(io_handle.out)
+        if ((VERB_RAW <= opts['verbosity']) and io_handle.out):
+            # dump raw left overs
+            print("Left over data:")
+            print(bytes(io_handle.out))
 
-    sys.stdout.flush()
-    io_handle.ser.close()
+        sys.stdout.flush()
+        io_handle.ser.close()
 
-except KeyboardInterrupt:
-    print('')
-    exit_code = 1
+    except KeyboardInterrupt:
+        print('')
+        exit_code = 1
 
-sys.exit(exit_code)
+    sys.exit(exit_code)
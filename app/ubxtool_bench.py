@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+
+"""
+ubxtool decoding benchmark
+
+Compares legacy byte-at-a-time state machine of ubxtool (ubx.decode_msg_bytewise,
+    with checksum loop as it was implemented originally) against frame-level decoder (ubx.decode_msg)
+    on a UBX log file.
+Also compares feeding the frame decoder by bytes slicing (as gps_io.read did originally)
+    against read_buffer, which gps_io uses now.
+Decoded text goes to /dev/null, only decoding itself is measured.
+With '-r', only peak RSS of 'ubxtool.py -f FILE' is reported (it should not depend on file size).
+With '-j 1 2 4 8', only 'ubxtool.py -f FILE -j J' run times are reported, to show scaling across cores.
+With '-u', only a per message type micro-benchmark is run: unpacking payloads with format strings
+    block by block (as decoders did originally) against compiled struct.Struct with iter_unpack,
+    plus full text and record decoding time per message, and for messages with repeated blocks
+    (RXM-RAWX, NAV-SAT, NAV-SIG) columns extraction with and without NumPy.
+With '-k', only config items lookup is measured: encoding VALSET messages (64 keys each) and decoding
+    VALGET response for every config item ubxtool knows (a full F9P configuration dump),
+    with linear search of config items (as ubxtool did originally) against indexes.
+With '-s', only cold start time of a VALSET ('ubxtool.py -z ...', read-only, so no receiver is needed)
+    is measured, both as a script and as 'python -m ubxtool', which runs compiled module from __pycache__.
+With '-w SECONDS', only CPU time and context switches (wake-ups) of 'ubxtool.py -w SECONDS' reading a serial
+    device are reported: a pseudo-terminal, silent and then fed with NAV-PVT + NMEA at 10 Hz.
+If no log is at hand, generate a synthetic one with '-g SECONDS' (10 Hz PVT + RAWX + SAT + SIG + NMEA).
+"""
+
+import os
+import pty
+import struct
+import sys
+import tty
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from hashlib import sha1
+from io import StringIO
+from pathlib import Path
+from random import Random
+from subprocess import DEVNULL, Popen
+from tempfile import NamedTemporaryFile
+from threading import Event, Thread
+from timeit import timeit
+from time import perf_counter
+
+import ubxtool
+
+UBX = ubxtool.gps_model
+
+
+def make_pvt(rand: Random, itow: int) -> bytes:
+    # Random.randbytes() is Python 3.9+
+    payload = bytearray(rand.getrandbits(92 * 8).to_bytes(92, 'little'))
+    struct.pack_into('<L', payload, 0, itow)
+    return UBX.make_pkt(0x01, 0x07, payload)
+
+
+def make_rawx(rand: Random, tow: float, count: int) -> bytes:
+    payload = bytearray(struct.pack('<dHbBBBBB', tow, 2150, 18, count, 1, 1, 0, 0))
+    for _ in range(count):
+        payload += struct.pack('<ddfBBBBHBBBBBB', rand.uniform(2e7, 2.6e7), rand.uniform(-1e8, 1e8),
+                               rand.uniform(-5e3, 5e3), rand.choice((0, 2, 3, 6)), rand.randint(1, 36),
+                               rand.randint(0, 1), 0, rand.randint(0, 64500), rand.randint(20, 50),
+                               rand.randint(0, 15), rand.randint(0, 15), rand.randint(0, 15), 0x0f, 0)
+    return UBX.make_pkt(0x02, 0x15, payload)
+
+
+def make_sat(rand: Random, itow: int, count: int) -> bytes:
+    payload = bytearray(struct.pack('<LBBBB', itow, 1, count, 0, 0))
+    for _ in range(count):
+        payload += struct.pack('<BBBbhhL', rand.choice((0, 2, 3, 6)), rand.randint(1, 36), rand.randint(20, 50),
+                               rand.randint(-90, 90), rand.randint(0, 359), rand.randint(-500, 500),
+                               rand.getrandbits(24))
+    return UBX.make_pkt(0x01, 0x35, payload)
+
+
+def make_sig(rand: Random, itow: int, count: int) -> bytes:
+    payload = bytearray(struct.pack('<LBBH', itow, 0, count, 0))
+    for _ in range(count):
+        payload += struct.pack('<BBBBhBBBBHL', rand.choice((0, 2, 3, 6)), rand.randint(1, 36), rand.randint(0, 6),
+                               0, rand.randint(-500, 500), rand.randint(20, 50), 7, 0, 0, 0x29, 0)
+    return UBX.make_pkt(0x01, 0x43, payload)
+
+
+def generate(file: Path, seconds: float, rate: int = 10, seed: int = 0):
+    """Write synthetic UBX log: NAV-PVT + RXM-RAWX every epoch, NAV-SAT, NAV-SIG and NMEA GGA once a second"""
+    rand = Random(seed)
+    with file.open('wb') as out:
+        for epoch in range(int(seconds * rate)):
+            itow = epoch * 1000 // rate
+            out.write(make_pvt(rand, itow))
+            out.write(make_rawx(rand, itow / 1000, rand.randint(28, 40)))
+            if epoch % rate == 0:
+                out.write(make_sat(rand, itow, rand.randint(20, 30)))
+                out.write(make_sig(rand, itow, rand.randint(30, 50)))
+                out.write(b'$GNGGA,120000.00,5530.00000,N,03730.00000,E,1,12,0.60,150.0,M,14.0,M,,*4F\r\n')
+
+
+def legacy_checksum(msg, m_len):
+    """Checksum loop as it was implemented in ubxtool originally"""
+    ck_a = 0
+    ck_b = 0
+    for c in msg[0:m_len]:
+        ck_a += c
+        ck_b += ck_a
+    return [ck_a & 0xff, ck_b & 0xff]
+
+
+def decode(method, data: bytes):
+    """Feed the whole log to decoder method with no buffer overhead at all"""
+    view = memoryview(data)
+    pos = 0
+    while True:
+        consumed = method(view[pos:])
+        if 0 >= consumed:
+            return
+        pos += consumed
+
+
+def decode_sliced(method, data: bytes):
+    """Feed the whole log to decoder method the way gps_io.read did originally"""
+    out = b''
+    out += data
+    while True:
+        consumed = method(out)
+        out = out[consumed:]
+        if 0 >= consumed:
+            return
+
+
+def decode_buffered(method, data: bytes):
+    """Feed the whole log to decoder method the way gps_io.read does"""
+    out = ubxtool.read_buffer()
+    out.extend(data)
+    while 0 < out.decode(method):
+        pass
+
+
+def measure(name: str, method, data: bytes, check: bool = False, feed=decode) -> float:
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        start = perf_counter()
+        feed(method, data)
+        elapsed = perf_counter() - start
+    digest = ''
+    if check:
+        with redirect_stdout(StringIO()) as text:
+            feed(method, data)
+        digest = f", output sha1 {sha1(text.getvalue().encode()).hexdigest()[:12]}"
+    print(f"{name:>9}: {len(data)} bytes in {elapsed:.3f} s ({len(data) / elapsed / 1e6:.2f} MB/s){digest}")
+    return elapsed
+
+
+def unpack_legacy(layout, payload):
+    """Unpack payload by its layout the way decoders did originally: format strings, block by block"""
+    head = struct.unpack_from(layout.head.format, payload, 0)
+    if layout.block is None:
+        return head, ()
+    fmt, size = layout.block.format, layout.block.size
+    count = (len(payload) - layout.head.size) // size
+    return head, [struct.unpack_from(fmt, payload, layout.head.size + i * size) for i in range(count)]
+
+
+def unpack_compiled(layout, payload):
+    """Unpack payload by its layout with compiled structs and iter_unpack"""
+    head = layout.head.unpack_from(payload, 0)
+    if layout.block is None:
+        return head, ()
+    return head, list(UBX.blocks(layout.block, payload, layout.head.size))
+
+
+def micro(data: bytes, repeat: int = 3):
+    """Time unpacking and decoding of every message type found in data, per message"""
+    payloads = {}
+    for record in UBX.records(data):
+        payloads.setdefault((record.m_class, record.m_id), []).append(record.payload)
+    for (m_class, m_id), group in sorted(payloads.items()):
+        name = UBX.msg_name(m_class, m_id)
+        layout = UBX.classes[m_class]['ids'].get(m_id, {}).get('layout')
+        times = {}
+        if layout is not None:
+            for kind, unpack in (('legacy', unpack_legacy), ('compiled', unpack_compiled)):
+                times[kind] = min(timeit(lambda: [unpack(layout, p) for p in group], number=1)
+                                  for _ in range(repeat))
+        times['text'] = min(timeit(lambda: [UBX.msg_text(m_class, m_id, p) for p in group], number=1)
+                            for _ in range(repeat))
+        times['record'] = min(timeit(lambda: [UBX.make_record(m_class, m_id, p).blocks for p in group], number=1)
+                              for _ in range(repeat))
+        if layout is not None and layout.block is not None:
+            records = [UBX.make_record(m_class, m_id, p) for p in group]
+            numpy = ubxtool.load_numpy()
+            for kind, module in (('columns', None), ('numpy', numpy)):
+                if kind == 'numpy' and numpy is None:
+                    continue
+                ubxtool.numpy = module
+                times[kind] = min(timeit(lambda: [r.columns() for r in records], number=1)
+                                  for _ in range(repeat))
+            ubxtool.numpy = numpy
+        line = ', '.join(f"{kind} {elapsed / len(group) * 1e6:.1f}" for kind, elapsed in times.items())
+        if layout is not None:
+            line += f" us/msg, unpack speedup x{times['legacy'] / times['compiled']:.1f}"
+        else:
+            line += " us/msg"
+        print(f"{name:>16} ({len(group)} msgs, avg {sum(map(len, group)) // len(group)} bytes): {line}")
+
+
+def legacy_item_to_type(item):
+    """Item type lookup as it was implemented in ubxtool originally: tables are built on every call"""
+    cfg_types = dict(UBX.cfg_types)
+    key_map = dict(UBX.cfg_key_map)
+    if item[2] in cfg_types:
+        return cfg_types[item[2]]
+    return key_map[(item[1] >> 28) & 0x07]
+
+
+def legacy_cfg_by_name(name):
+    """Linear search of config item by name, as ubxtool did originally"""
+    for item in UBX.cfgs:
+        if item[0] == name:
+            return item
+    return None
+
+
+def legacy_cfg_type_by_key(key):
+    """Linear search of config item by key, as ubxtool did originally"""
+    for item in UBX.cfgs:
+        if item[1] == key:
+            return item, legacy_item_to_type(item)
+    name = 'CFG-%u-%u' % ((key >> 16) & 0xff, key & 0xff)
+    item = (name, key, UBX.cfg_key_kmap[(key >> 28) & 0x07], 1, 'Unk', 'Unknown')
+    return item, legacy_item_to_type(item)
+
+
+def config_dump(repeat: int = 5):
+    """Time encoding and decoding of a full configuration dump, with legacy linear search and with indexes"""
+    sent = []
+    UBX.gps_send = lambda m_class, m_id, m_data: sent.append(bytes(m_data))
+    items = [f'{item[0]},1' for item in UBX.cfgs]
+    batches = [items[i:i + 64] for i in range(0, len(items), 64)]
+    response = bytearray(b'\x01\x00\x00\x00')
+    for item in UBX.cfgs:
+        cfg_type = UBX.item_to_type(item)
+        response += struct.pack('<L', item[1]) + struct.pack(cfg_type[1], 1)
+
+    def encode():
+        sent.clear()
+        for batch in batches:
+            UBX.send_cfg_valset(batch, '1')
+        return b''.join(sent)
+
+    def decode():
+        return UBX.cfg_valget(response)
+
+    times = {}
+    outputs = {}
+    for kind in ('legacy', 'indexed'):
+        if kind == 'legacy':
+            UBX.cfg_by_name = legacy_cfg_by_name
+            UBX.cfg_type_by_key = legacy_cfg_type_by_key
+            UBX.item_to_type = legacy_item_to_type
+        else:
+            del UBX.cfg_by_name, UBX.cfg_type_by_key, UBX.item_to_type
+        for name, method in (('encode', encode), ('decode', decode)):
+            outputs[kind, name] = method()
+            times[kind, name] = min(timeit(method, number=1) for _ in range(repeat))
+    del UBX.gps_send
+
+    for name, size in (('encode', len(outputs['indexed', 'encode'])), ('decode', len(response))):
+        if outputs['legacy', name] != outputs['indexed', name]:
+            print(f"{name}: outputs differ!")
+        legacy, indexed = times['legacy', name], times['indexed', name]
+        print(f"{name:>8}: {len(items)} items ({size} bytes) legacy {legacy * 1e3:.2f} ms, "
+              f"indexed {indexed * 1e3:.2f} ms, speedup x{legacy / indexed:.1f}")
+
+
+def run_ubxtool(file, verbosity: int, *args: str):
+    """Run ubxtool on file in a child process, return its wall clock time and resource usage"""
+    start = perf_counter()
+    process = Popen([sys.executable, Path(ubxtool.__file__).name, '-f', str(file), '-v', str(verbosity), *args],
+                    cwd=Path(ubxtool.__file__).parent, stdout=DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    return perf_counter() - start, usage
+
+
+def serial_wait(seconds: float):
+    """Run ubxtool on a pseudo-terminal for a -w wait, report its CPU time and context switches"""
+    master, slave = pty.openpty()
+    tty.setraw(master)
+    for name, rate in (('silent', 0), ('10 Hz', 10)):
+        stop = Event()
+
+        def feed():
+            rand = Random(0)
+            while not stop.wait(1 / rate):
+                os.write(master, make_pvt(rand, 0) + b'$GNGGA,120000.00,,,,,0,00,99.99,,,,,,*56\r\n')
+
+        feeder = Thread(target=feed, daemon=True)
+        if rate:
+            feeder.start()
+        elapsed, usage = run_ubxtool(os.ttyname(slave), ubxtool.VERB_QUIET, '-w', str(seconds))
+        stop.set()
+        print(f"{name:>8}: {elapsed:.1f} s run, CPU {usage.ru_utime + usage.ru_stime:.2f} s "
+              f"({(usage.ru_utime + usage.ru_stime) / elapsed:.0%}), {usage.ru_nvcsw} voluntary "
+              f"and {usage.ru_nivcsw} involuntary context switches")
+        if rate:
+            feeder.join()
+    os.close(master)
+    os.close(slave)
+
+
+def cold_start(repeat: int = 10):
+    """Time fresh interpreter running 'ubxtool.py -z' (read-only, on an empty input file)"""
+    with NamedTemporaryFile(suffix='.ubx') as empty:
+        valset = ['-f', empty.name, '-r', '-w', '0', '-z', 'CFG-NAVSPG-DYNMODEL,2']
+        for name, command in (('script', [Path(ubxtool.__file__).name]), ('module', ['-m', 'ubxtool'])):
+            times = []
+            for _ in range(repeat):
+                start = perf_counter()
+                if Popen([sys.executable, *command, *valset], cwd=Path(ubxtool.__file__).parent,
+                         stdout=DEVNULL).wait():
+                    raise RuntimeError(f"ubxtool {' '.join(command + valset)} failed")
+                times.append(perf_counter() - start)
+            print(f"{name:>8}: VALSET cold start {min(times) * 1e3:.0f} ms (best of {repeat}), "
+                  f"{sorted(times)[repeat // 2] * 1e3:.0f} ms (median)")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='ubxtool decoding benchmark')
+    parser.add_argument('file', type=Path, help="UBX log file")
+    parser.add_argument('-g', '--generate', type=float, metavar='SECONDS',
+                        help="generate synthetic 10 Hz UBX log of specified duration first")
+    parser.add_argument('-v', '--verbosity', type=int, default=ubxtool.VERB_DECODE,
+                        help="ubxtool verbosity to decode with (default: %(default)s)")
+    parser.add_argument('-c', '--check', action='store_true', help="compare decoded output of both decoders")
+    parser.add_argument('-r', '--rss', action='store_true', help="only measure peak RSS of ubxtool decoding the file")
+    parser.add_argument('-u', '--micro', action='store_true', help="only run per message type micro-benchmark")
+    parser.add_argument('-k', '--keys', action='store_true',
+                        help="only measure config items lookup on a full configuration dump")
+    parser.add_argument('-s', '--startup', action='store_true', help="only measure ubxtool VALSET cold start time")
+    parser.add_argument('-w', '--wait', type=float, metavar='SECONDS',
+                        help="only measure CPU use of ubxtool waiting on a serial device for SECONDS")
+    parser.add_argument('-j', '--jobs', type=int, nargs='+', metavar='J',
+                        help="only measure ubxtool decoding the file with J worker processes")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.file, args.generate)
+        print(f"Generated {args.file} ({os.path.getsize(args.file)} bytes)")
+
+    if args.keys:
+        config_dump()
+        sys.exit(0)
+
+    if args.startup:
+        cold_start()
+        sys.exit(0)
+
+    if args.wait:
+        serial_wait(args.wait)
+        sys.exit(0)
+
+    if args.rss:
+        _, usage = run_ubxtool(args.file, args.verbosity)
+        print(f"ubxtool.py peak RSS: {usage.ru_maxrss / 1024:.1f} MB "
+              f"decoding {os.path.getsize(args.file) / 1e6:.1f} MB file")
+        sys.exit(0)
+
+    if args.jobs:
+        print(f"{os.cpu_count()} CPUs, {os.path.getsize(args.file) / 1e6:.1f} MB file")
+        first = None
+        for jobs in args.jobs:
+            elapsed, _ = run_ubxtool(args.file, args.verbosity, '-j', str(jobs))
+            first = first or elapsed
+            print(f"{jobs:>3} workers: {elapsed:.2f} s ({os.path.getsize(args.file) / elapsed / 1e6:.2f} MB/s), "
+                  f"x{first / elapsed:.2f} against {args.jobs[0]}")
+        sys.exit(0)
+
+    ubxtool.opts['verbosity'] = args.verbosity
+    data = args.file.read_bytes()
+    if args.micro:
+        micro(data)
+        sys.exit(0)
+
+    UBX.checksum = legacy_checksum
+    bytewise = measure('bytewise', UBX.decode_msg_bytewise, data, args.check)
+    del UBX.checksum
+    frames = measure('frames', UBX.decode_msg, data, args.check)
+    print(f"Speedup: x{bytewise / frames:.1f}")
+    sliced = measure('sliced', UBX.decode_msg, data, args.check, decode_sliced)
+    buffered = measure('buffered', UBX.decode_msg, data, args.check, decode_buffered)
+    print(f"Buffer speedup: x{sliced / buffered:.1f}")
@@ -40,6 +40,10 @@ sudo apt-get -y install python3-pip
 # Install pySerial package
 pip3 install pyserial
 
+# Install crcmod package with its C extension (rtcm_proxy validates CRC-24Q of every RTCM frame,
+#   pure-Python fallback is several times slower than forwarding frames unchecked)
+sudo apt-get -y install python3-crcmod
+
 # Reassign 'python' symlink to 'python3'
 cd /usr/bin
 sudo rm python
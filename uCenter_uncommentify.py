@@ -1,3 +1,10 @@
+"""
+Strip trailing comments from u-center config export and align its columns (interactive, desktop side)
+
+Cleaning is cosmetic: app/ubx_file_config_ubxtool.py reads commented exports as well
+    and compiles them to cached VALSET frames itself, so there is no need to run this before applying a profile
+"""
+
 from sys import argv
 from pathlib import Path
 
@@ -24,6 +31,7 @@ if __name__ == '__main__':
                 )
         parwidth += 1
 
+        count = 0
         for i, line in enumerate(lines):
             if line and hashchar in line and not line.startswith(hashchar):
                 payload = line.split(hashchar)[0].strip()
@@ -31,10 +39,11 @@ if __name__ == '__main__':
                 output = target.rjust(5) + ' ' + name.ljust(parwidth) + value
                 print(output)
                 lines[i] = output + '\n'
+                count += 1
 
         newname = path.stem + footer + path.suffix
 
-        print(f"\nUncommented {i} lines")
+        print(f"\nUncommented {count} lines")
         input(f"Enter - write to file '{newname}'")
 
         path.with_name(newname).write_text(''.join(lines))